@@ -1,4 +1,5 @@
 from adapters.accounts_file_adapter import AccountsFileAdapter
+from adapters.async_pluggy_banking_adapter import AsyncPluggyBankingAdapter
 from adapters.pluggy_banking_adapter import PluggyBankingAdapter
 from adapters.rules_data_adapter import RulesDataAdapter
 from adapters.transactions_data_adapter import TransactionsDataAdapter
@@ -8,4 +9,5 @@ __all__ = [
     "RulesDataAdapter",
     "TransactionsDataAdapter",
     "PluggyBankingAdapter",
+    "AsyncPluggyBankingAdapter",
 ]
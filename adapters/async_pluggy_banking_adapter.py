@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from adapters.pluggy_banking_adapter import PluggyBankingAdapter
+from pluggy_async import (
+    fetch_account_balances_async,
+    fetch_credit_card_info_async,
+    fetch_investments_async,
+    sync_all_async,
+)
+
+T = TypeVar("T")
+
+
+def _run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion from synchronous code such as a Streamlit callback."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    # Already inside an event loop: run ours on a helper thread instead of nesting.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+class AsyncPluggyBankingAdapter(PluggyBankingAdapter):
+    """PluggyBankingAdapter backed by the asyncio client; the sync methods are a facade over it.
+
+    Shares the API-key cache of the pooled HTTP client, so switching between the
+    two does not trigger a new authentication. Blocking writes (cache files,
+    MongoDB) run in worker threads so they never stall the event loop.
+    """
+
+    async def sync_all_async(
+        self,
+        date_from: str,
+        date_to: str,
+        categorize: Callable[[str], str | None],
+    ) -> list[dict]:
+        settings = await asyncio.to_thread(self._current_settings)
+        return await sync_all_async(
+            settings,
+            date_from,
+            date_to,
+            categorize,
+            api_keys=self._client.api_keys,
+        )
+
+    async def fetch_credit_card_info_async(self) -> list[dict]:
+        settings = await asyncio.to_thread(self._current_settings)
+        result = await fetch_credit_card_info_async(settings, api_keys=self._client.api_keys)
+        if self._cache:
+            await asyncio.to_thread(self._cache.save_bills, result)
+        return result
+
+    async def fetch_account_balances_async(self) -> list[dict]:
+        settings = await asyncio.to_thread(self._current_settings)
+        result = await fetch_account_balances_async(settings, api_keys=self._client.api_keys)
+        if self._cache:
+            await asyncio.to_thread(self._cache.save_balances, result)
+        return result
+
+    async def fetch_investments_async(self) -> list[dict]:
+        settings = await asyncio.to_thread(self._current_settings)
+        result = await fetch_investments_async(settings, api_keys=self._client.api_keys)
+        if self._cache:
+            await asyncio.to_thread(self._cache.save_investments, result)
+        return result
+
+    def sync_all(
+        self,
+        date_from: str,
+        date_to: str,
+        categorize: Callable[[str], str | None],
+    ) -> list[dict]:
+        return _run_sync(self.sync_all_async(date_from, date_to, categorize))
+
+    def fetch_credit_card_info(self) -> list[dict]:
+        return _run_sync(self.fetch_credit_card_info_async())
+
+    def fetch_account_balances(self) -> list[dict]:
+        return _run_sync(self.fetch_account_balances_async())
+
+    def fetch_investments(self) -> list[dict]:
+        return _run_sync(self.fetch_investments_async())
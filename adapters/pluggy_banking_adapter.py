@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import replace
 from typing import TYPE_CHECKING
 
 from core.settings import PluggySettings, load_pluggy_settings
 from pluggy_integration import (
+    PluggyHttpClient,
     fetch_account_balances,
     fetch_credit_card_info,
     fetch_investments,
+    get_http_client,
     load_balances_cache,
     load_bills_cache,
     load_investments_cache,
@@ -15,6 +18,7 @@ from pluggy_integration import (
 )
 
 if TYPE_CHECKING:
+    from ports.accounts_port import AccountsPort
     from repositories.mongo_cache_repository import MongoCacheRepository
 
 
@@ -23,9 +27,31 @@ class PluggyBankingAdapter:
         self,
         settings: PluggySettings | None = None,
         cache_repository: MongoCacheRepository | None = None,
+        client: PluggyHttpClient | None = None,
+        accounts: AccountsPort | None = None,
     ):
         self._settings = settings or load_pluggy_settings()
         self._cache = cache_repository
+        self._client = client or get_http_client(self._settings, key_store=cache_repository)
+        self._accounts = accounts
+
+    def _current_settings(self) -> PluggySettings:
+        """Settings with the item map read from the accounts store on every call.
+
+        The adapter lives as long as the cached services, so accounts added or
+        removed in the sidebar must not depend on the map frozen at startup.
+        An empty store falls back to the configured map (legacy env variables).
+        """
+        if self._accounts is None:
+            return self._settings
+        item_map = {
+            conta["pluggy_item_id"]: conta["nome"]
+            for conta in self._accounts.list_accounts()
+            if conta.get("pluggy_item_id") and conta.get("nome")
+        }
+        if not item_map:
+            return self._settings
+        return replace(self._settings, item_map=item_map)
 
     def sync_all(
         self,
@@ -37,23 +63,24 @@ class PluggyBankingAdapter:
             date_from=date_from,
             date_to=date_to,
             categorize=categorize,
-            settings=self._settings,
+            settings=self._current_settings(),
+            client=self._client,
         )
 
     def fetch_credit_card_info(self) -> list[dict]:
-        result = fetch_credit_card_info(settings=self._settings)
+        result = fetch_credit_card_info(settings=self._current_settings(), client=self._client)
         if self._cache:
             self._cache.save_bills(result)
         return result
 
     def fetch_account_balances(self) -> list[dict]:
-        result = fetch_account_balances(settings=self._settings)
+        result = fetch_account_balances(settings=self._current_settings(), client=self._client)
         if self._cache:
             self._cache.save_balances(result)
         return result
 
     def fetch_investments(self) -> list[dict]:
-        result = fetch_investments(settings=self._settings)
+        result = fetch_investments(settings=self._current_settings(), client=self._client)
         if self._cache:
             self._cache.save_investments(result)
         return result
@@ -74,4 +101,4 @@ class PluggyBankingAdapter:
         return load_investments_cache(cache_file=self._settings.investments_cache_file)
 
     def get_fontes(self) -> list[str]:
-        return self._settings.get_configured_fontes()
+        return self._current_settings().get_configured_fontes()
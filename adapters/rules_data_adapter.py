@@ -27,13 +27,29 @@ class RulesDataAdapter:
     def load_rules(self) -> dict:
         return self._config_repository.load_rules()
 
+    def get_rules_version(self) -> str:
+        return self._config_repository.get_rule_matcher().fingerprint
+
     def add_rule(self, keyword: str, category: str) -> dict:
         return self._config_repository.add_rule(keyword, category)
 
     def remove_rule(self, keyword: str) -> dict:
         return self._config_repository.remove_rule(keyword)
 
-    def reclassify_all(self, df: pd.DataFrame) -> pd.DataFrame:
+    def add_rule_and_reclassify(
+        self,
+        df: pd.DataFrame,
+        keyword: str,
+        category: str,
+    ) -> tuple[pd.DataFrame, int]:
+        diff = self._config_repository.set_rule(keyword, category)
+        return self._transactions_repository.reclassify_rules_change(df, diff)
+
+    def remove_rule_and_reclassify(self, df: pd.DataFrame, keyword: str) -> tuple[pd.DataFrame, int]:
+        diff = self._config_repository.delete_rule(keyword)
+        return self._transactions_repository.reclassify_rules_change(df, diff)
+
+    def reclassify_all(self, df: pd.DataFrame) -> tuple[pd.DataFrame, int]:
         return self._transactions_repository.reclassify_all(df)
 
     def classify(self, description: str, rules: dict | None = None) -> str | None:
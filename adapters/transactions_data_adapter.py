@@ -3,6 +3,7 @@ from datetime import date
 import pandas as pd
 
 from core.constants import DATA_FILE, RULES_FILE
+from core.models import TransactionFilter
 from repositories import ConfigRepository, TransactionsRepository
 
 
@@ -35,6 +36,9 @@ class TransactionsDataAdapter:
     def get_daily_expenses(self, df: pd.DataFrame) -> pd.DataFrame:
         return self._transactions_repository.get_daily_expenses(df)
 
+    def aggregate_summary_by_category(self, filters: TransactionFilter) -> pd.DataFrame:
+        return self._transactions_repository.aggregate_summary_by_category(filters)
+
     def add_synced_transactions(
         self,
         df: pd.DataFrame,
@@ -62,8 +66,14 @@ class TransactionsDataAdapter:
             fonte=source,
         )
 
-    def delete_manual_transaction(self, df: pd.DataFrame, index: int) -> pd.DataFrame:
-        return self._transactions_repository.delete_transaction(df, index)
+    def update_transaction(self, df: pd.DataFrame, tx_id: str, fields: dict) -> pd.DataFrame:
+        return self._transactions_repository.update_transaction(df, tx_id, fields)
+
+    def delete_transactions(self, df: pd.DataFrame, tx_ids: list[str]) -> pd.DataFrame:
+        return self._transactions_repository.delete_transactions(df, tx_ids)
 
     def save_dataframe(self, df: pd.DataFrame) -> None:
         self._transactions_repository.save_data(df)
+
+    def save_categories(self, df: pd.DataFrame, rows: pd.Series) -> None:
+        self._transactions_repository.update_categories(df, rows)
@@ -1,4 +1,4 @@
-from application import build_services, initialize_session_dataframe
+from application import get_services, initialize_session_dataframe
 from core import fmt_brl
 from presentation import configure_page, inject_styles, render_theme_switch
 from presentation.main_screen import render_main_screen
@@ -9,7 +9,7 @@ def main() -> None:
     render_theme_switch()
     inject_styles()
 
-    finance_service, bills_service, accounts_adapter = build_services()
+    finance_service, bills_service, accounts_adapter = get_services()
     df = initialize_session_dataframe(finance_service)
     render_main_screen(
         finance_service=finance_service,
@@ -1,3 +1,3 @@
-from application.bootstrap import build_services, initialize_session_dataframe
+from application.bootstrap import build_services, get_services, initialize_session_dataframe
 
-__all__ = ["build_services", "initialize_session_dataframe"]
+__all__ = ["build_services", "get_services", "initialize_session_dataframe"]
@@ -4,18 +4,30 @@ import os
 
 import streamlit as st
 
-from adapters import AccountsFileAdapter, PluggyBankingAdapter, RulesDataAdapter, TransactionsDataAdapter
+from adapters import (
+    AccountsFileAdapter,
+    AsyncPluggyBankingAdapter,
+    PluggyBankingAdapter,
+    RulesDataAdapter,
+    TransactionsDataAdapter,
+)
 from core.constants import (
     ACCOUNTS_FILE,
     BALANCES_CACHE_FILE,
     BILLS_CACHE_FILE,
+    CLASSIFICATION_CACHE_FILE,
     DATA_FILE,
     INVESTMENTS_CACHE_FILE,
     RULES_FILE,
 )
-from core.settings import load_mongo_settings
+from core.settings import (
+    load_mongo_settings,
+    load_pluggy_settings,
+    load_reclassify_settings,
+    load_storage_settings,
+)
 from ports.accounts_port import AccountsPort
-from repositories import ConfigRepository, TransactionsRepository
+from repositories import ClassificationCacheRepository, ConfigRepository, TransactionsRepository
 from services import BillsService, FinanceService
 
 logger = logging.getLogger(__name__)
@@ -74,22 +86,15 @@ def _seed_mongo_transactions_from_csv(mongo_txn_repo, csv_path: str) -> None:
     if not os.path.exists(csv_path):
         return
 
-    import pandas as pd
-
     # Only seed if MongoDB has no transactions
     if mongo_txn_repo._col.count_documents({}, limit=1) > 0:
         return
 
-    from core.constants import TRANSACTION_COLUMNS
-
     try:
-        df = pd.read_csv(csv_path, encoding="utf-8")
+        # Read-only: pending journal entries are included, the CSV is left untouched.
+        df, _ = TransactionsRepository(csv_path, ConfigRepository(RULES_FILE))._read_current()
         if df.empty:
             return
-        for col in TRANSACTION_COLUMNS:
-            if col not in df.columns:
-                df[col] = None
-        df["Data"] = pd.to_datetime(df["Data"])
         mongo_txn_repo.save_data(df)
         logger.info("Seeded %d transactions from %s into MongoDB", len(df), csv_path)
     except Exception as exc:
@@ -151,6 +156,10 @@ def _check_mongo_connection(client, database_name: str) -> None:
 
 def build_services() -> tuple[FinanceService, BillsService, AccountsPort]:
     mongo_settings = load_mongo_settings()
+    reclassify_settings = load_reclassify_settings()
+    storage_settings = load_storage_settings()
+    pluggy_settings = load_pluggy_settings()
+    banking_adapter_class = AsyncPluggyBankingAdapter if pluggy_settings.async_client else PluggyBankingAdapter
 
     if mongo_settings.is_configured:
         from adapters.accounts_mongo_adapter import AccountsMongoAdapter
@@ -164,7 +173,7 @@ def build_services() -> tuple[FinanceService, BillsService, AccountsPort]:
 
         config_repository = MongoConfigRepository(db)
         _seed_mongo_config_from_json(config_repository, RULES_FILE)
-        transactions_repository = MongoTransactionsRepository(db, config_repository)
+        transactions_repository = MongoTransactionsRepository(db, config_repository, reclassify_settings)
         _seed_mongo_transactions_from_csv(transactions_repository, DATA_FILE)
 
         cache_repository = MongoCacheRepository(db)
@@ -173,12 +182,34 @@ def build_services() -> tuple[FinanceService, BillsService, AccountsPort]:
         accounts_adapter: AccountsPort = AccountsMongoAdapter(db)
         _seed_mongo_accounts(accounts_adapter, ACCOUNTS_FILE)
 
-        banking_adapter = PluggyBankingAdapter(cache_repository=cache_repository)
+        banking_adapter = banking_adapter_class(
+            pluggy_settings,
+            cache_repository=cache_repository,
+            accounts=accounts_adapter,
+        )
+        classification_cache = cache_repository
     else:
         config_repository = ConfigRepository(RULES_FILE)
-        transactions_repository = TransactionsRepository(DATA_FILE, config_repository)
+        if storage_settings.uses_parquet:
+            from repositories.parquet_transactions_repository import ParquetTransactionsRepository
+
+            transactions_repository = ParquetTransactionsRepository(
+                storage_settings.parquet_file,
+                config_repository,
+                reclassify_settings,
+                legacy_csv_file=DATA_FILE,
+                journal_compact_after=storage_settings.journal_compact_after,
+            )
+        else:
+            transactions_repository = TransactionsRepository(
+                DATA_FILE,
+                config_repository,
+                reclassify_settings,
+                journal_compact_after=storage_settings.journal_compact_after,
+            )
         accounts_adapter = AccountsFileAdapter()
-        banking_adapter = PluggyBankingAdapter()
+        banking_adapter = banking_adapter_class(pluggy_settings, accounts=accounts_adapter)
+        classification_cache = ClassificationCacheRepository(CLASSIFICATION_CACHE_FILE)
 
     rules_adapter = RulesDataAdapter(
         config_repository=config_repository,
@@ -193,12 +224,26 @@ def build_services() -> tuple[FinanceService, BillsService, AccountsPort]:
             transactions=transactions_adapter,
             rules=rules_adapter,
             banking=banking_adapter,
+            classification_cache=classification_cache,
         ),
         BillsService(banking=banking_adapter),
         accounts_adapter,
     )
 
 
+@st.cache_resource(show_spinner=False)
+def get_services() -> tuple[FinanceService, BillsService, AccountsPort]:
+    """Process-wide services, shared by every rerun and session.
+
+    ``build_services`` connects to MongoDB, seeds it and ensures indexes, so it
+    runs once per process instead of on every interaction. Nothing per-session
+    lives in them: the banking adapter reads the accounts store on each call and
+    the repositories lock their save snapshots. Failures are not
+    cached: the next rerun retries. ``get_services.clear()`` forces a rebuild.
+    """
+    return build_services()
+
+
 def initialize_session_dataframe(finance_service: FinanceService):
     if "df" not in st.session_state:
         st.session_state.df = finance_service.load_dataframe()
@@ -0,0 +1,75 @@
+"""Compare the vectorized cross-bank dedup against the previous iterrows loop.
+
+Usage: PYTHONPATH=. python benchmarks/bench_deduplication.py [rows ...]
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from core.constants import CROSS_BANK_CATEGORIES
+from domain.deduplication import deduplicate_cross_bank_transactions
+
+DEFAULT_SIZES = (100_000, 1_000_000)
+
+
+def legacy_deduplicate(df: pd.DataFrame, categories: set[str]) -> pd.DataFrame:
+    if df.empty:
+        return df
+
+    result = df.copy()
+    result["_date_str"] = result["Data"].dt.strftime("%Y-%m-%d")
+    result["_abs_val"] = result["Valor"].abs()
+
+    to_drop = []
+    seen: set[tuple[str, float]] = set()
+    for idx, row in result.iterrows():
+        if row["Categoria"] not in categories:
+            continue
+        key = (str(row["_date_str"]), float(row["_abs_val"]))
+        if key in seen:
+            to_drop.append(idx)
+        else:
+            seen.add(key)
+
+    if to_drop:
+        result = result.drop(index=to_drop).reset_index(drop=True)
+    return result.drop(columns=["_date_str", "_abs_val"])
+
+
+def make_frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    categories = sorted(CROSS_BANK_CATEGORIES) + ["Alimentação", "Transporte", "Supermercado"]
+    return pd.DataFrame(
+        {
+            "Data": pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 730, rows), unit="D"),
+            "Descrição": "Transação",
+            "Valor": rng.integers(-50_000, 50_000, rows) / 100,
+            "Categoria": rng.choice(categories, rows),
+            "Fonte": rng.choice(["Nubank", "Santander", "Cartão Crédito"], rows),
+        }
+    )
+
+
+def _timed(func, *args) -> tuple[float, pd.DataFrame]:
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main(sizes: tuple[int, ...]) -> None:
+    for rows in sizes:
+        df = make_frame(rows)
+        new_time, new = _timed(deduplicate_cross_bank_transactions, df, CROSS_BANK_CATEGORIES)
+        old_time, old = _timed(legacy_deduplicate, df, CROSS_BANK_CATEGORIES)
+        pd.testing.assert_frame_equal(new, old)
+        print(
+            f"{rows:>10,} rows  iterrows {old_time:8.3f}s  vectorized {new_time:8.3f}s  "
+            f"speedup {old_time / new_time:6.1f}x  kept {len(new):,}"
+        )
+
+
+if __name__ == "__main__":
+    main(tuple(int(arg) for arg in sys.argv[1:]) or DEFAULT_SIZES)
@@ -0,0 +1,135 @@
+"""Compare wall-clock Pluggy sync time (sequential, thread pool, asyncio) as the item count grows.
+
+Runs against a local mock API that adds a fixed latency to every request.
+
+Usage: PYTHONPATH=. python benchmarks/bench_pluggy_sync.py [items ...]
+"""
+
+import asyncio
+import json
+import logging
+import sys
+import threading
+import time
+from dataclasses import replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from core.settings import PluggySettings
+from pluggy_async import sync_all_async
+from pluggy_integration import ApiKeyCache, PluggyHttpClient, sync_all
+
+DEFAULT_ITEMS = (1, 2, 5, 10, 20)
+LATENCY = 0.05
+TRANSACTIONS_PER_ACCOUNT = 120
+SERVER_PAGE_SIZE = 50
+WORKERS = 8
+DATE_FROM, DATE_TO = "2026-01-01", "2026-01-31"
+
+
+class MockPluggyHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    wbufsize = -1
+
+    def log_message(self, *args) -> None:
+        return None
+
+    def _reply(self, status: int, body: dict) -> None:
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _handle(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        time.sleep(LATENCY)
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        if url.path == "/auth":
+            self._reply(200, {"apiKey": "bench"})
+        elif url.path.startswith("/items/"):
+            self._reply(400, {"codeDescription": "SANDBOX_CLIENT_ITEM_UPDATE_NOT_ALLOWED"})
+        elif url.path == "/accounts":
+            item = query["itemId"]
+            self._reply(
+                200,
+                {
+                    "results": [
+                        {"id": f"{item}-checking", "type": "BANK", "name": "Conta"},
+                        {"id": f"{item}-credit", "type": "CREDIT", "name": "Cartão"},
+                    ]
+                },
+            )
+        elif url.path == "/transactions":
+            page = int(query.get("page", 1))
+            start = (page - 1) * SERVER_PAGE_SIZE
+            results = [
+                {"id": f"{query['accountId']}-{i}", "amount": -1.0 - i, "description": f"Compra {i}", "date": DATE_FROM}
+                for i in range(start, min(start + SERVER_PAGE_SIZE, TRANSACTIONS_PER_ACCOUNT))
+            ]
+            total_pages = -(-TRANSACTIONS_PER_ACCOUNT // SERVER_PAGE_SIZE)
+            self._reply(200, {"results": results, "total": TRANSACTIONS_PER_ACCOUNT, "totalPages": total_pages})
+        else:
+            self._reply(404, {"message": "not found"})
+
+    do_GET = do_POST = do_PATCH = _handle
+
+
+def _settings(base_url: str, items: int, max_workers: int) -> PluggySettings:
+    settings = PluggySettings(
+        base_url=base_url,
+        client_id="bench",
+        client_secret="bench",
+        item_map={f"item-{i}": f"Banco {i}" for i in range(items)},
+        bills_cache_file="",
+        balances_cache_file="",
+        investments_cache_file="",
+    )
+    return replace(settings, max_workers=max_workers)
+
+
+def _timed(func) -> tuple[float, list]:
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main(item_counts: tuple[int, ...]) -> None:
+    logging.disable(logging.WARNING)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockPluggyHandler)
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    host, port = server.server_address[:2]
+    base_url = f"http://{host}:{port}"
+    categorize = lambda _description: "Outros"  # noqa: E731
+
+    try:
+        for items in item_counts:
+            sequential_settings = _settings(base_url, items, 1)
+            concurrent_settings = _settings(base_url, items, WORKERS)
+            seq_time, sequential = _timed(
+                lambda: sync_all(DATE_FROM, DATE_TO, categorize, sequential_settings, PluggyHttpClient())
+            )
+            thread_time, threaded = _timed(
+                lambda: sync_all(DATE_FROM, DATE_TO, categorize, concurrent_settings, PluggyHttpClient())
+            )
+            async_time, concurrent = _timed(
+                lambda: asyncio.run(
+                    sync_all_async(concurrent_settings, DATE_FROM, DATE_TO, categorize, ApiKeyCache())
+                )
+            )
+            assert sequential == threaded == concurrent
+            print(
+                f"{items:>4} items  sequential {seq_time:7.2f}s  threads({WORKERS}) {thread_time:7.2f}s  "
+                f"asyncio({WORKERS}) {async_time:7.2f}s  transactions {len(sequential):,}"
+            )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main(tuple(int(arg) for arg in sys.argv[1:]) or DEFAULT_ITEMS)
@@ -0,0 +1,62 @@
+"""Compare load/save times of the CSV and Parquet transaction repositories.
+
+Usage: PYTHONPATH=. python benchmarks/bench_transactions_storage.py [rows ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from repositories.config_repository import ConfigRepository
+from repositories.parquet_transactions_repository import ParquetTransactionsRepository
+from repositories.transactions_repository import TransactionsRepository
+
+DEFAULT_SIZES = (100_000, 1_000_000)
+
+
+def make_frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    merchants = np.array([f"Compra Loja {i}" for i in range(5_000)], dtype=object)
+    values = rng.integers(-50_000, 50_000, rows) / 100
+    return pd.DataFrame(
+        {
+            "Data": pd.Timestamp("2020-01-01") + pd.to_timedelta(rng.integers(0, 2_000, rows), unit="D"),
+            "Descrição": rng.choice(merchants, rows),
+            "Valor": values,
+            "Tipo": np.where(values >= 0, "Entrada", "Saída"),
+            "Categoria": rng.choice(["Alimentação", "Transporte", "Moradia", "Lazer", "Outros"], rows),
+            "Fonte": rng.choice(["Nubank", "Santander", "Cartão Crédito Nubank"], rows),
+            "pluggy_id": [f"tx-{i}" for i in range(rows)],
+            "categoria_manual": False,
+        }
+    )
+
+
+def _timed(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main(sizes: tuple[int, ...]) -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config = ConfigRepository(os.path.join(tmpdir, "regras.json"))
+        repositories = {
+            "csv": TransactionsRepository(os.path.join(tmpdir, "dados.csv"), config),
+            "parquet": ParquetTransactionsRepository(os.path.join(tmpdir, "dados.parquet"), config),
+        }
+        for rows in sizes:
+            df = make_frame(rows)
+            for name, repository in repositories.items():
+                save_time = _timed(repository.save_data, df.copy())
+                load_time = _timed(repository.load_data)
+                size_mb = os.path.getsize(repository._data_file) / 1e6
+                print(f"{rows:>10,} rows  {name:<8} save {save_time:7.3f}s  load {load_time:7.3f}s  {size_mb:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main(tuple(int(arg) for arg in sys.argv[1:]) or DEFAULT_SIZES)
@@ -9,8 +9,17 @@ from core.constants import (
     TRANSACTION_COLUMNS,
 )
 from core.formatting import fmt_brl
-from core.models import FinanceKpis, SidebarState
-from core.settings import MongoSettings, PluggySettings, load_mongo_settings, load_pluggy_settings
+from core.models import ClassificationCacheStats, FinanceKpis, SidebarState, TransactionFilter
+from core.settings import (
+    MongoSettings,
+    PluggySettings,
+    ReclassifySettings,
+    StorageSettings,
+    load_mongo_settings,
+    load_pluggy_settings,
+    load_reclassify_settings,
+    load_storage_settings,
+)
 
 __all__ = [
     "DATA_FILE",
@@ -23,9 +32,15 @@ __all__ = [
     "CATEGORY_SUBSCRIPTIONS",
     "fmt_brl",
     "FinanceKpis",
+    "ClassificationCacheStats",
     "SidebarState",
+    "TransactionFilter",
     "MongoSettings",
     "PluggySettings",
+    "ReclassifySettings",
+    "StorageSettings",
     "load_mongo_settings",
     "load_pluggy_settings",
+    "load_reclassify_settings",
+    "load_storage_settings",
 ]
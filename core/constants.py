@@ -1,12 +1,33 @@
 DATA_FILE = "dados_financeiros.csv"
+PARQUET_DATA_FILE = "dados_financeiros.parquet"
 RULES_FILE = "regras_classificacao.json"
 BILLS_CACHE_FILE = "faturas_cache.json"
 BALANCES_CACHE_FILE = "saldos_cache.json"
 INVESTMENTS_CACHE_FILE = "investimentos_cache.json"
+CLASSIFICATION_CACHE_FILE = "classificacoes_cache.json"
 
 ACCOUNTS_FILE = "contas.json"
 FONTES_SINTETICAS = ["Outro"]
-TRANSACTION_COLUMNS = ["Data", "Descrição", "Valor", "Tipo", "Categoria", "Fonte", "pluggy_id", "categoria_manual"]
+TRANSACTION_COLUMNS = [
+    "tx_id",
+    "Data",
+    "Descrição",
+    "Valor",
+    "valor_centavos",
+    "Tipo",
+    "Categoria",
+    "Fonte",
+    "pluggy_id",
+    "categoria_manual",
+    "descricao_norm",
+    "regras_fp",
+]
+
+# Bookkeeping columns that are persisted but never exported
+INTERNAL_COLUMNS = {"tx_id", "pluggy_id", "valor_centavos", "descricao_norm", "regras_fp"}
+
+# Journal entries accumulated before they are folded into the base file
+JOURNAL_COMPACT_AFTER = 500
 
 # Categories that represent internal movements (not real expenses)
 CROSS_BANK_CATEGORIES = {
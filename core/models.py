@@ -18,3 +18,22 @@ class FinanceKpis:
     total_real_expenses: float
     pct_salary: float
     total_invested: float
+
+
+@dataclass(frozen=True)
+class ClassificationCacheStats:
+    hits: int
+    misses: int
+
+
+@dataclass(frozen=True)
+class TransactionFilter:
+    """Dashboard selection: an inclusive date range plus category/source allow-lists.
+
+    Empty ``categories``/``sources`` mean "no restriction".
+    """
+
+    date_from: date | None = None
+    date_to: date | None = None
+    categories: tuple[str, ...] = ()
+    sources: tuple[str, ...] = ()
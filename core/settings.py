@@ -27,6 +27,8 @@ from core.constants import (
     BILLS_CACHE_FILE,
     FONTES_SINTETICAS,
     INVESTMENTS_CACHE_FILE,
+    JOURNAL_COMPACT_AFTER,
+    PARQUET_DATA_FILE,
 )
 
 
@@ -39,6 +41,15 @@ class PluggySettings:
     bills_cache_file: str
     balances_cache_file: str
     investments_cache_file: str
+    http_timeout: float = 30.0
+    http_max_retries: int = 3
+    # Pluggy API keys are valid for 2 hours; refresh a little earlier.
+    api_key_ttl: int = 6600
+    persist_api_key: bool = False
+    # Concurrent requests when fanning out across items/accounts (1 = sequential).
+    max_workers: int = 4
+    # Use the asyncio/httpx client (pluggy_async) instead of the thread pool.
+    async_client: bool = False
 
     @property
     def has_credentials(self) -> bool:
@@ -90,6 +101,42 @@ class MongoSettings:
         return bool(self.uri and self.database)
 
 
+@dataclass(frozen=True)
+class ReclassifySettings:
+    workers: int = 0
+    parallel_min_rows: int = 50_000
+
+
+@dataclass(frozen=True)
+class StorageSettings:
+    transactions_backend: str = "csv"
+    parquet_file: str = PARQUET_DATA_FILE
+    journal_compact_after: int = JOURNAL_COMPACT_AFTER
+
+    @property
+    def uses_parquet(self) -> bool:
+        return self.transactions_backend == "parquet"
+
+
+def load_storage_settings() -> StorageSettings:
+    load_dotenv()
+    _load_streamlit_secrets()
+    return StorageSettings(
+        transactions_backend=os.getenv("TRANSACTIONS_BACKEND", "csv").strip().lower(),
+        parquet_file=os.getenv("TRANSACTIONS_PARQUET_FILE", PARQUET_DATA_FILE),
+        journal_compact_after=int(os.getenv("TRANSACTIONS_JOURNAL_COMPACT_AFTER", str(JOURNAL_COMPACT_AFTER))),
+    )
+
+
+def load_reclassify_settings() -> ReclassifySettings:
+    load_dotenv()
+    _load_streamlit_secrets()
+    return ReclassifySettings(
+        workers=int(os.getenv("RECLASSIFY_WORKERS", "0")),
+        parallel_min_rows=int(os.getenv("RECLASSIFY_PARALLEL_MIN_ROWS", "50000")),
+    )
+
+
 def load_mongo_settings() -> MongoSettings:
     load_dotenv()
     _load_streamlit_secrets()
@@ -119,4 +166,10 @@ def load_pluggy_settings() -> PluggySettings:
             "PLUGGY_INVESTMENTS_CACHE_FILE",
             INVESTMENTS_CACHE_FILE,
         ),
+        http_timeout=float(os.getenv("PLUGGY_HTTP_TIMEOUT", "30")),
+        http_max_retries=int(os.getenv("PLUGGY_HTTP_RETRIES", "3")),
+        api_key_ttl=int(os.getenv("PLUGGY_API_KEY_TTL", "6600")),
+        persist_api_key=os.getenv("PLUGGY_PERSIST_API_KEY", "").strip().lower() in ("1", "true", "yes"),
+        max_workers=int(os.getenv("PLUGGY_MAX_WORKERS", "4")),
+        async_client=os.getenv("PLUGGY_ASYNC", "").strip().lower() in ("1", "true", "yes"),
     )
@@ -89,7 +89,8 @@ def _classify_exact(description: str, rules: dict) -> str | None:
 
 
 def reclassify_all(df: pd.DataFrame) -> pd.DataFrame:
-    return _transactions_repository.reclassify_all(df)
+    df, _ = _transactions_repository.reclassify_all(df)
+    return df
 
 
 # ─── Data Management ───
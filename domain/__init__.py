@@ -1,27 +1,73 @@
 from domain.analytics import (
     filter_real_expenses,
+    filter_transactions,
     summarize_by_source,
     summarize_daily_expenses,
     summarize_expenses_by_category,
 )
 from domain.classification import (
     DEFAULT_RECLASSIFY_SKIP,
+    RuleMatcher,
+    RulesDiff,
+    classification_fingerprint,
     classify_description,
     classify_exact_description,
+    compile_rules,
+    diff_rules,
+    fill_normalized_descriptions,
+    normalize_series,
     normalize_text,
+    normalized_descriptions,
+    reclassify_affected,
     reclassify_dataframe,
+    reclassify_outdated,
+    refresh_normalized_descriptions,
 )
-from domain.deduplication import deduplicate_cross_bank_transactions
+from domain.deduplication import deduplicate_cross_bank_transactions, merge_with_scoped_deduplication
+from domain.identity import (
+    apply_transaction_fields,
+    diff_signatures,
+    fill_transaction_ids,
+    new_transaction_id,
+    row_signatures,
+)
+from domain.linking import LINK_WINDOW, ManualEntryMatcher, link_synced_transactions
+from domain.money import amount_cents, cents_from_values, fill_amount_cents, to_cents
 
 __all__ = [
+    "filter_transactions",
     "filter_real_expenses",
     "summarize_expenses_by_category",
     "summarize_by_source",
     "summarize_daily_expenses",
     "DEFAULT_RECLASSIFY_SKIP",
     "normalize_text",
+    "normalize_series",
+    "normalized_descriptions",
+    "fill_normalized_descriptions",
+    "refresh_normalized_descriptions",
+    "RuleMatcher",
+    "compile_rules",
     "classify_description",
     "classify_exact_description",
     "reclassify_dataframe",
+    "RulesDiff",
+    "diff_rules",
+    "reclassify_affected",
+    "classification_fingerprint",
+    "reclassify_outdated",
     "deduplicate_cross_bank_transactions",
+    "merge_with_scoped_deduplication",
+    "new_transaction_id",
+    "fill_transaction_ids",
+    "apply_transaction_fields",
+    "row_signatures",
+    "diff_signatures",
+    "LINK_WINDOW",
+    "ManualEntryMatcher",
+    "link_synced_transactions",
+    "to_cents",
+    "cents_from_values",
+    "amount_cents",
+    "fill_amount_cents",
 ]
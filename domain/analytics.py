@@ -1,5 +1,22 @@
 import pandas as pd
 
+from core.models import TransactionFilter
+
+
+def filter_transactions(df: pd.DataFrame, filters: TransactionFilter) -> pd.DataFrame:
+    mask = pd.Series(True, index=df.index)
+    if filters.date_from is not None or filters.date_to is not None:
+        days = df["Data"].dt.date
+        if filters.date_from is not None:
+            mask &= days >= filters.date_from
+        if filters.date_to is not None:
+            mask &= days <= filters.date_to
+    if filters.categories:
+        mask &= df["Categoria"].isin(filters.categories)
+    if filters.sources:
+        mask &= df["Fonte"].isin(filters.sources)
+    return df[mask].copy()
+
 
 def filter_real_expenses(df: pd.DataFrame, real_categories: set[str]) -> pd.DataFrame:
     return df[
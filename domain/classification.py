@@ -1,8 +1,19 @@
+import hashlib
+import json
+import multiprocessing
 import unicodedata
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 
+import numpy as np
 import pandas as pd
 
 
+# Below this many rows, process startup costs more than it saves.
+DEFAULT_PARALLEL_MIN_ROWS = 50_000
+
 DEFAULT_RECLASSIFY_SKIP = {
     "transferencia pessoal",
     "transferencia entre contas",
@@ -24,49 +35,366 @@ def normalize_text(text: str) -> str:
     return " ".join(value.split())
 
 
+def normalize_series(values: pd.Series) -> pd.Series:
+    """Normalize a text column, running ``normalize_text`` once per distinct value."""
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    normalized = np.array([normalize_text(str(value)) for value in uniques], dtype=object)
+    return pd.Series(normalized[codes], index=values.index, dtype=object)
+
+
+def normalized_descriptions(df: pd.DataFrame) -> pd.Series:
+    """Return normalized descriptions, reusing the stored ``descricao_norm`` column."""
+    if "descricao_norm" not in df.columns:
+        return normalize_series(df["Descrição"])
+    values = df["descricao_norm"].to_numpy(dtype=object).copy()
+    missing = pd.isna(values)
+    if missing.any():
+        values[missing] = normalize_series(df["Descrição"][missing]).to_numpy()
+    return pd.Series(values, index=df.index, dtype=object)
+
+
+def fill_normalized_descriptions(df: pd.DataFrame) -> pd.DataFrame:
+    """Compute ``descricao_norm`` for rows that do not have it yet."""
+    df["descricao_norm"] = normalized_descriptions(df)
+    return df
+
+
+def refresh_normalized_descriptions(df: pd.DataFrame) -> np.ndarray:
+    """Recompute ``descricao_norm`` from ``Descrição`` for every row.
+
+    Used before persisting, so descriptions edited directly in the frame do not
+    keep their old normalized text. Those rows also lose their ``regras_fp``
+    stamp, so the next reclassification evaluates them again. Returns the mask
+    of rows whose stored value was missing or stale.
+    """
+    fresh = normalize_series(df["Descrição"]).to_numpy(dtype=object)
+    if "descricao_norm" in df.columns:
+        stale = fresh != df["descricao_norm"].to_numpy(dtype=object)
+    else:
+        stale = np.ones(len(df), dtype=bool)
+    df["descricao_norm"] = fresh
+    if "regras_fp" in df.columns and stale.any():
+        df.loc[stale, "regras_fp"] = None
+    return stale
+
+
+class RuleMatcher:
+    """
+    Compiled keyword rules (Aho-Corasick automaton over normalized keywords).
+    Scans a description once and returns the category of the longest matching
+    keyword, with ties resolved in rule order, like the original linear scan.
+    """
+
+    def __init__(self, rules: dict[str, str]):
+        ranked = sorted(rules.items(), key=lambda item: len(item[0]), reverse=True)
+        self._categories = [category for _, category in ranked]
+        self._goto: list[dict[str, int]] = [{}]
+        self._best: list[int | None] = [None]
+        self._fallback: int | None = None
+        self.exact: dict[str, str] = {}
+
+        for keyword, category in rules.items():
+            self.exact.setdefault(normalize_text(keyword), category)
+
+        for rank, (keyword, _) in enumerate(ranked):
+            pattern = normalize_text(keyword)
+            if not pattern:
+                # An empty keyword is a substring of every description.
+                if self._fallback is None:
+                    self._fallback = rank
+                continue
+            node = 0
+            for char in pattern:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._best.append(None)
+                node = next_node
+            if self._best[node] is None:
+                self._best[node] = rank
+
+        self._fail = [0] * len(self._goto)
+        self._build_failure_links()
+        self.fingerprint = hashlib.sha1(
+            json.dumps(list(rules.items()), ensure_ascii=False).encode("utf-8")
+        ).hexdigest()
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                inherited = self._best[self._fail[child]]
+                if inherited is not None and (self._best[child] is None or inherited < self._best[child]):
+                    self._best[child] = inherited
+                queue.append(child)
+
+    def classify_normalized(self, text: str) -> str | None:
+        """Classify a description that already went through ``normalize_text``."""
+        best = self._fallback
+        node = 0
+        goto = self._goto
+        fail = self._fail
+        best_at = self._best
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            rank = best_at[node]
+            if rank is not None and (best is None or rank < best):
+                best = rank
+        return None if best is None else self._categories[best]
+
+    def classify(self, description: str) -> str | None:
+        return self.classify_normalized(normalize_text(description))
+
+    def classify_exact(self, description: str) -> str | None:
+        return self.exact.get(normalize_text(description))
+
+
+@lru_cache(maxsize=16)
+def _compile_rule_items(items: tuple[tuple[str, str], ...]) -> RuleMatcher:
+    return RuleMatcher(dict(items))
+
+
+def compile_rules(rules: dict[str, str] | RuleMatcher) -> RuleMatcher:
+    """Return the compiled matcher for ``rules``, reused until the rules change."""
+    if isinstance(rules, RuleMatcher):
+        return rules
+    return _compile_rule_items(tuple(rules.items()))
+
+
+@dataclass(frozen=True)
+class RulesDiff:
+    """Keyword-level difference produced when a rule set is saved."""
+
+    added: dict[str, str]
+    removed: dict[str, str]
+    changed: dict[str, str]
+    rules: dict[str, str]
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+    @property
+    def affected_keywords(self) -> set[str]:
+        return {
+            normalize_text(keyword)
+            for keyword in (*self.added, *self.removed, *self.changed)
+        }
+
+
+def diff_rules(old: dict[str, str], new: dict[str, str]) -> RulesDiff:
+    return RulesDiff(
+        added={keyword: category for keyword, category in new.items() if keyword not in old},
+        removed={keyword: category for keyword, category in old.items() if keyword not in new},
+        changed={
+            keyword: category
+            for keyword, category in new.items()
+            if keyword in old and old[keyword] != category
+        },
+        rules=dict(new),
+    )
+
+
+def classification_fingerprint(
+    rules: dict[str, str] | RuleMatcher,
+    skip_categories: set[str] | None = None,
+) -> str:
+    """Identify the rule set and skip set a row was last classified with."""
+    skip = skip_categories or DEFAULT_RECLASSIFY_SKIP
+    payload = json.dumps([compile_rules(rules).fingerprint, sorted(skip)], ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
 def classify_description(description: str, rules: dict[str, str]) -> str | None:
     """
     Auto-classify a description based on keyword rules.
     Matches longest keyword first so specific rules take priority.
     Ignores case, accents, and extra whitespace.
     """
-    desc_norm = normalize_text(description)
-    sorted_rules = sorted(rules.items(), key=lambda item: len(item[0]), reverse=True)
-    for keyword, category in sorted_rules:
-        if normalize_text(keyword) in desc_norm:
-            return category
-    return None
+    return compile_rules(rules).classify(description)
 
 
 def classify_exact_description(description: str, rules: dict[str, str]) -> str | None:
     """Match only full-description rules (after normalization)."""
-    desc_norm = normalize_text(description)
-    for keyword, category in rules.items():
-        if normalize_text(keyword) == desc_norm:
-            return category
-    return None
+    return compile_rules(rules).classify_exact(description)
+
+
+def _manual_mask(df: pd.DataFrame) -> np.ndarray:
+    if "categoria_manual" not in df.columns:
+        return np.zeros(len(df), dtype=bool)
+    return df["categoria_manual"].notna().to_numpy() & df["categoria_manual"].astype(bool).to_numpy()
+
+
+_worker_matcher: RuleMatcher | None = None
+
+
+def _init_classify_worker(matcher: RuleMatcher) -> None:
+    global _worker_matcher
+    _worker_matcher = matcher
+
+
+def _classify_chunk(texts: list[str]) -> list[str | None]:
+    assert _worker_matcher is not None
+    return [_worker_matcher.classify_normalized(text) for text in texts]
+
+
+def _classify_in_processes(matcher: RuleMatcher, texts: list[str], workers: int) -> list[str | None]:
+    """Classify normalized texts across worker processes, preserving input order."""
+    chunk_size = max(1, -(-len(texts) // (workers * 4)))
+    chunks = [texts[start:start + chunk_size] for start in range(0, len(texts), chunk_size)]
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_classify_worker,
+        initargs=(matcher,),
+    ) as pool:
+        results = pool.map(_classify_chunk, chunks)
+        return [category for chunk in results for category in chunk]
 
 
 def reclassify_dataframe(
     df: pd.DataFrame,
-    rules: dict[str, str],
+    rules: dict[str, str] | RuleMatcher,
     skip_categories: set[str] | None = None,
+    *,
+    workers: int = 0,
+    parallel_min_rows: int = DEFAULT_PARALLEL_MIN_ROWS,
 ) -> pd.DataFrame:
     """
     Re-apply all rules to the dataframe.
     Keeps internal-movement categories stable, except when an exact rule exists.
+    With ``workers`` > 1 and at least ``parallel_min_rows`` rows, keyword
+    matching of the distinct descriptions is spread over worker processes.
     """
+    if df.empty:
+        return df
+
     skip = skip_categories or DEFAULT_RECLASSIFY_SKIP
-    for idx, row in df.iterrows():
-        if row.get("categoria_manual", False):
-            continue
-        exact_cat = classify_exact_description(str(row["Descrição"]), rules)
-        if exact_cat:
-            df.at[idx, "Categoria"] = exact_cat
-            continue
-
-        if normalize_text(str(row["Categoria"])) not in skip:
-            new_cat = classify_description(str(row["Descrição"]), rules)
-            if new_cat:
-                df.at[idx, "Categoria"] = new_cat
+    matcher = compile_rules(rules)
+
+    descriptions = normalized_descriptions(df)
+    codes, uniques = pd.factorize(descriptions)
+    exact = np.array([matcher.exact.get(text) for text in uniques], dtype=object)[codes]
+    if workers > 1 and len(df) >= parallel_min_rows:
+        keyword_categories = _classify_in_processes(matcher, list(uniques), workers)
+    else:
+        keyword_categories = [matcher.classify_normalized(text) for text in uniques]
+    by_keyword = np.array(keyword_categories, dtype=object)[codes]
+
+    manual = _manual_mask(df)
+    skipped = normalize_series(df["Categoria"]).isin(skip).to_numpy()
+
+    has_exact = pd.notna(exact) & (exact != "")
+    has_keyword = pd.notna(by_keyword) & (by_keyword != "") & ~skipped
+    new_categories = np.where(has_exact, exact, by_keyword)
+    update = ~manual & (has_exact | has_keyword)
+    if update.any():
+        df.loc[update, "Categoria"] = new_categories[update]
     return df
+
+
+def reclassify_affected(
+    df: pd.DataFrame,
+    diff: RulesDiff,
+    skip_categories: set[str] | None = None,
+    *,
+    workers: int = 0,
+    parallel_min_rows: int = DEFAULT_PARALLEL_MIN_ROWS,
+) -> tuple[pd.DataFrame, pd.Series]:
+    """
+    Re-apply the rules only to rows whose description contains a keyword
+    touched by ``diff``. Returns the dataframe and a mask of changed rows.
+    """
+    changed = pd.Series(False, index=df.index)
+    if df.empty or diff.is_empty:
+        return df, changed
+
+    keywords = diff.affected_keywords
+    descriptions = normalized_descriptions(df)
+    if "" in keywords:
+        affected = np.ones(len(df), dtype=bool)
+    else:
+        probe = RuleMatcher({keyword: keyword for keyword in keywords})
+        codes, uniques = pd.factorize(descriptions)
+        hits = np.array([probe.classify_normalized(text) is not None for text in uniques], dtype=bool)
+        affected = hits[codes]
+    if not affected.any():
+        return df, changed
+
+    subset = df[affected].copy()
+    before = subset["Categoria"].to_numpy(dtype=object, copy=True)
+    subset = reclassify_dataframe(
+        subset,
+        diff.rules,
+        skip_categories,
+        workers=workers,
+        parallel_min_rows=parallel_min_rows,
+    )
+    after = subset["Categoria"].to_numpy(dtype=object)
+    differs = ~((before == after) | (pd.isna(before) & pd.isna(after)))
+    if not differs.any():
+        return df, changed
+
+    positions = np.flatnonzero(affected)[differs]
+    df.iloc[positions, df.columns.get_loc("Categoria")] = after[differs]
+    changed.iloc[positions] = True
+    return df, changed
+
+
+def reclassify_outdated(
+    df: pd.DataFrame,
+    rules: dict[str, str] | RuleMatcher,
+    skip_categories: set[str] | None = None,
+    *,
+    workers: int = 0,
+    parallel_min_rows: int = DEFAULT_PARALLEL_MIN_ROWS,
+) -> tuple[pd.DataFrame, pd.Series, pd.Series]:
+    """
+    Reclassify only rows whose ``regras_fp`` differs from the current rules
+    and stamp them. Returns the dataframe, a mask of rows whose category
+    changed and a mask of rows that were re-evaluated or unstamped (and must
+    be saved).
+    """
+    changed = pd.Series(False, index=df.index)
+    if df.empty:
+        return df, changed, changed.copy()
+
+    fingerprint = classification_fingerprint(rules, skip_categories)
+    if "regras_fp" not in df.columns:
+        df["regras_fp"] = None
+    manual = _manual_mask(df)
+    stamps = df["regras_fp"].to_numpy(dtype=object)
+    # Locked rows drop their stamp, so unlocking them later triggers a fresh evaluation.
+    unstamped = manual & pd.notna(stamps)
+    if unstamped.any():
+        df.loc[unstamped, "regras_fp"] = None
+    outdated = ~manual & (stamps != fingerprint)
+    if not outdated.any():
+        return df, changed, pd.Series(unstamped, index=df.index)
+
+    subset = df[outdated].copy()
+    before = subset["Categoria"].to_numpy(dtype=object, copy=True)
+    subset = reclassify_dataframe(
+        subset,
+        rules,
+        skip_categories,
+        workers=workers,
+        parallel_min_rows=parallel_min_rows,
+    )
+    after = subset["Categoria"].to_numpy(dtype=object)
+    differs = ~((before == after) | (pd.isna(before) & pd.isna(after)))
+
+    positions = np.flatnonzero(outdated)
+    df.iloc[positions, df.columns.get_loc("Categoria")] = after
+    df.iloc[positions, df.columns.get_loc("regras_fp")] = fingerprint
+    changed.iloc[positions[differs]] = True
+    return df, changed, pd.Series(outdated | unstamped, index=df.index)
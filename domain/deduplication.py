@@ -1,7 +1,9 @@
-from collections.abc import Hashable
+from collections.abc import Callable
 
 import pandas as pd
 
+from domain.money import amount_cents
+
 
 def deduplicate_cross_bank_transactions(
     df: pd.DataFrame,
@@ -15,23 +17,48 @@ def deduplicate_cross_bank_transactions(
     if df.empty:
         return df
 
-    result = df.copy()
-    result["_date_str"] = result["Data"].dt.strftime("%Y-%m-%d")
-    result["_abs_val"] = result["Valor"].abs()
+    internal = df["Categoria"].isin(categories).to_numpy()
+    if not internal.any():
+        return df.copy()
+
+    subset = df.loc[internal]
+    cents = amount_cents(subset).abs()
+    keys = pd.DataFrame({"date": subset["Data"].dt.normalize(), "cents": cents})
+    # Rows without a value never matched anything in the row-by-row version.
+    duplicated = (keys.duplicated(keep="first") & cents.notna()).to_numpy()
+    if not duplicated.any():
+        return df.copy()
+
+    to_drop = internal.copy()
+    to_drop[internal] = duplicated
+    return df.loc[~to_drop].reset_index(drop=True)
 
-    to_drop: list[Hashable] = []
-    seen: set[tuple[str, float]] = set()
 
-    for idx, row in result.iterrows():
-        if row["Categoria"] not in categories:
-            continue
+def merge_with_scoped_deduplication(
+    df: pd.DataFrame,
+    new_rows: pd.DataFrame,
+    deduplicate: Callable[[pd.DataFrame], pd.DataFrame],
+) -> pd.DataFrame:
+    """
+    Append ``new_rows`` to a date-sorted ``df`` and deduplicate only the days they span.
+    Duplicates are always same-day, so existing rows outside that window are left
+    untouched and the result stays sorted without re-sorting the whole history.
+    Falls back to a full pass when ``df`` is not sorted by date.
+    """
+    if new_rows.empty:
+        return df
+
+    dates = df["Data"]
+    if df.empty or new_rows["Data"].isna().any() or not dates.is_monotonic_increasing:
+        merged = pd.concat([df, new_rows], ignore_index=True)
+        merged = deduplicate(merged)
+        return merged.sort_values("Data", kind="stable").reset_index(drop=True)
 
-        key = (str(row["_date_str"]), float(row["_abs_val"]))
-        if key in seen:
-            to_drop.append(idx)
-        else:
-            seen.add(key)
+    start = new_rows["Data"].min().normalize()
+    end = new_rows["Data"].max().normalize() + pd.Timedelta(days=1)
+    lo = int(dates.searchsorted(start, side="left"))
+    hi = int(dates.searchsorted(end, side="left"))
 
-    if to_drop:
-        result = result.drop(index=to_drop).reset_index(drop=True)
-    return result.drop(columns=["_date_str", "_abs_val"])
+    window = pd.concat([df.iloc[lo:hi], new_rows], ignore_index=True)
+    window = deduplicate(window).sort_values("Data", kind="stable")
+    return pd.concat([df.iloc[:lo], window, df.iloc[hi:]], ignore_index=True)
@@ -0,0 +1,85 @@
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from core.constants import TRANSACTION_COLUMNS
+from domain.classification import normalize_text
+from domain.money import to_cents
+
+# Columns whose edits invalidate a row's ``regras_fp`` stamp.
+RULE_INPUTS = frozenset({"Descrição", "Categoria", "categoria_manual"})
+
+
+def new_transaction_id() -> str:
+    return uuid.uuid4().hex
+
+
+def fill_transaction_ids(df: pd.DataFrame) -> pd.DataFrame:
+    """Assign a stable ``tx_id`` to rows that do not have one (or share one with an earlier row)."""
+    if "tx_id" not in df.columns:
+        df["tx_id"] = None
+    missing = (df["tx_id"].isna() | df["tx_id"].duplicated()).to_numpy()
+    if missing.any():
+        ids = df["tx_id"].to_numpy(dtype=object, copy=True)
+        ids[missing] = [new_transaction_id() for _ in range(int(missing.sum()))]
+        df["tx_id"] = ids
+    return df
+
+
+def apply_transaction_fields(df: pd.DataFrame, tx_ids: list[str], fields: dict) -> np.ndarray:
+    """Set ``fields`` on the rows with the given ids, keeping derived columns in sync.
+
+    Returns the boolean mask of the updated rows.
+    """
+    rows = df["tx_id"].isin(tx_ids).to_numpy()
+    if not rows.any():
+        return rows
+    for column, value in fields.items():
+        df.loc[rows, column] = value
+    if "Descrição" in fields:
+        df.loc[rows, "descricao_norm"] = normalize_text(str(fields["Descrição"]))
+    if RULE_INPUTS.intersection(fields) and "regras_fp" in df.columns:
+        # The rules stamp no longer describes this row; reclassify it next time.
+        df.loc[rows, "regras_fp"] = None
+    if "Valor" in fields:
+        cents = to_cents(fields["Valor"])
+        df.loc[rows, "valor_centavos"] = cents
+        df.loc[rows, "Valor"] = cents / 100
+    return rows
+
+
+def row_signatures(df: pd.DataFrame) -> pd.Series:
+    """Hash every persisted column of each row, indexed by ``tx_id``."""
+    frame = df.reindex(columns=TRANSACTION_COLUMNS)
+    canonical: dict[str, pd.Series | np.ndarray] = {}
+    for column in TRANSACTION_COLUMNS:
+        values = frame[column]
+        if column == "Data":
+            dates = pd.to_datetime(values).to_numpy(dtype="datetime64[us]")
+            canonical[column] = dates.view("int64")
+        elif column == "Valor":
+            canonical[column] = pd.to_numeric(values, errors="coerce").to_numpy(dtype=float)
+        elif column == "valor_centavos":
+            canonical[column] = pd.to_numeric(values, errors="coerce").astype("Int64")
+        elif column == "categoria_manual":
+            canonical[column] = values.astype(object).where(values.notna(), False).astype(bool).to_numpy()
+        else:
+            canonical[column] = values.astype(object).where(values.notna(), None).to_numpy()
+    hashes = pd.util.hash_pandas_object(pd.DataFrame(canonical), index=False)
+    index = pd.Index(frame["tx_id"].to_numpy(dtype=object), dtype=object)
+    return pd.Series(hashes.to_numpy(), index=index)
+
+
+def diff_signatures(previous: pd.Series, current: pd.Series) -> tuple[np.ndarray, np.ndarray, list]:
+    """Compare two ``row_signatures`` results.
+
+    Returns (inserted mask, updated mask) aligned with ``current`` and the ids
+    that only exist in ``previous``.
+    """
+    inserted = ~current.index.isin(previous.index)
+    known = current[~inserted]
+    updated = np.zeros(len(current), dtype=bool)
+    updated[~inserted] = known.to_numpy() != previous.reindex(known.index).to_numpy()
+    deleted = previous.index[~previous.index.isin(current.index)].tolist()
+    return inserted, updated, deleted
@@ -0,0 +1,95 @@
+from collections.abc import Hashable
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+from domain.money import amount_cents, to_cents
+
+# Bank feeds may post a purchase up to two days away from the manual entry.
+LINK_WINDOW = timedelta(days=2)
+
+
+class ManualEntryMatcher:
+    """Interval-join index of unlinked manual rows (no ``pluggy_id``).
+
+    Rows are bucketed by integer-cent value and sorted by date inside each
+    bucket, so each lookup is a binary search over the ``±window`` range
+    instead of a scan of the whole frame. Among the candidates in range the
+    row that comes first in the frame wins, and a row is never linked twice.
+    """
+
+    def __init__(self, df: pd.DataFrame, window: timedelta = LINK_WINDOW):
+        self._labels = df.index
+        self._window = pd.Timedelta(window).value
+        self._linked: set[int] = set()
+        self._buckets: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+
+        if df.empty:
+            return
+        dates = pd.to_datetime(df["Data"])
+        all_cents = amount_cents(df)
+        manual = (df["pluggy_id"].isna() & dates.notna() & all_cents.notna()).to_numpy()
+        positions = np.flatnonzero(manual)
+        if not len(positions):
+            return
+
+        stamps = dates.to_numpy(dtype="datetime64[ns]")[positions].astype(np.int64)
+        cents = all_cents.to_numpy(dtype=np.int64, na_value=0)[positions]
+        order = np.lexsort((stamps, cents))
+        cents, stamps, positions = cents[order], stamps[order], positions[order]
+        keys, starts = np.unique(cents, return_index=True)
+        ends = np.append(starts[1:], len(cents))
+        for key, start, end in zip(keys.tolist(), starts, ends):
+            self._buckets[key] = (stamps[start:end], positions[start:end])
+
+    def match(self, date, value: float) -> Hashable | None:
+        """Claim the first unlinked manual row within the window, if any."""
+        bucket = self._buckets.get(to_cents(value))
+        if bucket is None:
+            return None
+        stamps, positions = bucket
+        stamp = pd.Timestamp(date).as_unit("ns").value
+        lo = np.searchsorted(stamps, stamp - self._window, side="left")
+        hi = np.searchsorted(stamps, stamp + self._window, side="right")
+
+        best: int | None = None
+        for position in positions[lo:hi].tolist():
+            if position not in self._linked and (best is None or position < best):
+                best = position
+        if best is None:
+            return None
+        self._linked.add(best)
+        return self._labels[best]
+
+
+def link_synced_transactions(
+    df: pd.DataFrame,
+    transactions: list[dict],
+) -> tuple[pd.DataFrame, list[dict]]:
+    """
+    Attach Pluggy transactions to the DataFrame in place.
+    - Skips transactions whose pluggy_id already exists.
+    - Links a matching manual entry (same value, date within the window)
+      instead of creating a duplicate.
+    Returns (df, transactions that still need to be appended).
+    """
+    if "pluggy_id" not in df.columns:
+        df["pluggy_id"] = None
+
+    existing_ids = set(df["pluggy_id"].dropna().astype(str))
+    matcher = ManualEntryMatcher(df)
+    new_rows: list[dict] = []
+
+    for tx in transactions:
+        if tx["pluggy_id"] in existing_ids:
+            continue
+
+        existing_ids.add(tx["pluggy_id"])
+        match_idx = matcher.match(tx["Data"], tx["Valor"])
+        if match_idx is not None:
+            df.at[match_idx, "pluggy_id"] = tx["pluggy_id"]
+        else:
+            new_rows.append(tx)
+
+    return df, new_rows
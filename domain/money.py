@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+
+
+def to_cents(value: float) -> int:
+    """Convert a BRL amount to integer cents."""
+    return int(round(float(value) * 100))
+
+
+def cents_from_values(values: pd.Series) -> pd.Series:
+    """Convert a float amount column to nullable int64 cents."""
+    numeric = pd.to_numeric(values, errors="coerce").to_numpy(dtype=float)
+    return pd.Series(np.rint(numeric * 100), index=values.index).astype("Int64")
+
+
+def amount_cents(df: pd.DataFrame) -> pd.Series:
+    """Return amounts in cents, reusing the stored ``valor_centavos`` column."""
+    if "valor_centavos" not in df.columns:
+        return cents_from_values(df["Valor"])
+    cents = pd.to_numeric(df["valor_centavos"], errors="coerce").astype("Int64")
+    missing = cents.isna()
+    if missing.any():
+        cents[missing] = cents_from_values(df["Valor"][missing])
+    return cents
+
+
+def fill_amount_cents(df: pd.DataFrame) -> pd.DataFrame:
+    """Make ``valor_centavos`` canonical and derive ``Valor`` from it.
+
+    A ``Valor`` that no longer matches its stored cents was edited in the
+    frame, so the cents are recomputed from it rather than reverting the edit.
+    """
+    cents = amount_cents(df)
+    from_values = cents_from_values(df["Valor"])
+    edited = (from_values.notna() & (from_values != cents).fillna(True)).to_numpy(dtype=bool)
+    if edited.any():
+        cents[edited] = from_values[edited]
+    df["valor_centavos"] = cents
+    known = cents.notna().to_numpy()
+    if known.any():
+        values = pd.to_numeric(df["Valor"], errors="coerce").to_numpy(dtype=float, copy=True)
+        values[known] = cents[known].to_numpy(dtype=np.int64) / 100
+        df["Valor"] = values
+    return df
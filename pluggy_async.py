@@ -0,0 +1,315 @@
+"""asyncio counterpart of ``pluggy_integration`` built on httpx (optional dependency).
+
+Every request goes through one ``AsyncPluggyClient`` whose semaphore bounds
+how many are in flight (``PluggySettings.max_workers``). Items, accounts and
+the pages of paginated endpoints are all fetched concurrently, and results are
+merged in the same order as the synchronous implementation.
+"""
+
+import asyncio
+import logging
+from collections.abc import Callable
+
+from core.settings import PluggySettings
+from pluggy_integration import (
+    CONNECT_TIMEOUT,
+    MAX_PAGES,
+    PAGE_SIZE,
+    REFUSED_STATUSES,
+    RETRY_METHODS,
+    RETRY_STATUSES,
+    UPDATE_POLL_INTERVAL,
+    UPDATE_TIMEOUT_SECONDS,
+    ApiKeyCache,
+    _balance_row,
+    _card_info,
+    _is_update_blocked,
+    _map_investment,
+    _map_transaction,
+    _page_count,
+    save_balances_cache,
+    save_bills_cache,
+    save_investments_cache,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _require_httpx():
+    try:
+        import httpx
+    except ImportError as exc:
+        raise ImportError(
+            "O cliente assíncrono do Pluggy requer o pacote 'httpx' (pip install httpx)."
+        ) from exc
+    return httpx
+
+
+class AsyncPluggyClient:
+    """``httpx.AsyncClient`` with the timeouts, retries and API-key handling of PluggyHttpClient.
+
+    Must be created inside the event loop that uses it (``async with``).
+    """
+
+    def __init__(
+        self,
+        settings: PluggySettings,
+        api_keys: ApiKeyCache | None = None,
+        backoff_factor: float = 0.5,
+    ):
+        httpx = _require_httpx()
+        self._httpx = httpx
+        self._settings = settings
+        self._api_keys = api_keys or ApiKeyCache(settings.api_key_ttl)
+        self._max_retries = settings.http_max_retries
+        self._backoff_factor = backoff_factor
+        concurrency = max(1, settings.max_workers)
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._auth_lock = asyncio.Lock()
+        self._api_key: str | None = None
+        self._http = httpx.AsyncClient(
+            base_url=settings.base_url,
+            timeout=httpx.Timeout(settings.http_timeout, connect=min(CONNECT_TIMEOUT, settings.http_timeout)),
+            limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+        )
+
+    async def __aenter__(self) -> "AsyncPluggyClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self._http.aclose()
+
+    async def _send(self, method: str, path: str, **kwargs):
+        """One request under the semaphore, retrying 429/5xx and transport errors with backoff.
+
+        Same policy as the pooled client: the item-update PATCH is only retried on 429/503.
+        """
+        idempotent = method in RETRY_METHODS
+        retry_statuses = RETRY_STATUSES if idempotent else REFUSED_STATUSES
+        for attempt in range(self._max_retries + 1):
+            response = None
+            async with self._semaphore:
+                try:
+                    response = await self._http.request(method, path, **kwargs)
+                except self._httpx.TransportError:
+                    if attempt == self._max_retries or not idempotent:
+                        raise
+            if response is not None and (
+                response.status_code not in retry_statuses or attempt == self._max_retries
+            ):
+                return response
+            await asyncio.sleep(self._retry_delay(response, attempt))
+        raise AssertionError("unreachable")
+
+    def _retry_delay(self, response, attempt: int) -> float:
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+        return self._backoff_factor * (2**attempt)
+
+    async def api_key(self) -> str:
+        """Current API key; the shared cache (and its store) is consulted off the event loop."""
+        if self._api_key is not None:
+            return self._api_key
+        async with self._auth_lock:
+            if self._api_key is None:
+                client_id = self._settings.client_id or ""
+                api_key = await asyncio.to_thread(self._api_keys.cached, client_id)
+                if api_key is None:
+                    response = await self._send(
+                        "POST",
+                        "/auth",
+                        json={"clientId": self._settings.client_id, "clientSecret": self._settings.client_secret},
+                    )
+                    response.raise_for_status()
+                    api_key = response.json()["apiKey"]
+                    await asyncio.to_thread(self._api_keys.remember, client_id, api_key)
+                self._api_key = api_key
+            return self._api_key
+
+    async def _invalidate(self, rejected_key: str) -> None:
+        async with self._auth_lock:
+            if self._api_key == rejected_key:
+                self._api_key = None
+                await asyncio.to_thread(self._api_keys.invalidate, self._settings.client_id or "", rejected_key)
+
+    async def request(self, method: str, path: str, **kwargs):
+        """Authenticated request; a 401 refreshes the API key and retries once."""
+        api_key = await self.api_key()
+        response = await self._send(method, path, headers={"X-API-KEY": api_key}, **kwargs)
+        if response.status_code == 401:
+            await self._invalidate(api_key)
+            api_key = await self.api_key()
+            response = await self._send(method, path, headers={"X-API-KEY": api_key}, **kwargs)
+        return response
+
+    async def get_json(self, path: str, params: dict | None = None) -> dict:
+        response = await self.request("GET", path, params=params)
+        response.raise_for_status()
+        return response.json()
+
+
+def _require_credentials(settings: PluggySettings) -> None:
+    if not settings.has_credentials:
+        raise ValueError("Credenciais do Pluggy não configuradas no .env")
+
+
+async def _paginate(client: AsyncPluggyClient, path: str, params: dict) -> list[dict]:
+    """All results of a paginated endpoint; pages after the first are fetched concurrently."""
+    first = await client.get_json(path, {**params, "pageSize": PAGE_SIZE, "page": 1})
+    results = list(first.get("results", []))
+    pages = _page_count(first)
+    if pages is None:
+        # No total reported: same stop conditions as pluggy_integration._walk_pages.
+        page_size, previous, page = len(results), list(results), 1
+        while previous and len(previous) >= page_size and page < MAX_PAGES:
+            page += 1
+            data = await client.get_json(path, {**params, "pageSize": PAGE_SIZE, "page": page})
+            current = data.get("results", [])
+            if current == previous:
+                logger.warning("Page %d repeats the previous page; stopping pagination.", page)
+                break
+            results.extend(current)
+            previous = current
+        return results
+    rest = await asyncio.gather(
+        *(client.get_json(path, {**params, "pageSize": PAGE_SIZE, "page": page}) for page in range(2, pages + 1))
+    )
+    for data in rest:
+        results.extend(data.get("results", []))
+    return results
+
+
+async def _trigger_item_update(client: AsyncPluggyClient, item_id: str) -> bool:
+    response = await client.request("PATCH", f"/items/{item_id}", json={})
+    if response.is_success:
+        logger.info("Update triggered for item %s", item_id[:8])
+        return True
+    if response.status_code == 400 and _is_update_blocked(response.json() if response.content else {}):
+        logger.warning("MeuPluggy plan does not allow API updates for item %s, skipping trigger.", item_id[:8])
+    else:
+        logger.warning("Failed to trigger update for item %s: HTTP %s", item_id[:8], response.status_code)
+    return False
+
+
+async def _trigger_and_wait_for_updates(client: AsyncPluggyClient, settings: PluggySettings) -> None:
+    item_ids = list(settings.item_map.keys())
+    started = await asyncio.gather(*(_trigger_item_update(client, item_id) for item_id in item_ids))
+    pending = [item_id for item_id, ok in zip(item_ids, started) if ok]
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + UPDATE_TIMEOUT_SECONDS
+    while pending and loop.time() < deadline:
+        await asyncio.sleep(UPDATE_POLL_INTERVAL)
+        responses = await asyncio.gather(*(client.request("GET", f"/items/{item_id}") for item_id in pending))
+        still_pending = []
+        for item_id, response in zip(pending, responses):
+            if response.status_code != 200:
+                still_pending.append(item_id)
+                continue
+            item = response.json()
+            status = item.get("executionStatus", "")
+            if status in ("SUCCESS", "PARTIAL_SUCCESS"):
+                logger.info("Item %s updated successfully.", item_id[:8])
+            elif status == "ERROR":
+                logger.warning(
+                    "Item %s update failed: %s",
+                    item_id[:8],
+                    item.get("error", {}).get("message", "unknown error"),
+                )
+            else:
+                still_pending.append(item_id)
+        pending = still_pending
+
+    if pending:
+        logger.warning("Timeout waiting for items: %s", [i[:8] for i in pending])
+
+
+async def _accounts_by_item(client: AsyncPluggyClient, settings: PluggySettings) -> list[tuple[str, dict]]:
+    responses = await asyncio.gather(
+        *(client.get_json("/accounts", {"itemId": item_id}) for item_id in settings.item_map)
+    )
+    return [
+        (bank, account)
+        for bank, data in zip(settings.item_map.values(), responses)
+        for account in data["results"]
+    ]
+
+
+async def sync_all_async(
+    settings: PluggySettings,
+    date_from: str,
+    date_to: str,
+    categorize: Callable[[str], str | None],
+    api_keys: ApiKeyCache | None = None,
+) -> list[dict]:
+    _require_credentials(settings)
+    async with AsyncPluggyClient(settings, api_keys) as client:
+        await _trigger_and_wait_for_updates(client, settings)
+        accounts = await _accounts_by_item(client, settings)
+        transactions_by_account = await asyncio.gather(
+            *(
+                _paginate(client, "/transactions", {"accountId": account["id"], "from": date_from, "to": date_to})
+                for _, account in accounts
+            )
+        )
+
+    all_transactions = []
+    for (bank, account), transactions in zip(accounts, transactions_by_account):
+        is_credit_card = account["type"] == "CREDIT"
+        fonte = f"Cartão Crédito {bank}" if is_credit_card else bank
+        for tx in transactions:
+            all_transactions.append(
+                _map_transaction(tx=tx, fonte=fonte, is_credit_card=is_credit_card, categorize=categorize)
+            )
+    return all_transactions
+
+
+async def _fetch_bills(client: AsyncPluggyClient, account_id: str) -> list:
+    response = await client.request("GET", "/bills", params={"accountId": account_id})
+    if response.is_error:
+        return []
+    return response.json().get("results", [])
+
+
+async def fetch_credit_card_info_async(settings: PluggySettings, api_keys: ApiKeyCache | None = None) -> list[dict]:
+    _require_credentials(settings)
+    async with AsyncPluggyClient(settings, api_keys) as client:
+        await _trigger_and_wait_for_updates(client, settings)
+        cards = [(bank, account) for bank, account in await _accounts_by_item(client, settings) if account["type"] == "CREDIT"]
+        bills_by_card = await asyncio.gather(*(_fetch_bills(client, account["id"]) for _, account in cards))
+
+    results = [_card_info(account, bank, bills) for (bank, account), bills in zip(cards, bills_by_card)]
+    await asyncio.to_thread(save_bills_cache, results, settings.bills_cache_file)
+    return results
+
+
+async def fetch_account_balances_async(settings: PluggySettings, api_keys: ApiKeyCache | None = None) -> list[dict]:
+    _require_credentials(settings)
+    async with AsyncPluggyClient(settings, api_keys) as client:
+        await _trigger_and_wait_for_updates(client, settings)
+        accounts = await _accounts_by_item(client, settings)
+
+    rows = (_balance_row(account, bank) for bank, account in accounts)
+    results = [row for row in rows if row is not None]
+    balances = sorted(results, key=lambda item: (item["banco"], item["conta"]))
+    await asyncio.to_thread(save_balances_cache, balances, settings.balances_cache_file)
+    return balances
+
+
+async def fetch_investments_async(settings: PluggySettings, api_keys: ApiKeyCache | None = None) -> list[dict]:
+    _require_credentials(settings)
+    async with AsyncPluggyClient(settings, api_keys) as client:
+        await _trigger_and_wait_for_updates(client, settings)
+        investments_by_item = await asyncio.gather(
+            *(_paginate(client, "/investments", {"itemId": item_id}) for item_id in settings.item_map)
+        )
+
+    results = [
+        _map_investment(investment, bank)
+        for bank, investments in zip(settings.item_map.values(), investments_by_item)
+        for investment in investments
+    ]
+    investments = sorted(results, key=lambda item: (item["banco"], item["investimento"]))
+    await asyncio.to_thread(save_investments_cache, investments, settings.investments_cache_file)
+    return investments
@@ -1,20 +1,252 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import json
 import logging
+import math
 import os
+import threading
 import time
+from typing import Protocol, TypeVar
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from core.settings import PluggySettings, load_pluggy_settings
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
 
-def _get_api_key(settings: PluggySettings) -> str:
-    response = requests.post(
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Retried on read errors and any RETRY_STATUSES: urllib3's idempotent set plus POST (only /auth).
+RETRY_METHODS = Retry.DEFAULT_ALLOWED_METHODS | {"POST"}
+# PATCH /items/{id} starts an item update, so it is retried only when the server refused it.
+REFUSED_STATUSES = (429, 503)
+CONNECT_TIMEOUT = 5.0
+POOL_SIZE = 10
+PAGE_SIZE = 500
+# Upper bound when walking pages of a response that reports no total.
+MAX_PAGES = 200
+UPDATE_TIMEOUT_SECONDS = 180
+UPDATE_POLL_INTERVAL = 5
+
+
+class ApiKeyStore(Protocol):
+    def load_api_key(self, client_id: str) -> tuple[str, float] | None: ...
+
+    def save_api_key(self, client_id: str, api_key: str, expires_at: float) -> None: ...
+
+
+class ApiKeyCache:
+    """Thread-safe Pluggy API keys with expiry, keyed by client id.
+
+    Concurrent callers of one client id wait for a single ``/auth`` round-trip.
+    That wait (and any ``store`` I/O) holds only the client id's own lock, so
+    callers with a cached key or another client id are never blocked by it.
+    With a ``store`` the key (and its wall-clock expiry) also survives restarts.
+    """
+
+    def __init__(self, ttl_seconds: float = 6600, store: ApiKeyStore | None = None):
+        self._ttl_seconds = ttl_seconds
+        self._store = store
+        self._entries: dict[str, tuple[str, float]] = {}
+        self._key_locks: dict[str, threading.Lock] = {}
+        # Guards the two dicts above only; never held across network or store I/O.
+        self._lock = threading.Lock()
+
+    def get(self, settings: PluggySettings, client: "PluggyHttpClient") -> str:
+        client_id = settings.client_id or ""
+        api_key = self._cached_in_memory(client_id)
+        if api_key is not None:
+            return api_key
+        with self._key_lock(client_id):
+            # Another caller may have authenticated while this one waited.
+            api_key = self._lookup(client_id)
+            if api_key is None:
+                api_key = _get_api_key(settings, client)
+                self._remember(client_id, api_key)
+            return api_key
+
+    def cached(self, client_id: str) -> str | None:
+        """The unexpired key for ``client_id``, without authenticating."""
+        with self._key_lock(client_id):
+            return self._lookup(client_id)
+
+    def remember(self, client_id: str, api_key: str) -> None:
+        """Record a key obtained elsewhere (e.g. by the async client)."""
+        with self._key_lock(client_id):
+            self._remember(client_id, api_key)
+
+    def _key_lock(self, client_id: str) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(client_id, threading.Lock())
+
+    def _cached_in_memory(self, client_id: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(client_id)
+        if entry is None or entry[1] <= time.time():
+            return None
+        return entry[0]
+
+    def _lookup(self, client_id: str) -> str | None:
+        api_key = self._cached_in_memory(client_id)
+        if api_key is not None or self._store is None:
+            return api_key
+        entry = self._store.load_api_key(client_id)
+        if entry is None or entry[1] <= time.time():
+            return None
+        with self._lock:
+            self._entries[client_id] = entry
+        return entry[0]
+
+    def _remember(self, client_id: str, api_key: str) -> None:
+        expires_at = time.time() + self._ttl_seconds
+        with self._lock:
+            self._entries[client_id] = (api_key, expires_at)
+        if self._store is not None:
+            self._store.save_api_key(client_id, api_key, expires_at)
+
+    def invalidate(self, client_id: str, api_key: str) -> None:
+        """Drop ``api_key`` unless another caller already replaced it."""
+        with self._key_lock(client_id):
+            with self._lock:
+                entry = self._entries.get(client_id)
+                if entry is not None and entry[0] == api_key:
+                    del self._entries[client_id]
+            if self._store is not None:
+                stored = self._store.load_api_key(client_id)
+                if stored is not None and stored[0] == api_key:
+                    self._store.save_api_key(client_id, api_key, 0.0)
+
+
+class _PluggyRetry(Retry):
+    """Retry that never repeats a non-idempotent call the server may have acted on."""
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method not in RETRY_METHODS:
+            return bool(self.total) and status_code in REFUSED_STATUSES
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+class PluggyHttpClient:
+    """Pooled keep-alive session shared by every Pluggy API call.
+
+    Requests get a default (connect, read) timeout, and 429/5xx responses and
+    connection errors are retried with exponential backoff (``Retry-After`` is
+    honoured). The item-update PATCH is only retried on 429/503, so a timed-out
+    trigger never fires twice. Exhausted retries return the last response, so callers keep
+    using ``raise_for_status``. A 401 on ``ApiKeyHeaders`` refreshes the API
+    key and retries once.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        pool_size: int = POOL_SIZE,
+        api_keys: ApiKeyCache | None = None,
+    ):
+        self.timeout = (min(CONNECT_TIMEOUT, timeout), timeout)
+        self.api_keys = api_keys or ApiKeyCache()
+        retry = _PluggyRetry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=RETRY_METHODS,
+            raise_on_status=False,
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    @classmethod
+    def from_settings(
+        cls,
+        settings: PluggySettings,
+        key_store: ApiKeyStore | None = None,
+    ) -> "PluggyHttpClient":
+        return cls(
+            timeout=settings.http_timeout,
+            max_retries=settings.http_max_retries,
+            pool_size=max(POOL_SIZE, settings.max_workers),
+            api_keys=ApiKeyCache(settings.api_key_ttl, key_store if settings.persist_api_key else None),
+        )
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        response = self.session.request(method, url, **kwargs)
+        headers = kwargs.get("headers")
+        if (
+            response.status_code == 401
+            and isinstance(headers, ApiKeyHeaders)
+            and headers.refresh(response.request.headers.get("X-API-KEY", ""))
+        ):
+            response.close()
+            response = self.session.request(method, url, **kwargs)
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def patch(self, url: str, **kwargs) -> requests.Response:
+        return self.request("PATCH", url, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class ApiKeyHeaders(dict):
+    """``X-API-KEY`` headers backed by the client's key cache.
+
+    ``refresh`` swaps in a new key in place, so every later call made with the
+    same headers uses it too.
+    """
+
+    def __init__(self, settings: PluggySettings, client: PluggyHttpClient):
+        super().__init__({"X-API-KEY": client.api_keys.get(settings, client)})
+        self._settings = settings
+        self._client = client
+
+    def refresh(self, rejected_key: str) -> bool:
+        """Replace ``rejected_key``; True when a different key is now in place."""
+        if self["X-API-KEY"] == rejected_key:
+            # Another thread sharing these headers may already have refreshed them.
+            self._client.api_keys.invalidate(self._settings.client_id or "", rejected_key)
+            self["X-API-KEY"] = self._client.api_keys.get(self._settings, self._client)
+        return self["X-API-KEY"] != rejected_key
+
+
+_http_client: PluggyHttpClient | None = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client(
+    settings: PluggySettings | None = None,
+    key_store: ApiKeyStore | None = None,
+) -> PluggyHttpClient:
+    """Process-wide client, created on first use (from ``settings`` when given)."""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = (
+                PluggyHttpClient.from_settings(settings, key_store) if settings else PluggyHttpClient()
+            )
+        return _http_client
+
+
+def _get_api_key(settings: PluggySettings, client: PluggyHttpClient | None = None) -> str:
+    client = client or get_http_client(settings)
+    response = client.post(
         f"{settings.base_url}/auth",
         json={
             "clientId": settings.client_id,
@@ -25,8 +257,32 @@ def _get_api_key(settings: PluggySettings) -> str:
     return response.json()["apiKey"]
 
 
-def _headers(settings: PluggySettings) -> dict:
-    return {"X-API-KEY": _get_api_key(settings)}
+def _headers(settings: PluggySettings, client: PluggyHttpClient | None = None) -> dict:
+    return ApiKeyHeaders(settings, client or get_http_client(settings))
+
+
+def _fan_out(func: Callable[[T], R], items: Iterable[T], max_workers: int) -> list[R]:
+    """Run ``func`` over ``items`` on a bounded thread pool; results keep input order."""
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+def _fetch_accounts_by_item(
+    headers: dict,
+    settings: PluggySettings,
+    client: PluggyHttpClient,
+) -> list[tuple[str, dict]]:
+    """(bank, account) pairs for every item, in item_map order."""
+    banks = list(settings.item_map.values())
+    accounts_by_item = _fan_out(
+        lambda item_id: fetch_accounts(headers, item_id, settings.base_url, client),
+        settings.item_map.keys(),
+        settings.max_workers,
+    )
+    return [(bank, account) for bank, accounts in zip(banks, accounts_by_item) for account in accounts]
 
 
 def _to_float_or_none(value) -> float | None:
@@ -58,76 +314,151 @@ def _map_investment(investment: dict, bank: str) -> dict:
     }
 
 
-def fetch_accounts(headers: dict, item_id: str, base_url: str) -> list:
-    response = requests.get(f"{base_url}/accounts", params={"itemId": item_id}, headers=headers)
+def _card_info(account: dict, bank: str, bills: list) -> dict:
+    credit_data = account.get("creditData", {})
+    return {
+        "banco": bank,
+        "account_name": account.get("name", "Cartão"),
+        "credit_limit": credit_data.get("creditLimit"),
+        "available_limit": credit_data.get("availableCreditLimit"),
+        "closing_date": credit_data.get("balanceCloseDate"),
+        "due_date": credit_data.get("balanceDueDate"),
+        "bills": bills,
+    }
+
+
+def _balance_row(account: dict, bank: str) -> dict | None:
+    """Balance of a non-credit account, or None when it reports no balance at all."""
+    if account.get("type") == "CREDIT":
+        return None
+    balance = _to_float_or_none(account.get("balance"))
+    available = _to_float_or_none(account.get("availableBalance"))
+    if balance is None and available is None:
+        return None
+    return {
+        "banco": bank,
+        "conta": account.get("name", "Conta"),
+        "tipo": account.get("type", "UNKNOWN"),
+        "subtipo": account.get("subtype", ""),
+        "saldo": balance,
+        "saldo_disponivel": available,
+        "moeda": account.get("currencyCode", "BRL"),
+    }
+
+
+def fetch_accounts(
+    headers: dict,
+    item_id: str,
+    base_url: str,
+    client: PluggyHttpClient | None = None,
+) -> list:
+    client = client or get_http_client()
+    response = client.get(f"{base_url}/accounts", params={"itemId": item_id}, headers=headers)
     response.raise_for_status()
     return response.json()["results"]
 
 
+def _page_count(data: dict) -> int | None:
+    """Number of pages announced by a first-page response, or None when it reports no total."""
+    if data.get("totalPages") is not None:
+        return max(1, int(data["totalPages"]))
+    if data.get("total") is None:
+        return None
+    # The server may cap pageSize below what was asked; infer it from the first page.
+    total, page_length = int(data["total"]), len(data.get("results", []))
+    if page_length == 0 or total <= page_length:
+        return 1
+    return math.ceil(total / page_length)
+
+
+def _walk_pages(get_results: Callable[[int], list[dict]], first: list[dict]) -> list[dict]:
+    """Follow pages after ``first`` one by one, for responses that report no total.
+
+    Stops at an empty page, a page shorter than the first one, a page that
+    repeats the previous one, or after MAX_PAGES pages.
+    """
+    results = list(first)
+    page_size, previous, page = len(first), first, 1
+    while previous and len(previous) >= page_size:
+        if page >= MAX_PAGES:
+            logger.warning("Stopped paginating after %d pages without a reported total.", MAX_PAGES)
+            break
+        page += 1
+        current = get_results(page)
+        if current == previous:
+            logger.warning("Page %d repeats the previous page; stopping pagination.", page)
+            break
+        results.extend(current)
+        previous = current
+    return results
+
+
+def _fetch_pages(
+    client: PluggyHttpClient,
+    url: str,
+    headers: dict,
+    param_sets: list[dict],
+    max_workers: int = 1,
+) -> list[list[dict]]:
+    """All results of a paginated endpoint for each set of query params, in page order.
+
+    The first page of every query is fetched up front; once the totals are known,
+    the remaining pages of all queries share one bounded fan-out.
+    """
+
+    def get_page(params: dict, page: int) -> dict:
+        response = client.get(url, params={**params, "pageSize": PAGE_SIZE, "page": page}, headers=headers)
+        response.raise_for_status()
+        return response.json()
+
+    first_pages = _fan_out(lambda params: get_page(params, 1), param_sets, max_workers)
+    results = [list(data.get("results", [])) for data in first_pages]
+    page_counts = [_page_count(data) for data in first_pages]
+
+    remaining = [
+        (index, page)
+        for index, pages in enumerate(page_counts)
+        if pages is not None
+        for page in range(2, pages + 1)
+    ]
+    pages_data = _fan_out(lambda task: get_page(param_sets[task[0]], task[1]), remaining, max_workers)
+    for (index, _page), data in zip(remaining, pages_data):
+        results[index].extend(data.get("results", []))
+
+    # No total reported: walk pages sequentially until the last one.
+    for index, pages in enumerate(page_counts):
+        if pages is None:
+            params = param_sets[index]
+            results[index] = _walk_pages(lambda page: get_page(params, page).get("results", []), results[index])
+
+    return results
+
+
 def fetch_transactions(
     headers: dict,
     account_id: str,
     date_from: str,
     date_to: str,
     base_url: str,
+    client: PluggyHttpClient | None = None,
+    max_workers: int = 1,
 ) -> list:
-    """Fetch all transactions for an account, handling pagination."""
-    all_transactions = []
-    page = 1
-
-    while True:
-        response = requests.get(
-            f"{base_url}/transactions",
-            params={
-                "accountId": account_id,
-                "from": date_from,
-                "to": date_to,
-                "pageSize": 500,
-                "page": page,
-            },
-            headers=headers,
-        )
-        response.raise_for_status()
-        data = response.json()
-        all_transactions.extend(data.get("results", []))
-        if len(all_transactions) >= data.get("total", 0):
-            break
-        page += 1
-
-    return all_transactions
+    """Fetch all transactions for an account; pages after the first are fetched concurrently."""
+    client = client or get_http_client()
+    params = {"accountId": account_id, "from": date_from, "to": date_to}
+    return _fetch_pages(client, f"{base_url}/transactions", headers, [params], max_workers)[0]
 
 
 def fetch_investments_for_item(
     headers: dict,
     item_id: str,
     base_url: str,
+    client: PluggyHttpClient | None = None,
+    max_workers: int = 1,
 ) -> list[dict]:
-    """Fetch all investments for one item, handling pagination."""
-    all_investments: list[dict] = []
-    page = 1
-
-    while True:
-        response = requests.get(
-            f"{base_url}/investments",
-            params={
-                "itemId": item_id,
-                "pageSize": 500,
-                "page": page,
-            },
-            headers=headers,
-        )
-        response.raise_for_status()
-        data = response.json()
-        page_results = data.get("results", [])
-        all_investments.extend(page_results)
-        total = data.get("total")
-        if total is not None and len(all_investments) >= int(total):
-            break
-        if total is None and not page_results:
-            break
-        page += 1
-
-    return all_investments
+    """Fetch all investments for one item; pages after the first are fetched concurrently."""
+    client = client or get_http_client()
+    return _fetch_pages(client, f"{base_url}/investments", headers, [{"itemId": item_id}], max_workers)[0]
 
 
 def _map_transaction(
@@ -219,17 +550,26 @@ def load_investments_cache(cache_file: str = "investimentos_cache.json") -> dict
         return json.load(file)
 
 
-def fetch_bills(headers: dict, account_id: str, base_url: str) -> list:
+def fetch_bills(
+    headers: dict,
+    account_id: str,
+    base_url: str,
+    client: PluggyHttpClient | None = None,
+) -> list:
     """Fetch credit card bills for an account. Returns empty list if not supported."""
+    client = client or get_http_client()
     try:
-        response = requests.get(f"{base_url}/bills", params={"accountId": account_id}, headers=headers)
+        response = client.get(f"{base_url}/bills", params={"accountId": account_id}, headers=headers)
         response.raise_for_status()
         return response.json().get("results", [])
     except requests.HTTPError:
         return []
 
 
-def fetch_credit_card_info(settings: PluggySettings | None = None) -> list[dict]:
+def fetch_credit_card_info(
+    settings: PluggySettings | None = None,
+    client: PluggyHttpClient | None = None,
+) -> list[dict]:
     """
     Fetch credit card bills and account info for all connected credit card accounts.
     Returns list of dicts with account info + bills.
@@ -238,36 +578,29 @@ def fetch_credit_card_info(settings: PluggySettings | None = None) -> list[dict]
     if not settings.has_credentials:
         raise ValueError("Credenciais do Pluggy não configuradas no .env")
 
-    headers = _headers(settings)
-    _trigger_and_wait_for_updates(headers, settings)
-    results = []
-
-    for item_id, bank in settings.item_map.items():
-        accounts = fetch_accounts(headers, item_id, settings.base_url)
-        for account in accounts:
-            if account["type"] != "CREDIT":
-                continue
-
-            bills = fetch_bills(headers, account["id"], settings.base_url)
-            credit_data = account.get("creditData", {})
-
-            results.append(
-                {
-                    "banco": bank,
-                    "account_name": account.get("name", "Cartão"),
-                    "credit_limit": credit_data.get("creditLimit"),
-                    "available_limit": credit_data.get("availableCreditLimit"),
-                    "closing_date": credit_data.get("balanceCloseDate"),
-                    "due_date": credit_data.get("balanceDueDate"),
-                    "bills": bills,
-                }
-            )
+    client = client or get_http_client(settings)
+    headers = _headers(settings, client)
+    _trigger_and_wait_for_updates(headers, settings, client)
+    cards = [
+        (bank, account)
+        for bank, account in _fetch_accounts_by_item(headers, settings, client)
+        if account["type"] == "CREDIT"
+    ]
+    bills_by_card = _fan_out(
+        lambda card: fetch_bills(headers, card[1]["id"], settings.base_url, client),
+        cards,
+        settings.max_workers,
+    )
+    results = [_card_info(account, bank, bills) for (bank, account), bills in zip(cards, bills_by_card)]
 
     save_bills_cache(results, settings.bills_cache_file)
     return results
 
 
-def fetch_account_balances(settings: PluggySettings | None = None) -> list[dict]:
+def fetch_account_balances(
+    settings: PluggySettings | None = None,
+    client: PluggyHttpClient | None = None,
+) -> list[dict]:
     """
     Fetch non-credit account balances from all connected items.
     Returns a normalized list ready to display in the UI.
@@ -276,39 +609,21 @@ def fetch_account_balances(settings: PluggySettings | None = None) -> list[dict]
     if not settings.has_credentials:
         raise ValueError("Credenciais do Pluggy não configuradas no .env")
 
-    headers = _headers(settings)
-    _trigger_and_wait_for_updates(headers, settings)
-    results: list[dict] = []
-
-    for item_id, bank in settings.item_map.items():
-        accounts = fetch_accounts(headers, item_id, settings.base_url)
-        for account in accounts:
-            if account.get("type") == "CREDIT":
-                continue
-
-            balance = _to_float_or_none(account.get("balance"))
-            available = _to_float_or_none(account.get("availableBalance"))
-            if balance is None and available is None:
-                continue
-
-            results.append(
-                {
-                    "banco": bank,
-                    "conta": account.get("name", "Conta"),
-                    "tipo": account.get("type", "UNKNOWN"),
-                    "subtipo": account.get("subtype", ""),
-                    "saldo": balance,
-                    "saldo_disponivel": available,
-                    "moeda": account.get("currencyCode", "BRL"),
-                }
-            )
+    client = client or get_http_client(settings)
+    headers = _headers(settings, client)
+    _trigger_and_wait_for_updates(headers, settings, client)
+    rows = (_balance_row(account, bank) for bank, account in _fetch_accounts_by_item(headers, settings, client))
+    results = [row for row in rows if row is not None]
 
     balances = sorted(results, key=lambda item: (item["banco"], item["conta"]))
     save_balances_cache(balances, settings.balances_cache_file)
     return balances
 
 
-def fetch_investments(settings: PluggySettings | None = None) -> list[dict]:
+def fetch_investments(
+    settings: PluggySettings | None = None,
+    client: PluggyHttpClient | None = None,
+) -> list[dict]:
     """
     Fetch investments from all connected items using Pluggy's Investment endpoint.
     Returns normalized rows for the investments tab.
@@ -317,16 +632,19 @@ def fetch_investments(settings: PluggySettings | None = None) -> list[dict]:
     if not settings.has_credentials:
         raise ValueError("Credenciais do Pluggy não configuradas no .env")
 
-    headers = _headers(settings)
-    _trigger_and_wait_for_updates(headers, settings)
+    client = client or get_http_client(settings)
+    headers = _headers(settings, client)
+    _trigger_and_wait_for_updates(headers, settings, client)
+    investments_by_item = _fetch_pages(
+        client,
+        f"{settings.base_url}/investments",
+        headers,
+        [{"itemId": item_id} for item_id in settings.item_map],
+        settings.max_workers,
+    )
     results: list[dict] = []
 
-    for item_id, bank in settings.item_map.items():
-        investments = fetch_investments_for_item(
-            headers=headers,
-            item_id=item_id,
-            base_url=settings.base_url,
-        )
+    for bank, investments in zip(settings.item_map.values(), investments_by_item):
         for investment in investments:
             results.append(_map_investment(investment, bank))
 
@@ -342,45 +660,69 @@ class PluggyUpdateBlockedError(Exception):
 def _trigger_and_wait_for_updates(
     headers: dict,
     settings: PluggySettings,
+    client: PluggyHttpClient | None = None,
 ) -> None:
     """Trigger a fresh data sync for all items and wait until they finish."""
+    client = client or get_http_client(settings)
     item_ids = list(settings.item_map.keys())
-    triggered: list[str] = []
-    for item_id in item_ids:
-        try:
-            update_item(headers, item_id, settings.base_url)
-            logger.info("Update triggered for item %s", item_id[:8])
-            triggered.append(item_id)
-        except requests.HTTPError as exc:
-            response = exc.response
-            if response is not None and response.status_code == 400:
-                body = response.json() if response.content else {}
-                msg = body.get("message", "")
-                code_desc = body.get("codeDescription", "")
-                is_blocked = (
-                    code_desc == "SANDBOX_CLIENT_ITEM_UPDATE_NOT_ALLOWED"
-                    or "meupluggy" in msg.lower()
-                    or "sandbox" in msg.lower()
-                )
-                if is_blocked:
-                    logger.warning(
-                        "MeuPluggy plan does not allow API updates for item %s, skipping trigger.",
-                        item_id[:8],
-                    )
-                    continue
-            logger.warning("Failed to trigger update for item %s: %s", item_id[:8], exc)
+    started = _fan_out(
+        lambda item_id: _trigger_item_update(headers, item_id, settings.base_url, client),
+        item_ids,
+        settings.max_workers,
+    )
+    triggered = [item_id for item_id, ok in zip(item_ids, started) if ok]
 
     if triggered:
-        wait_for_items_update(headers, triggered, settings.base_url)
+        wait_for_items_update(headers, triggered, settings.base_url, client=client)
+
+
+def _trigger_item_update(
+    headers: dict,
+    item_id: str,
+    base_url: str,
+    client: PluggyHttpClient,
+) -> bool:
+    """Ask Pluggy to refresh one item; False when the update was not started."""
+    try:
+        update_item(headers, item_id, base_url, client)
+        logger.info("Update triggered for item %s", item_id[:8])
+        return True
+    except requests.HTTPError as exc:
+        response = exc.response
+        if response is not None and response.status_code == 400:
+            body = response.json() if response.content else {}
+            if _is_update_blocked(body):
+                logger.warning(
+                    "MeuPluggy plan does not allow API updates for item %s, skipping trigger.",
+                    item_id[:8],
+                )
+                return False
+        logger.warning("Failed to trigger update for item %s: %s", item_id[:8], exc)
+        return False
+
+
+def _is_update_blocked(body: dict) -> bool:
+    """True when a 400 from PATCH /items means the plan cannot trigger updates."""
+    msg = body.get("message", "")
+    return (
+        body.get("codeDescription", "") == "SANDBOX_CLIENT_ITEM_UPDATE_NOT_ALLOWED"
+        or "meupluggy" in msg.lower()
+        or "sandbox" in msg.lower()
+    )
 
 
-def update_item(headers: dict, item_id: str, base_url: str) -> dict:
+def update_item(
+    headers: dict,
+    item_id: str,
+    base_url: str,
+    client: PluggyHttpClient | None = None,
+) -> dict:
     """Trigger a fresh data update for a Pluggy item (re-fetches from the bank)."""
-    response = requests.patch(
+    client = client or get_http_client()
+    response = client.patch(
         f"{base_url}/items/{item_id}",
         headers=headers,
         json={},
-        timeout=30,
     )
     response.raise_for_status()
     return response.json()
@@ -390,20 +732,21 @@ def wait_for_items_update(
     headers: dict,
     item_ids: list[str],
     base_url: str,
-    timeout_seconds: int = 180,
-    poll_interval: int = 5,
+    timeout_seconds: int = UPDATE_TIMEOUT_SECONDS,
+    poll_interval: int = UPDATE_POLL_INTERVAL,
+    client: PluggyHttpClient | None = None,
 ) -> None:
     """Poll item status until all items finish updating or timeout is reached."""
+    client = client or get_http_client()
     deadline = time.time() + timeout_seconds
     pending = set(item_ids)
 
     while pending and time.time() < deadline:
         time.sleep(poll_interval)
         for item_id in list(pending):
-            response = requests.get(
+            response = client.get(
                 f"{base_url}/items/{item_id}",
                 headers=headers,
-                timeout=15,
             )
             if response.status_code != 200:
                 continue
@@ -433,6 +776,7 @@ def sync_all(
     date_to: str | None = None,
     categorize: Callable[[str], str | None] | None = None,
     settings: PluggySettings | None = None,
+    client: PluggyHttpClient | None = None,
 ) -> list[dict]:
     """
     Fetch transactions from all connected items/accounts.
@@ -448,30 +792,30 @@ def sync_all(
         date_to = datetime.now().strftime("%Y-%m-%d")
 
     categorize = categorize or (lambda _description: "Outros")
-    headers = _headers(settings)
-    _trigger_and_wait_for_updates(headers, settings)
+    client = client or get_http_client(settings)
+    headers = _headers(settings, client)
+    _trigger_and_wait_for_updates(headers, settings, client)
+    accounts = _fetch_accounts_by_item(headers, settings, client)
+    transactions_by_account = _fetch_pages(
+        client,
+        f"{settings.base_url}/transactions",
+        headers,
+        [{"accountId": account["id"], "from": date_from, "to": date_to} for _, account in accounts],
+        settings.max_workers,
+    )
     all_transactions = []
 
-    for item_id, bank in settings.item_map.items():
-        accounts = fetch_accounts(headers, item_id, settings.base_url)
-        for account in accounts:
-            is_credit_card = account["type"] == "CREDIT"
-            fonte = f"Cartão Crédito {bank}" if is_credit_card else bank
-
-            transactions = fetch_transactions(
-                headers=headers,
-                account_id=account["id"],
-                date_from=date_from,
-                date_to=date_to,
-                base_url=settings.base_url,
+    # Mapping (and categorize) stays on the calling thread, in item/account order.
+    for (bank, account), transactions in zip(accounts, transactions_by_account):
+        is_credit_card = account["type"] == "CREDIT"
+        fonte = f"Cartão Crédito {bank}" if is_credit_card else bank
+        for tx in transactions:
+            mapped = _map_transaction(
+                tx=tx,
+                fonte=fonte,
+                is_credit_card=is_credit_card,
+                categorize=categorize,
             )
-            for tx in transactions:
-                mapped = _map_transaction(
-                    tx=tx,
-                    fonte=fonte,
-                    is_credit_card=is_credit_card,
-                    categorize=categorize,
-                )
-                all_transactions.append(mapped)
+            all_transactions.append(mapped)
 
     return all_transactions
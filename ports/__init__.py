@@ -1,5 +1,6 @@
 from ports.accounts_port import AccountsPort
-from ports.banking_port import BankingPort
+from ports.banking_port import AsyncBankingPort, BankingPort
+from ports.classification_cache_port import ClassificationCachePort
 from ports.rules_port import RulesDataPort
 from ports.transactions_port import TransactionsDataPort
 
@@ -8,4 +9,6 @@ __all__ = [
     "RulesDataPort",
     "TransactionsDataPort",
     "BankingPort",
+    "AsyncBankingPort",
+    "ClassificationCachePort",
 ]
@@ -23,3 +23,20 @@ class BankingPort(Protocol):
     def load_investments_cache(self) -> dict | None: ...
 
     def get_fontes(self) -> list[str]: ...
+
+
+class AsyncBankingPort(BankingPort, Protocol):
+    """Banking port whose network fetches can also be awaited from an event loop."""
+
+    async def sync_all_async(
+        self,
+        date_from: str,
+        date_to: str,
+        categorize: Callable[[str], str | None],
+    ) -> list[dict]: ...
+
+    async def fetch_credit_card_info_async(self) -> list[dict]: ...
+
+    async def fetch_account_balances_async(self) -> list[dict]: ...
+
+    async def fetch_investments_async(self) -> list[dict]: ...
@@ -0,0 +1,11 @@
+from typing import Protocol
+
+
+class ClassificationCachePort(Protocol):
+    def load_classifications(self, rules_version: str) -> dict[str, str | None]: ...
+
+    def save_classifications(
+        self,
+        rules_version: str,
+        classifications: dict[str, str | None],
+    ) -> None: ...
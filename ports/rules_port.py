@@ -10,11 +10,22 @@ class RulesDataPort(Protocol):
 
     def load_rules(self) -> dict: ...
 
+    def get_rules_version(self) -> str: ...
+
     def add_rule(self, keyword: str, category: str) -> dict: ...
 
     def remove_rule(self, keyword: str) -> dict: ...
 
-    def reclassify_all(self, df: pd.DataFrame) -> pd.DataFrame: ...
+    def add_rule_and_reclassify(
+        self,
+        df: pd.DataFrame,
+        keyword: str,
+        category: str,
+    ) -> tuple[pd.DataFrame, int]: ...
+
+    def remove_rule_and_reclassify(self, df: pd.DataFrame, keyword: str) -> tuple[pd.DataFrame, int]: ...
+
+    def reclassify_all(self, df: pd.DataFrame) -> tuple[pd.DataFrame, int]: ...
 
     def classify(self, description: str, rules: dict | None = None) -> str | None: ...
 
@@ -3,6 +3,8 @@ from typing import Protocol
 
 import pandas as pd
 
+from core.models import TransactionFilter
+
 
 class TransactionsDataPort(Protocol):
     def load_dataframe(self) -> pd.DataFrame: ...
@@ -15,6 +17,8 @@ class TransactionsDataPort(Protocol):
 
     def get_daily_expenses(self, df: pd.DataFrame) -> pd.DataFrame: ...
 
+    def aggregate_summary_by_category(self, filters: TransactionFilter) -> pd.DataFrame: ...
+
     def add_synced_transactions(
         self,
         df: pd.DataFrame,
@@ -32,6 +36,10 @@ class TransactionsDataPort(Protocol):
         source: str,
     ) -> pd.DataFrame: ...
 
-    def delete_manual_transaction(self, df: pd.DataFrame, index: int) -> pd.DataFrame: ...
+    def update_transaction(self, df: pd.DataFrame, tx_id: str, fields: dict) -> pd.DataFrame: ...
+
+    def delete_transactions(self, df: pd.DataFrame, tx_ids: list[str]) -> pd.DataFrame: ...
 
     def save_dataframe(self, df: pd.DataFrame) -> None: ...
+
+    def save_categories(self, df: pd.DataFrame, rows: pd.Series) -> None: ...
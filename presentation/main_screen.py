@@ -29,6 +29,9 @@ def _handle_sync_request(finance_service: FinanceService, sidebar_state: Sidebar
                 sidebar_state.sync_from,
                 sidebar_state.sync_to,
             )
+        stats = finance_service.last_classification_stats
+        if stats.hits or stats.misses:
+            st.caption(f"Cache de classificação: {stats.hits} acertos, {stats.misses} novas descrições.")
         if count > 0:
             st.success(f"{count} transações novas importadas!")
             st.rerun()
@@ -45,6 +48,7 @@ def _render_tabs(
     finance_service: FinanceService,
     bills_service: BillsService,
     filtered: pd.DataFrame,
+    category_summary: pd.DataFrame,
     sidebar_state: SidebarState,
     formatter: Callable[[float], str],
 ) -> None:
@@ -66,6 +70,7 @@ def _render_tabs(
     with tab_dash:
         render_dashboard_tab(
             filtered_df=filtered,
+            category_summary=category_summary,
             finance_service=finance_service,
             category_icons=category_icons,
             formatter=formatter,
@@ -92,6 +97,7 @@ def _render_tabs(
     with tab_analysis:
         render_analysis_tab(
             filtered_df=filtered,
+            category_summary=category_summary,
             finance_service=finance_service,
             category_icons=category_icons,
             formatter=formatter,
@@ -123,15 +129,17 @@ def render_main_screen(
 
     df = _handle_sync_request(finance_service, sidebar_state)
 
-    filtered = finance_service.apply_filters(
-        df=df,
+    selection = finance_service.build_filter(
         date_range=sidebar_state.date_range,
         categories=sidebar_state.filter_cats,
         fontes=sidebar_state.filter_fontes,
     )
+    filtered = finance_service.apply_selection(df, selection)
 
     render_app_header()
     render_kpi_cards(finance_service.calculate_kpis(filtered), formatter)
     st.markdown("<br>", unsafe_allow_html=True)
 
-    _render_tabs(finance_service, bills_service, filtered, sidebar_state, formatter)
+    # Shared by the dashboard and analysis tabs, from the same frame as the KPIs.
+    category_summary = finance_service.get_summary_by_category(filtered)
+    _render_tabs(finance_service, bills_service, filtered, category_summary, sidebar_state, formatter)
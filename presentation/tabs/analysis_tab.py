@@ -10,16 +10,15 @@ from presentation.components import section_header
 def render_analysis_tab(
     filtered_df: pd.DataFrame,
     finance_service: FinanceService,
+    category_summary: pd.DataFrame,
     category_icons: dict[str, str],
     formatter: Callable[[float], str],
 ) -> None:
     section_header("🔎 Onde Cortar Gastos?")
 
-    cat_summary = finance_service.get_summary_by_category(filtered_df)
-
-    if not cat_summary.empty:
+    if not category_summary.empty:
         st.markdown("**Top 5 maiores categorias de gasto:**")
-        for _, row in cat_summary.head(5).iterrows():
+        for _, row in category_summary.head(5).iterrows():
             icon = category_icons.get(row["Categoria"], "📌")
             pct = row["Percentual"] * 100
             st.markdown(f"**{icon} {row['Categoria']}** — {formatter(row['Total'])} ({pct:.1f}%)")
@@ -1,5 +1,6 @@
 from collections.abc import Callable
 
+import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
@@ -11,6 +12,7 @@ from presentation.components import section_header
 def render_dashboard_tab(
     filtered_df,
     finance_service: FinanceService,
+    category_summary: pd.DataFrame,
     category_icons: dict[str, str],
     formatter: Callable[[float], str],
 ) -> None:
@@ -19,7 +21,7 @@ def render_dashboard_tab(
         "#8b5cf6", "#ec4899", "#14b8a6", "#f97316", "#84cc16",
         "#06b6d4", "#a855f7",
     ]
-    cat_summary = finance_service.get_summary_by_category(filtered_df)
+    cat_summary = category_summary.copy()
     total_gasto = 0.0
     cat_colors: list[str] = []
     if not cat_summary.empty:
@@ -42,8 +42,15 @@ def render_rules_tab(finance_service: FinanceService, df: pd.DataFrame) -> None:
             elif not new_rule_cat:
                 st.error("Cadastre uma categoria antes de criar regras.")
             else:
-                finance_service.add_rule(new_keyword, new_rule_cat)
-                st.success(f'Regra adicionada: "{new_keyword.lower().strip()}" → {new_rule_cat}')
+                st.session_state.df, changed = finance_service.add_rule_and_reclassify(
+                    df,
+                    new_keyword,
+                    new_rule_cat,
+                )
+                st.success(
+                    f'Regra adicionada: "{new_keyword.lower().strip()}" → {new_rule_cat} '
+                    f"({changed} transações reclassificadas)"
+                )
                 st.rerun()
 
     st.markdown("**Remover regra:**")
@@ -77,8 +84,11 @@ def render_rules_tab(finance_service: FinanceService, df: pd.DataFrame) -> None:
             if rule_to_remove is None:
                 st.error("Selecione uma regra para remover.")
             else:
-                finance_service.remove_rule(rule_to_remove)
-                st.success(f'Regra removida: "{rule_to_remove}"')
+                st.session_state.df, changed = finance_service.remove_rule_and_reclassify(
+                    df,
+                    rule_to_remove,
+                )
+                st.success(f'Regra removida: "{rule_to_remove}" ({changed} transações reclassificadas)')
                 st.rerun()
 
     st.divider()
@@ -89,8 +99,8 @@ def render_rules_tab(finance_service: FinanceService, df: pd.DataFrame) -> None:
         "exceto quando existe uma regra exata para a descrição."
     )
     if st.button("🔄 Reclassificar tudo", use_container_width=True, key="reclassify"):
-        st.session_state.df = finance_service.reclassify_all(df)
-        st.success("Todas as transações foram reclassificadas!")
+        st.session_state.df, changed = finance_service.reclassify_all(df)
+        st.success(f"Reclassificação concluída: {changed} transações alteradas.")
         st.rerun()
 
     st.divider()
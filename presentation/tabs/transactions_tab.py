@@ -6,6 +6,7 @@ from typing import cast
 import pandas as pd
 import streamlit as st
 
+from domain.classification import normalize_text, normalized_descriptions
 from services.finance_service import FinanceService
 from presentation.components import section_header
 
@@ -30,7 +31,7 @@ def _category_change_dialog(finance_service: FinanceService) -> None:
     desc = change["description"]
     old_cat = change["old_category"]
     new_cat = change["new_category"]
-    idx = change["index"]
+    tx_id = change["tx_id"]
 
     st.markdown(f"**Descrição:** {desc}")
     st.markdown(f"**{old_cat}** → **{new_cat}**")
@@ -40,19 +41,22 @@ def _category_change_dialog(finance_service: FinanceService) -> None:
     col1, col2 = st.columns(2)
     with col1:
         if st.button("Apenas esta", use_container_width=True):
-            st.session_state.df.at[idx, "Categoria"] = new_cat
-            st.session_state.df.at[idx, "categoria_manual"] = True
-            finance_service.save_dataframe(st.session_state.df)
+            st.session_state.df = finance_service.update_transaction(
+                st.session_state.df,
+                tx_id,
+                {"Categoria": new_cat, "categoria_manual": True},
+            )
             del st.session_state.pending_cat_change
             st.session_state.tx_editor_v = st.session_state.get("tx_editor_v", 0) + 1
             st.rerun()
     with col2:
         label = f"Todas com esta descrição ({total_same})"
         if st.button(label, use_container_width=True):
-            mask = st.session_state.df["Descrição"] == desc
-            st.session_state.df.loc[mask, "Categoria"] = new_cat
-            finance_service.add_rule(desc, new_cat)
-            finance_service.save_dataframe(st.session_state.df)
+            st.session_state.df = finance_service.apply_category_to_description(
+                st.session_state.df,
+                desc,
+                new_cat,
+            )
             del st.session_state.pending_cat_change
             st.session_state.tx_editor_v = st.session_state.get("tx_editor_v", 0) + 1
             st.rerun()
@@ -88,10 +92,7 @@ def _apply_local_filters(
     scoped = df.copy()
     if query.strip():
         scoped = scoped[
-            scoped["Descrição"]
-            .fillna("")
-            .astype(str)
-            .str.contains(query.strip(), case=False, regex=False)
+            normalized_descriptions(scoped).str.contains(normalize_text(query), regex=False)
         ]
 
     if types:
@@ -342,7 +343,8 @@ def render_transactions_tab(
     display_df["🔒"] = display_df["categoria_manual"].astype(bool)
     display_df = display_df.drop(columns=["categoria_manual"])
     display_df["🗑"] = False
-    orig_index = display_df.index.tolist()  # positional → st.session_state.df index
+    orig_index = display_df.index.tolist()  # positional → observed_df index
+    row_ids = observed_df["tx_id"].tolist()  # positional → stable transaction id
     display_df = display_df.reset_index(drop=True)
 
     editor_key = f"tx_editor_{st.session_state.get('tx_editor_v', 0)}"
@@ -388,11 +390,8 @@ def render_transactions_tab(
         # Deletion via 🗑 checkbox
         to_delete_mask = edited_view["🗑"].astype(bool)
         if to_delete_mask.any():
-            deleted_orig = [orig_index[i] for i in edited_view.index[to_delete_mask]]
-            st.session_state.df = (
-                st.session_state.df.drop(index=deleted_orig).reset_index(drop=True)
-            )
-            finance_service.save_dataframe(st.session_state.df)
+            deleted_ids = [row_ids[i] for i in edited_view.index[to_delete_mask]]
+            st.session_state.df = finance_service.delete_transactions(st.session_state.df, deleted_ids)
             st.session_state.tx_editor_v = st.session_state.get("tx_editor_v", 0) + 1
             st.rerun()
 
@@ -404,7 +403,7 @@ def render_transactions_tab(
             pos = edited_view.index[changed_cat_mask][0]
             orig_idx = orig_index[pos]
             st.session_state.pending_cat_change = {
-                "index": orig_idx,
+                "tx_id": row_ids[pos],
                 "description": observed_df.at[orig_idx, "Descrição"],
                 "old_category": _format_category(display_view.at[pos, "Categoria"]),
                 "new_category": _format_category(edited_view.at[pos, "Categoria"]),
@@ -422,27 +421,33 @@ def render_transactions_tab(
         if any_changed.any():
             for pos in edited_view.index[any_changed]:
                 orig_idx = orig_index[pos]
+                fields: dict = {}
                 if data_changed.at[pos]:
                     new_data = pd.to_datetime(str(edited_view.at[pos, "Data"]), errors="coerce")
                     if not pd.isna(new_data):
-                        st.session_state.df.at[orig_idx, "Data"] = new_data
+                        fields["Data"] = new_data
                 if desc_changed.at[pos]:
-                    st.session_state.df.at[orig_idx, "Descrição"] = edited_view.at[pos, "Descrição"]
+                    fields["Descrição"] = edited_view.at[pos, "Descrição"]
                 if tipo_changed.at[pos]:
                     new_tipo = str(edited_view.at[pos, "Tipo"] or "")
                     if new_tipo in ("Entrada", "Saída"):
-                        st.session_state.df.at[orig_idx, "Tipo"] = new_tipo
-                        current_valor = float(st.session_state.df.at[orig_idx, "Valor"] or 0)
+                        fields["Tipo"] = new_tipo
+                        current_valor = float(observed_df.at[orig_idx, "Valor"] or 0)
                         if new_tipo == "Entrada" and current_valor < 0:
-                            st.session_state.df.at[orig_idx, "Valor"] = abs(current_valor)
+                            fields["Valor"] = abs(current_valor)
                         elif new_tipo == "Saída" and current_valor > 0:
-                            st.session_state.df.at[orig_idx, "Valor"] = -abs(current_valor)
+                            fields["Valor"] = -abs(current_valor)
                 if valor_changed.at[pos]:
                     raw = pd.to_numeric(edited_view.at[pos, "Valor"], errors="coerce")
-                    st.session_state.df.at[orig_idx, "Valor"] = 0.0 if pd.isna(raw) else float(raw)
+                    fields["Valor"] = 0.0 if pd.isna(raw) else float(raw)
                 if lock_changed.at[pos]:
-                    st.session_state.df.at[orig_idx, "categoria_manual"] = bool(edited_view.at[pos, "🔒"])
-            finance_service.save_dataframe(st.session_state.df)
+                    fields["categoria_manual"] = bool(edited_view.at[pos, "🔒"])
+                if fields:
+                    st.session_state.df = finance_service.update_transaction(
+                        st.session_state.df,
+                        row_ids[pos],
+                        fields,
+                    )
             st.session_state.tx_editor_v = st.session_state.get("tx_editor_v", 0) + 1
             st.rerun()
 
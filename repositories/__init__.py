@@ -1,16 +1,19 @@
+from repositories.classification_cache_repository import ClassificationCacheRepository
 from repositories.config_repository import ConfigRepository
 from repositories.transactions_repository import TransactionsRepository
 
 __all__ = [
+    "ClassificationCacheRepository",
     "ConfigRepository",
     "MongoConfigRepository",
     "MongoTransactionsRepository",
+    "ParquetTransactionsRepository",
     "TransactionsRepository",
 ]
 
 
 def __getattr__(name: str):
-    """Lazy-import MongoDB repositories so pymongo is only loaded when needed."""
+    """Lazy-import optional backends so pymongo/pyarrow are only loaded when needed."""
     if name == "MongoConfigRepository":
         from repositories.mongo_config_repository import MongoConfigRepository
 
@@ -19,4 +22,8 @@ def __getattr__(name: str):
         from repositories.mongo_transactions_repository import MongoTransactionsRepository
 
         return MongoTransactionsRepository
+    if name == "ParquetTransactionsRepository":
+        from repositories.parquet_transactions_repository import ParquetTransactionsRepository
+
+        return ParquetTransactionsRepository
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
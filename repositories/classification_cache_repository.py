@@ -0,0 +1,32 @@
+import json
+import os
+from datetime import datetime
+
+
+class ClassificationCacheRepository:
+    """JSON-file cache of description -> category, valid for one rules version."""
+
+    def __init__(self, cache_file: str):
+        self._cache_file = cache_file
+
+    def load_classifications(self, rules_version: str) -> dict[str, str | None]:
+        if not os.path.exists(self._cache_file):
+            return {}
+        with open(self._cache_file, "r", encoding="utf-8") as file:
+            data = json.load(file)
+        if data.get("rules_version") != rules_version:
+            return {}
+        return data.get("classifications", {})
+
+    def save_classifications(
+        self,
+        rules_version: str,
+        classifications: dict[str, str | None],
+    ) -> None:
+        data = {
+            "rules_version": rules_version,
+            "updated_at": datetime.now().isoformat(),
+            "classifications": classifications,
+        }
+        with open(self._cache_file, "w", encoding="utf-8") as file:
+            json.dump(data, file, ensure_ascii=False)
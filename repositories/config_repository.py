@@ -1,10 +1,13 @@
 import json
 import os
 
+from domain.classification import RuleMatcher, RulesDiff, compile_rules, diff_rules
+
 
 class ConfigRepository:
     def __init__(self, rules_file: str):
         self._rules_file = rules_file
+        self._rule_matcher: RuleMatcher | None = None
 
     def load_config(self) -> dict:
         if os.path.exists(self._rules_file):
@@ -13,6 +16,7 @@ class ConfigRepository:
         return {"categorias": {}, "regras": {}}
 
     def save_config(self, config: dict) -> None:
+        self._rule_matcher = None
         with open(self._rules_file, "w", encoding="utf-8") as file:
             json.dump(config, file, ensure_ascii=False, indent=2)
 
@@ -48,19 +52,31 @@ class ConfigRepository:
     def load_rules(self) -> dict:
         return self.load_config().get("regras", {})
 
-    def save_rules(self, rules: dict) -> None:
+    def get_rule_matcher(self) -> RuleMatcher:
+        """Compiled rules, rebuilt only after the next save."""
+        if self._rule_matcher is None:
+            self._rule_matcher = compile_rules(self.load_rules())
+        return self._rule_matcher
+
+    def save_rules(self, rules: dict) -> RulesDiff:
         config = self.load_config()
+        diff = diff_rules(config.get("regras", {}), rules)
         config["regras"] = rules
         self.save_config(config)
+        return diff
 
-    def add_rule(self, keyword: str, category: str) -> dict:
+    def set_rule(self, keyword: str, category: str) -> RulesDiff:
         rules = self.load_rules()
         rules[keyword.lower().strip()] = category
-        self.save_rules(rules)
-        return rules
+        return self.save_rules(rules)
 
-    def remove_rule(self, keyword: str) -> dict:
+    def delete_rule(self, keyword: str) -> RulesDiff:
         rules = self.load_rules()
         rules.pop(keyword.lower().strip(), None)
-        self.save_rules(rules)
-        return rules
+        return self.save_rules(rules)
+
+    def add_rule(self, keyword: str, category: str) -> dict:
+        return self.set_rule(keyword, category).rules
+
+    def remove_rule(self, keyword: str) -> dict:
+        return self.delete_rule(keyword).rules
@@ -4,12 +4,14 @@ from pymongo.database import Database
 
 
 class MongoCacheRepository:
-    """MongoDB-backed storage for Pluggy API caches (bills, balances, investments)."""
+    """MongoDB-backed storage for Pluggy API caches and the classification cache."""
 
     COLLECTION = "caches"
     BILLS_ID = "bills"
     BALANCES_ID = "balances"
     INVESTMENTS_ID = "investments"
+    CLASSIFICATIONS_ID = "classifications"
+    API_KEY_PREFIX = "api_key:"
 
     def __init__(self, db: Database):
         self._col = db[self.COLLECTION]
@@ -64,3 +66,40 @@ class MongoCacheRepository:
             "investments": investments,
         }
         self._col.replace_one({"_id": self.INVESTMENTS_ID}, data, upsert=True)
+
+    # -- Pluggy API keys --
+
+    def load_api_key(self, client_id: str) -> tuple[str, float] | None:
+        doc = self._col.find_one({"_id": self.API_KEY_PREFIX + client_id})
+        if doc is None:
+            return None
+        return doc["api_key"], float(doc["expires_at"])
+
+    def save_api_key(self, client_id: str, api_key: str, expires_at: float) -> None:
+        data = {
+            "_id": self.API_KEY_PREFIX + client_id,
+            "api_key": api_key,
+            "expires_at": expires_at,
+        }
+        self._col.replace_one({"_id": data["_id"]}, data, upsert=True)
+
+    # -- Classifications --
+
+    def load_classifications(self, rules_version: str) -> dict[str, str | None]:
+        doc = self._col.find_one({"_id": self.CLASSIFICATIONS_ID, "rules_version": rules_version})
+        if doc is None:
+            return {}
+        return doc.get("classifications", {})
+
+    def save_classifications(
+        self,
+        rules_version: str,
+        classifications: dict[str, str | None],
+    ) -> None:
+        data = {
+            "_id": self.CLASSIFICATIONS_ID,
+            "updated_at": datetime.now().isoformat(),
+            "rules_version": rules_version,
+            "classifications": classifications,
+        }
+        self._col.replace_one({"_id": self.CLASSIFICATIONS_ID}, data, upsert=True)
@@ -1,5 +1,7 @@
 from pymongo.database import Database
 
+from domain.classification import RuleMatcher, RulesDiff, compile_rules, diff_rules
+
 
 class MongoConfigRepository:
     """MongoDB-backed replacement for ConfigRepository (JSON file)."""
@@ -9,6 +11,7 @@ class MongoConfigRepository:
 
     def __init__(self, db: Database):
         self._col = db[self.COLLECTION]
+        self._rule_matcher: RuleMatcher | None = None
         self._ensure_document()
 
     def _ensure_document(self) -> None:
@@ -25,6 +28,7 @@ class MongoConfigRepository:
         return doc
 
     def save_config(self, config: dict) -> None:
+        self._rule_matcher = None
         self._col.replace_one(
             {"_id": self.DOC_ID},
             {"_id": self.DOC_ID, **config},
@@ -63,19 +67,31 @@ class MongoConfigRepository:
     def load_rules(self) -> dict:
         return self.load_config().get("regras", {})
 
-    def save_rules(self, rules: dict) -> None:
+    def get_rule_matcher(self) -> RuleMatcher:
+        """Compiled rules, rebuilt only after the next save."""
+        if self._rule_matcher is None:
+            self._rule_matcher = compile_rules(self.load_rules())
+        return self._rule_matcher
+
+    def save_rules(self, rules: dict) -> RulesDiff:
         config = self.load_config()
+        diff = diff_rules(config.get("regras", {}), rules)
         config["regras"] = rules
         self.save_config(config)
+        return diff
 
-    def add_rule(self, keyword: str, category: str) -> dict:
+    def set_rule(self, keyword: str, category: str) -> RulesDiff:
         rules = self.load_rules()
         rules[keyword.lower().strip()] = category
-        self.save_rules(rules)
-        return rules
+        return self.save_rules(rules)
 
-    def remove_rule(self, keyword: str) -> dict:
+    def delete_rule(self, keyword: str) -> RulesDiff:
         rules = self.load_rules()
         rules.pop(keyword.lower().strip(), None)
-        self.save_rules(rules)
-        return rules
+        return self.save_rules(rules)
+
+    def add_rule(self, keyword: str, category: str) -> dict:
+        return self.set_rule(keyword, category).rules
+
+    def remove_rule(self, keyword: str) -> dict:
+        return self.delete_rule(keyword).rules
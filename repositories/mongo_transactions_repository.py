@@ -1,9 +1,16 @@
-from datetime import timedelta
+import logging
+import threading
+from datetime import datetime, timedelta
 
+import numpy as np
 import pandas as pd
+from pymongo import ASCENDING, ReplaceOne, UpdateOne
 from pymongo.database import Database
+from pymongo.errors import BulkWriteError, OperationFailure
 
 from core.constants import CROSS_BANK_CATEGORIES, TRANSACTION_COLUMNS
+from core.models import TransactionFilter
+from core.settings import ReclassifySettings
 from domain.analytics import (
     filter_real_expenses,
     summarize_by_source,
@@ -11,15 +18,33 @@ from domain.analytics import (
     summarize_expenses_by_category,
 )
 from domain.classification import (
+    RulesDiff,
     classify_description,
-    classify_exact_description,
+    fill_normalized_descriptions,
     normalize_text,
-    reclassify_dataframe,
+    reclassify_affected,
+    reclassify_outdated,
+    refresh_normalized_descriptions,
 )
-from domain.deduplication import deduplicate_cross_bank_transactions
+from domain.deduplication import deduplicate_cross_bank_transactions, merge_with_scoped_deduplication
+from domain.identity import (
+    apply_transaction_fields,
+    diff_signatures,
+    fill_transaction_ids,
+    new_transaction_id,
+    row_signatures,
+)
+from domain.linking import link_synced_transactions
+from domain.money import fill_amount_cents
 from repositories.mongo_config_repository import MongoConfigRepository
 
+logger = logging.getLogger(__name__)
+
 COLUMNS = TRANSACTION_COLUMNS
+# Indexes replaced by the compound/unique ones below.
+LEGACY_INDEXES = ("Data_1", "pluggy_id_1")
+# Keeps each delete filter far below the 16 MB BSON document limit.
+DELETE_CHUNK_SIZE = 10_000
 
 
 class MongoTransactionsRepository:
@@ -27,31 +52,92 @@ class MongoTransactionsRepository:
 
     COLLECTION = "transactions"
 
-    def __init__(self, db: Database, config_repository: MongoConfigRepository):
+    def __init__(
+        self,
+        db: Database,
+        config_repository: MongoConfigRepository,
+        reclassify_settings: ReclassifySettings | None = None,
+    ):
         self._col = db[self.COLLECTION]
         self._config_repository = config_repository
+        self._reclassify_settings = reclassify_settings or ReclassifySettings()
+        # Row signatures of the collection as last loaded/saved, by tx_id.
+        self._snapshot: pd.Series | None = None
+        # The repository is shared by every Streamlit session (see get_services).
+        self._lock = threading.RLock()
+        self._migrate_string_dates()
         self._ensure_indexes()
 
     def _ensure_indexes(self) -> None:
-        self._col.create_index("pluggy_id", sparse=True)
-        self._col.create_index("Data")
+        existing = self._col.index_information()
+        for name in LEGACY_INDEXES:
+            if name in existing:
+                self._col.drop_index(name)
+        self._col.create_index("tx_id", unique=True, sparse=True)
+        # Both prefixes serve plain Data range queries as well.
+        self._col.create_index([("Data", ASCENDING), ("Categoria", ASCENDING)])
+        self._col.create_index([("Data", ASCENDING), ("Fonte", ASCENDING)])
+        try:
+            # Manual entries have no pluggy_id (null/NaN), so only real ids are indexed.
+            self._col.create_index(
+                "pluggy_id",
+                name="pluggy_id_unique",
+                unique=True,
+                partialFilterExpression={"pluggy_id": {"$gt": ""}},
+            )
+        except OperationFailure as exc:
+            logger.warning("Could not create unique pluggy_id index (duplicate ids stored?): %s", exc)
+
+    def _migrate_string_dates(self) -> int:
+        """Convert documents that still store ``Data`` as a string to native dates."""
+        docs = list(self._col.find({"Data": {"$type": "string"}}, {"Data": 1}))
+        if not docs:
+            return 0
+        parsed = pd.to_datetime(pd.Series([doc["Data"] for doc in docs]), format="ISO8601", errors="coerce")
+        operations = [
+            UpdateOne({"_id": doc["_id"]}, {"$set": {"Data": stamp.to_pydatetime()}})
+            for doc, stamp in zip(docs, parsed)
+            if not pd.isna(stamp)
+        ]
+        if operations:
+            self._col.bulk_write(operations, ordered=False)
+        logger.info("Migrated %d string dates to BSON dates", len(operations))
+        return len(operations)
 
     def _normalize(self, text: str) -> str:
         return normalize_text(text)
 
     def classify(self, description: str, rules: dict | None = None) -> str | None:
         if rules is None:
-            rules = self._config_repository.load_rules()
+            return self._config_repository.get_rule_matcher().classify(description)
         return classify_description(description, rules)
 
-    def _classify_exact(self, description: str, rules: dict) -> str | None:
-        return classify_exact_description(description, rules)
-
-    def reclassify_all(self, df: pd.DataFrame) -> pd.DataFrame:
-        rules = self._config_repository.load_rules()
-        df = reclassify_dataframe(df, rules)
-        self.save_data(df)
-        return df
+    def reclassify_all(self, df: pd.DataFrame) -> tuple[pd.DataFrame, int]:
+        """
+        Reclassify rows not yet evaluated with the current rules.
+        Returns (updated_df, count_of_rows_whose_category_changed).
+        """
+        df, changed, evaluated = reclassify_outdated(
+            df,
+            self._config_repository.get_rule_matcher(),
+            workers=self._reclassify_settings.workers,
+            parallel_min_rows=self._reclassify_settings.parallel_min_rows,
+        )
+        if evaluated.any():
+            self.update_categories(df, evaluated)
+        return df, int(changed.sum())
+
+    def reclassify_rules_change(self, df: pd.DataFrame, diff: RulesDiff) -> tuple[pd.DataFrame, int]:
+        """Reclassify only the rows affected by ``diff`` and persist them."""
+        df, changed = reclassify_affected(
+            df,
+            diff,
+            workers=self._reclassify_settings.workers,
+            parallel_min_rows=self._reclassify_settings.parallel_min_rows,
+        )
+        if changed.any():
+            self.update_categories(df, changed)
+        return df, int(changed.sum())
 
     def _ensure_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
         """Ensure Data column is datetime even on empty DataFrames."""
@@ -61,7 +147,9 @@ class MongoTransactionsRepository:
             df["pluggy_id"] = None
         if "categoria_manual" not in df.columns:
             df["categoria_manual"] = False
-        return df
+        fill_amount_cents(df)
+        fill_transaction_ids(df)
+        return fill_normalized_descriptions(df)
 
     def _docs_to_dataframe(self, docs: list[dict]) -> pd.DataFrame:
         """Convert MongoDB documents to a DataFrame with correct types."""
@@ -80,19 +168,130 @@ class MongoTransactionsRepository:
     def _dataframe_to_docs(self, df: pd.DataFrame) -> list[dict]:
         """Convert DataFrame rows to MongoDB documents."""
         records = df.copy()
-        records["Data"] = records["Data"].dt.strftime("%Y-%m-%d %H:%M:%S")
+        # Stored as BSON dates; NaT has no BSON equivalent.
+        records["Data"] = records["Data"].astype(object).where(records["Data"].notna(), None)
         return records.to_dict(orient="records")
 
     def load_data(self) -> pd.DataFrame:
-        docs = list(self._col.find())
-        return self._docs_to_dataframe(docs)
+        with self._lock:
+            # Date order (served by the Data index) lets the scoped dedup skip its full pass.
+            docs = list(self._col.find().sort("Data", ASCENDING))
+            self._assign_missing_ids(docs)
+            df = self._docs_to_dataframe(docs)
+            self._snapshot = row_signatures(df)
+            return df
+
+    @staticmethod
+    def _filter_query(filters: TransactionFilter) -> dict:
+        query: dict = {}
+        date_range: dict = {}
+        if filters.date_from is not None:
+            date_range["$gte"] = datetime.combine(filters.date_from, datetime.min.time())
+        if filters.date_to is not None:
+            date_range["$lt"] = datetime.combine(filters.date_to + timedelta(days=1), datetime.min.time())
+        if date_range:
+            query["Data"] = date_range
+        if filters.categories:
+            query["Categoria"] = {"$in": list(filters.categories)}
+        if filters.sources:
+            query["Fonte"] = {"$in": list(filters.sources)}
+        return query
+
+    def _assign_missing_ids(self, docs: list[dict]) -> None:
+        """Persist a tx_id on documents stored before ids existed."""
+        operations = []
+        for doc in docs:
+            if not doc.get("tx_id"):
+                doc["tx_id"] = new_transaction_id()
+                operations.append(UpdateOne({"_id": doc["_id"]}, {"$set": {"tx_id": doc["tx_id"]}}))
+        if operations:
+            self._col.bulk_write(operations, ordered=False)
 
     def save_data(self, df: pd.DataFrame) -> None:
-        """Replace all transactions with the current DataFrame contents."""
-        docs = self._dataframe_to_docs(df)
-        self._col.delete_many({})
-        if docs:
-            self._col.insert_many(docs)
+        """Make the collection match ``df``, writing only rows changed since the last load/save.
+
+        Stale documents are deleted first, in chunks of ids, so the collection
+        is never observed empty. The upserts follow as one unordered bulk, so a
+        rejected row (e.g. a duplicate ``pluggy_id``) does not stop the rest.
+        Without a snapshot every row is upserted, and documents not present in
+        ``df`` are found by diffing against the stored ids.
+        """
+        with self._lock:
+            fill_amount_cents(df)
+            refresh_normalized_descriptions(df)
+            fill_transaction_ids(df)
+            signatures = row_signatures(df)
+
+            if self._snapshot is None:
+                changed = np.ones(len(df), dtype=bool)
+                current = set(df["tx_id"].tolist())
+                deleted = [
+                    doc["tx_id"]
+                    for doc in self._col.find({"tx_id": {"$exists": True}}, {"tx_id": 1, "_id": 0})
+                    if doc["tx_id"] not in current
+                ]
+            else:
+                inserted, updated, deleted = diff_signatures(self._snapshot, signatures)
+                changed = inserted | updated
+
+            for start in range(0, len(deleted), DELETE_CHUNK_SIZE):
+                self._col.delete_many({"tx_id": {"$in": deleted[start : start + DELETE_CHUNK_SIZE]}})
+
+            docs = self._dataframe_to_docs(df[changed])
+            operations = [ReplaceOne({"tx_id": doc["tx_id"]}, doc, upsert=True) for doc in docs]
+            try:
+                if operations:
+                    self._col.bulk_write(operations, ordered=False)
+            except BulkWriteError as exc:
+                errors = exc.details.get("writeErrors", [])
+                failed = [docs[error["index"]]["tx_id"] for error in errors]
+                # Leave the rejected rows out of the snapshot so the next save retries them.
+                self._snapshot = signatures.drop(failed, errors="ignore")
+                logger.error("%d of %d transaction writes failed: %s", len(errors), len(docs), errors[:5])
+                first = errors[0]["errmsg"] if errors else str(exc)
+                raise ValueError(f"{len(errors)} transações não foram gravadas no MongoDB: {first}") from exc
+            self._snapshot = signatures
+
+    def _refresh_snapshot(self, df: pd.DataFrame, rows, deleted: list[str] | None = None) -> None:
+        """Record targeted writes in the snapshot so the next save does not repeat them."""
+        with self._lock:
+            if self._snapshot is None:
+                return
+            signatures = row_signatures(df[rows])
+            kept = self._snapshot.drop(list(signatures.index) + (deleted or []), errors="ignore")
+            self._snapshot = pd.concat([kept, signatures])
+
+    def update_categories(self, df: pd.DataFrame, rows: pd.Series) -> None:
+        """Persist the classification of the selected rows with targeted updates."""
+        # Every loaded or saved row carries a tx_id (see _assign_missing_ids/fill_transaction_ids).
+        operations = [
+            UpdateOne(
+                {"tx_id": doc["tx_id"]},
+                {"$set": {"Categoria": doc["Categoria"], "regras_fp": doc.get("regras_fp")}},
+            )
+            for doc in self._dataframe_to_docs(df[rows])
+        ]
+        if operations:
+            self._col.bulk_write(operations, ordered=False)
+        self._refresh_snapshot(df, rows)
+
+    def update_transaction(self, df: pd.DataFrame, tx_id: str, fields: dict) -> pd.DataFrame:
+        """Apply ``fields`` to one transaction and update just that document."""
+        rows = apply_transaction_fields(df, [tx_id], fields)
+        if rows.any():
+            doc = self._dataframe_to_docs(df[rows])[0]
+            self._col.update_one({"tx_id": tx_id}, {"$set": doc}, upsert=True)
+            self._refresh_snapshot(df, rows)
+        return df
+
+    def delete_transactions(self, df: pd.DataFrame, tx_ids: list[str]) -> pd.DataFrame:
+        rows = df["tx_id"].isin(tx_ids).to_numpy()
+        deleted = df.loc[rows, "tx_id"].tolist()
+        if deleted:
+            self._col.delete_many({"tx_id": {"$in": deleted}})
+        df = df[~rows].reset_index(drop=True)
+        self._refresh_snapshot(df, np.zeros(len(df), dtype=bool), deleted)
+        return df
 
     def add_transaction(
         self,
@@ -112,6 +311,7 @@ class MongoTransactionsRepository:
         new_row = pd.DataFrame(
             [
                 {
+                    "tx_id": new_transaction_id(),
                     "Data": pd.to_datetime(transaction_date),
                     "Descrição": descricao,
                     "Valor": valor if tipo == "Entrada" else -abs(valor),
@@ -127,9 +327,8 @@ class MongoTransactionsRepository:
         return df
 
     def delete_transaction(self, df: pd.DataFrame, index: int) -> pd.DataFrame:
-        df = df.drop(index).reset_index(drop=True)
-        self.save_data(df)
-        return df
+        fill_transaction_ids(df)
+        return self.delete_transactions(df, [df.at[index, "tx_id"]])
 
     def get_real_expenses(self, df: pd.DataFrame) -> pd.DataFrame:
         categories = self._config_repository.get_real_expense_categories()
@@ -146,6 +345,41 @@ class MongoTransactionsRepository:
         expenses = self.get_real_expenses(df)
         return summarize_daily_expenses(expenses)
 
+    # --- Server-side aggregation ------------------------------------------
+    # Same output as summarize_expenses_by_category, computed by a $match/$group
+    # pipeline over integer cents so only the aggregated rows leave MongoDB.
+
+    def _real_expenses_pipeline(self, filters: TransactionFilter) -> list[dict]:
+        categories = sorted(self._config_repository.get_real_expense_categories())
+        return [
+            {"$match": self._filter_query(filters)},
+            {
+                "$addFields": {
+                    "_cents": {
+                        "$ifNull": ["$valor_centavos", {"$round": [{"$multiply": ["$Valor", 100]}, 0]}]
+                    }
+                }
+            },
+            {"$match": {"Categoria": {"$in": categories}, "_cents": {"$lt": 0}}},
+        ]
+
+    def aggregate_summary_by_category(self, filters: TransactionFilter) -> pd.DataFrame:
+        pipeline = self._real_expenses_pipeline(filters) + [
+            {"$group": {"_id": "$Categoria", "cents": {"$sum": "$_cents"}}},
+            {"$sort": {"cents": 1, "_id": 1}},
+        ]
+        rows = list(self._col.aggregate(pipeline))
+        if not rows:
+            return pd.DataFrame(columns=["Categoria", "Total", "Percentual"])
+        summary = pd.DataFrame(
+            {
+                "Categoria": [row["_id"] for row in rows],
+                "Total": [abs(row["cents"]) / 100 for row in rows],
+            }
+        )
+        summary["Percentual"] = summary["Total"] / summary["Total"].sum()
+        return summary
+
     def add_synced_transactions(
         self,
         df: pd.DataFrame,
@@ -154,53 +388,21 @@ class MongoTransactionsRepository:
         """
         Merge Pluggy transactions into the DataFrame.
         - Skips transactions whose pluggy_id already exists.
-        - If a manual entry (no pluggy_id) with same date and exact value exists,
-          links it to the Pluggy transaction instead of creating a duplicate.
+        - If a manual entry (no pluggy_id) with the same value exists within two
+          days, links it to the Pluggy transaction instead of creating a duplicate.
         Returns (updated_df, count_of_new_rows_added).
         """
         if not transactions:
             return df, 0
 
-        if "pluggy_id" not in df.columns:
-            df["pluggy_id"] = None
-
-        existing_ids = set(df["pluggy_id"].dropna().astype(str))
-        new_rows: list[dict] = []
-
-        linked_manual_indices: set[int] = set()
-
-        for tx in transactions:
-            if tx["pluggy_id"] in existing_ids:
-                continue
-
-            tx_date = pd.to_datetime(tx["Data"])
-            tx_valor = round(float(tx["Valor"]), 2)
-            date_lo = tx_date - timedelta(days=2)
-            date_hi = tx_date + timedelta(days=2)
-
-            manual_mask = (
-                df["pluggy_id"].isna()
-                & (df["Data"] >= date_lo)
-                & (df["Data"] <= date_hi)
-                & (df["Valor"].round(2) == tx_valor)
-                & ~df.index.isin(linked_manual_indices)
-            )
-            if manual_mask.any():
-                match_idx = df[manual_mask].index[0]
-                df.at[match_idx, "pluggy_id"] = tx["pluggy_id"]
-                existing_ids.add(tx["pluggy_id"])
-                linked_manual_indices.add(match_idx)
-            else:
-                new_rows.append(tx)
-                existing_ids.add(tx["pluggy_id"])
+        df, new_rows = link_synced_transactions(df, transactions)
 
         if new_rows:
             new_df = pd.DataFrame(new_rows)
             new_df["Data"] = pd.to_datetime(new_df["Data"])
-            df = pd.concat([df, new_df], ignore_index=True)
+            fill_transaction_ids(new_df)
+            df = merge_with_scoped_deduplication(df, new_df, self.deduplicate_cross_bank)
 
-        df = self.deduplicate_cross_bank(df)
-        df = df.sort_values("Data").reset_index(drop=True)
         self.save_data(df)
         return df, len(new_rows)
 
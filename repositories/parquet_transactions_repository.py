@@ -0,0 +1,99 @@
+import logging
+import os
+
+import pandas as pd
+
+from core.constants import JOURNAL_COMPACT_AFTER, TRANSACTION_COLUMNS
+from core.settings import ReclassifySettings
+from repositories.config_repository import ConfigRepository
+from repositories.transactions_repository import TransactionsRepository
+
+logger = logging.getLogger(__name__)
+
+# Low-cardinality text columns stored dictionary-encoded.
+CATEGORICAL_COLUMNS = ("Tipo", "Categoria", "Fonte")
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError(
+            "O armazenamento Parquet requer o pacote 'pyarrow' (pip install pyarrow)."
+        ) from exc
+    return pa, pq
+
+
+def _schema(pa):
+    category = pa.dictionary(pa.int32(), pa.string())
+    types = {
+        "tx_id": pa.string(),
+        "Data": pa.timestamp("us"),
+        "Descrição": pa.string(),
+        "Valor": pa.float64(),
+        "valor_centavos": pa.int64(),
+        "Tipo": category,
+        "Categoria": category,
+        "Fonte": category,
+        "pluggy_id": pa.string(),
+        "categoria_manual": pa.bool_(),
+        "descricao_norm": pa.string(),
+        "regras_fp": pa.string(),
+    }
+    return pa.schema([(column, types[column]) for column in TRANSACTION_COLUMNS])
+
+
+class ParquetTransactionsRepository(TransactionsRepository):
+    """Transactions stored in a typed Parquet file instead of CSV.
+
+    On first load, an existing CSV (``legacy_csv_file``) is migrated once;
+    the CSV itself is left in place as a backup.
+    """
+
+    def __init__(
+        self,
+        data_file: str,
+        config_repository: ConfigRepository,
+        reclassify_settings: ReclassifySettings | None = None,
+        legacy_csv_file: str | None = None,
+        journal_compact_after: int = JOURNAL_COMPACT_AFTER,
+    ):
+        super().__init__(data_file, config_repository, reclassify_settings, journal_compact_after)
+        self._legacy_csv_file = legacy_csv_file
+        self._pa, self._pq = _require_pyarrow()
+        self._schema = _schema(self._pa)
+
+    def load_data(self) -> pd.DataFrame:
+        with self._lock:
+            if not os.path.exists(self._data_file):
+                self._migrate_from_csv()
+            return super().load_data()
+
+    def _migrate_from_csv(self) -> None:
+        if not self._legacy_csv_file or not os.path.exists(self._legacy_csv_file):
+            return
+        legacy = TransactionsRepository(self._legacy_csv_file, self._config_repository)
+        # Read-only: the CSV (and its journal) stay untouched as a backup.
+        df, _ = legacy._read_current()
+        self.save_data(df)
+        logger.info("Migrated %d transactions from %s to %s", len(df), self._legacy_csv_file, self._data_file)
+
+    def _read_file(self) -> pd.DataFrame:
+        table = self._pq.read_table(self._data_file)
+        # Decode dictionary columns so edits can introduce new categories.
+        plain = self._pa.schema(
+            [
+                (field.name, field.type.value_type if self._pa.types.is_dictionary(field.type) else field.type)
+                for field in table.schema
+            ]
+        )
+        return table.cast(plain).to_pandas()
+
+    def _write_file(self, df: pd.DataFrame) -> None:
+        frame = df.reindex(columns=TRANSACTION_COLUMNS)
+        frame["categoria_manual"] = frame["categoria_manual"].fillna(False).astype(bool)
+        for column in ("tx_id", "Descrição", "pluggy_id", "descricao_norm", "regras_fp", *CATEGORICAL_COLUMNS):
+            frame[column] = frame[column].astype(object).where(frame[column].notna(), None)
+        table = self._pa.Table.from_pandas(frame, schema=self._schema, preserve_index=False)
+        self._pq.write_table(table, self._data_file)
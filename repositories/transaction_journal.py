@@ -0,0 +1,106 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from core.constants import TRANSACTION_COLUMNS
+from domain.identity import diff_signatures
+
+
+def _json_default(value):
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+class TransactionJournal:
+    """Append-only JSONL log of row changes keyed by ``tx_id``.
+
+    Each line is ``{"op": "insert" | "update" | "delete", "tx_id": ..., "row": {...}}``.
+    Replaying is idempotent, so a crash between compaction steps is harmless.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._count: int | None = None
+
+    def __len__(self) -> int:
+        if self._count is None:
+            self._count = len(self.read())
+        return self._count
+
+    def read(self) -> list[dict]:
+        if not os.path.exists(self._path):
+            self._count = 0
+            return []
+        entries = []
+        with open(self._path, "r", encoding="utf-8") as file:
+            for line in file:
+                line = line.strip()
+                if line:
+                    entries.append(json.loads(line))
+        self._count = len(entries)
+        return entries
+
+    def append(self, entries: list[dict]) -> None:
+        if not entries:
+            return
+        # Count what is already on disk before writing, or the new entries would be read back too.
+        count = len(self)
+        lines = "".join(json.dumps(entry, ensure_ascii=False, default=_json_default) + "\n" for entry in entries)
+        with open(self._path, "a", encoding="utf-8") as file:
+            file.write(lines)
+            file.flush()
+        self._count = count + len(entries)
+
+    def clear(self) -> None:
+        if os.path.exists(self._path):
+            os.remove(self._path)
+        self._count = 0
+
+
+def journal_rows(df: pd.DataFrame) -> list[dict]:
+    """Serialize rows to JSON-friendly dicts (dates as text, missing values as None)."""
+    frame = df.reindex(columns=TRANSACTION_COLUMNS).copy()
+    frame["Data"] = pd.to_datetime(frame["Data"]).dt.strftime("%Y-%m-%d %H:%M:%S")
+    frame = frame.astype(object).where(frame.notna(), None)
+    return frame.to_dict(orient="records")
+
+
+def diff_entries(previous: pd.Series, current: pd.Series, df: pd.DataFrame) -> list[dict]:
+    """Journal entries turning the ``previous`` signatures into ``df`` (signed as ``current``)."""
+    inserted, updated, deleted = diff_signatures(previous, current)
+    entries: list[dict] = [{"op": "delete", "tx_id": tx_id} for tx_id in deleted]
+    changed = inserted | updated
+    if changed.any():
+        ops = np.where(inserted[changed], "insert", "update")
+        for op, row in zip(ops, journal_rows(df[changed])):
+            entries.append({"op": str(op), "tx_id": row["tx_id"], "row": row})
+    return entries
+
+
+def replay_journal(df: pd.DataFrame, entries: list[dict]) -> pd.DataFrame:
+    """Apply journal entries on top of the base file contents."""
+    if not entries:
+        return df
+    if "tx_id" not in df.columns:
+        df["tx_id"] = None
+
+    upserts: dict[str, dict] = {}
+    deleted: set[str] = set()
+    for entry in entries:
+        tx_id = entry["tx_id"]
+        if entry["op"] == "delete":
+            upserts.pop(tx_id, None)
+            deleted.add(tx_id)
+        else:
+            upserts[tx_id] = entry["row"]
+            deleted.discard(tx_id)
+
+    df = df[~df["tx_id"].isin(deleted | upserts.keys())]
+    if upserts:
+        rows = pd.DataFrame(list(upserts.values()))
+        rows["Data"] = pd.to_datetime(rows["Data"])
+        df = pd.concat([df, rows], ignore_index=True) if len(df) else rows
+    return df.sort_values("Data", kind="stable").reset_index(drop=True)
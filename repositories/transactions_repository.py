@@ -1,48 +1,95 @@
 import os
-from datetime import timedelta
+import threading
 
+import numpy as np
 import pandas as pd
 
-from core.constants import CROSS_BANK_CATEGORIES, TRANSACTION_COLUMNS
+from core.constants import CROSS_BANK_CATEGORIES, JOURNAL_COMPACT_AFTER, TRANSACTION_COLUMNS
+from core.models import TransactionFilter
+from core.settings import ReclassifySettings
 from domain.analytics import (
     filter_real_expenses,
+    filter_transactions,
     summarize_by_source,
     summarize_daily_expenses,
     summarize_expenses_by_category,
 )
 from domain.classification import (
+    RulesDiff,
     classify_description,
-    classify_exact_description,
+    fill_normalized_descriptions,
     normalize_text,
-    reclassify_dataframe,
+    reclassify_affected,
+    reclassify_outdated,
+    refresh_normalized_descriptions,
 )
-from domain.deduplication import deduplicate_cross_bank_transactions
+from domain.deduplication import deduplicate_cross_bank_transactions, merge_with_scoped_deduplication
+from domain.identity import apply_transaction_fields, fill_transaction_ids, new_transaction_id, row_signatures
+from domain.linking import link_synced_transactions
+from domain.money import amount_cents, fill_amount_cents
 from repositories.config_repository import ConfigRepository
+from repositories.transaction_journal import (
+    TransactionJournal,
+    diff_entries,
+    journal_rows,
+    replay_journal,
+)
 
 COLUMNS = TRANSACTION_COLUMNS
 
 
 class TransactionsRepository:
-    def __init__(self, data_file: str, config_repository: ConfigRepository):
+    def __init__(
+        self,
+        data_file: str,
+        config_repository: ConfigRepository,
+        reclassify_settings: ReclassifySettings | None = None,
+        journal_compact_after: int = JOURNAL_COMPACT_AFTER,
+    ):
         self._data_file = data_file
         self._config_repository = config_repository
+        self._reclassify_settings = reclassify_settings or ReclassifySettings()
+        self._journal = TransactionJournal(f"{data_file}.journal")
+        self._journal_compact_after = journal_compact_after
+        # Row signatures of what is persisted (base file + journal), by tx_id.
+        self._signatures: pd.Series | None = None
+        # The repository is shared by every Streamlit session (see get_services).
+        self._lock = threading.RLock()
 
     def _normalize(self, text: str) -> str:
         return normalize_text(text)
 
     def classify(self, description: str, rules: dict | None = None) -> str | None:
         if rules is None:
-            rules = self._config_repository.load_rules()
+            return self._config_repository.get_rule_matcher().classify(description)
         return classify_description(description, rules)
 
-    def _classify_exact(self, description: str, rules: dict) -> str | None:
-        return classify_exact_description(description, rules)
-
-    def reclassify_all(self, df: pd.DataFrame) -> pd.DataFrame:
-        rules = self._config_repository.load_rules()
-        df = reclassify_dataframe(df, rules)
-        self.save_data(df)
-        return df
+    def reclassify_all(self, df: pd.DataFrame) -> tuple[pd.DataFrame, int]:
+        """
+        Reclassify rows not yet evaluated with the current rules.
+        Returns (updated_df, count_of_rows_whose_category_changed).
+        """
+        df, changed, evaluated = reclassify_outdated(
+            df,
+            self._config_repository.get_rule_matcher(),
+            workers=self._reclassify_settings.workers,
+            parallel_min_rows=self._reclassify_settings.parallel_min_rows,
+        )
+        if evaluated.any():
+            self.update_categories(df, evaluated)
+        return df, int(changed.sum())
+
+    def reclassify_rules_change(self, df: pd.DataFrame, diff: RulesDiff) -> tuple[pd.DataFrame, int]:
+        """Reclassify only the rows affected by ``diff`` and persist them."""
+        df, changed = reclassify_affected(
+            df,
+            diff,
+            workers=self._reclassify_settings.workers,
+            parallel_min_rows=self._reclassify_settings.parallel_min_rows,
+        )
+        if changed.any():
+            self.update_categories(df, changed)
+        return df, int(changed.sum())
 
     def _ensure_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
         """Ensure Data column is datetime even on empty DataFrames."""
@@ -52,20 +99,105 @@ class TransactionsRepository:
             df["pluggy_id"] = None
         if "categoria_manual" not in df.columns:
             df["categoria_manual"] = False
-        return df
+        fill_amount_cents(df)
+        fill_transaction_ids(df)
+        return fill_normalized_descriptions(df)
+
+    def _read_file(self) -> pd.DataFrame:
+        return pd.read_csv(self._data_file, parse_dates=["Data"])
+
+    def _write_file(self, df: pd.DataFrame) -> None:
+        df.to_csv(self._data_file, index=False)
+
+    def _read_current(self) -> tuple[pd.DataFrame, bool]:
+        """Base file with the journal replayed, without writing anything back.
+
+        Also reports whether the base file already stored an id for every row.
+        """
+        df = self._read_file()
+        has_ids = "tx_id" in df.columns and df["tx_id"].notna().all()
+        df = replay_journal(df, self._journal.read())
+        return self._ensure_dtypes(df), has_ids
 
     def load_data(self) -> pd.DataFrame:
-        if os.path.exists(self._data_file):
-            df = pd.read_csv(self._data_file, parse_dates=["Data"])
-            return self._ensure_dtypes(df)
-        # First run: create empty CSV
-        df = pd.DataFrame(columns=COLUMNS)
-        df["Data"] = pd.to_datetime(df["Data"])
-        self.save_data(df)
-        return df
+        with self._lock:
+            if os.path.exists(self._data_file):
+                df, has_ids = self._read_current()
+                if not has_ids or len(self._journal) >= self._journal_compact_after:
+                    # Legacy files get their new ids persisted before anything is journaled.
+                    self.compact(df)
+                else:
+                    self._signatures = row_signatures(df)
+                return df
+            # First run: create empty file
+            df = pd.DataFrame(columns=COLUMNS)
+            df["Data"] = pd.to_datetime(df["Data"])
+            self.save_data(df)
+            return df
 
     def save_data(self, df: pd.DataFrame) -> None:
-        df.to_csv(self._data_file, index=False)
+        """Persist ``df``, journaling only the rows that changed since the last load/save."""
+        with self._lock:
+            fill_amount_cents(df)
+            refresh_normalized_descriptions(df)
+            fill_transaction_ids(df)
+            if self._signatures is None or not os.path.exists(self._data_file):
+                self.compact(df)
+                return
+
+            signatures = row_signatures(df)
+            if not signatures.index.is_unique:
+                self.compact(df)
+                return
+            self._journal.append(diff_entries(self._signatures, signatures, df))
+            self._signatures = signatures
+            if len(self._journal) >= self._journal_compact_after:
+                self.compact(df)
+
+    def compact(self, df: pd.DataFrame) -> None:
+        """Fold the journal into the base file by rewriting it from ``df``."""
+        with self._lock:
+            fill_transaction_ids(df)
+            self._write_file(df)
+            self._journal.clear()
+            self._signatures = row_signatures(df)
+
+    def _journal_changes(self, df: pd.DataFrame, updated: np.ndarray, deleted: list[str] | None = None) -> None:
+        """Journal explicit row changes without diffing the whole frame."""
+        with self._lock:
+            if self._signatures is None or not os.path.exists(self._data_file):
+                self.compact(df)
+                return
+            deleted = deleted or []
+            changed = df[updated]
+            entries: list[dict] = [{"op": "delete", "tx_id": tx_id} for tx_id in deleted]
+            entries += [{"op": "update", "tx_id": row["tx_id"], "row": row} for row in journal_rows(changed)]
+            self._journal.append(entries)
+
+            signatures = row_signatures(changed)
+            kept = self._signatures.drop(list(signatures.index) + deleted, errors="ignore")
+            self._signatures = pd.concat([kept, signatures])
+            if len(self._journal) >= self._journal_compact_after:
+                self.compact(df)
+
+    def update_categories(self, df: pd.DataFrame, rows: pd.Series) -> None:
+        """Persist the classification of the selected rows as journal updates."""
+        self._journal_changes(df, rows.to_numpy(dtype=bool))
+
+    def update_transaction(self, df: pd.DataFrame, tx_id: str, fields: dict) -> pd.DataFrame:
+        """Apply ``fields`` to one transaction and journal just that row."""
+        rows = apply_transaction_fields(df, [tx_id], fields)
+        if rows.any():
+            self._journal_changes(df, rows)
+        return df
+
+    def delete_transactions(self, df: pd.DataFrame, tx_ids: list[str]) -> pd.DataFrame:
+        rows = df["tx_id"].isin(tx_ids).to_numpy()
+        deleted = df.loc[rows, "tx_id"].tolist()
+        df = df[~rows].reset_index(drop=True)
+        if deleted:
+            self._journal_changes(df, np.zeros(len(df), dtype=bool), deleted)
+        return df
 
     def add_transaction(
         self,
@@ -85,6 +217,7 @@ class TransactionsRepository:
         new_row = pd.DataFrame(
             [
                 {
+                    "tx_id": new_transaction_id(),
                     "Data": pd.to_datetime(transaction_date),
                     "Descrição": descricao,
                     "Valor": valor if tipo == "Entrada" else -abs(valor),
@@ -100,9 +233,8 @@ class TransactionsRepository:
         return df
 
     def delete_transaction(self, df: pd.DataFrame, index: int) -> pd.DataFrame:
-        df = df.drop(index).reset_index(drop=True)
-        self.save_data(df)
-        return df
+        fill_transaction_ids(df)
+        return self.delete_transactions(df, [df.at[index, "tx_id"]])
 
     def get_real_expenses(self, df: pd.DataFrame) -> pd.DataFrame:
         categories = self._config_repository.get_real_expense_categories()
@@ -119,6 +251,9 @@ class TransactionsRepository:
         expenses = self.get_real_expenses(df)
         return summarize_daily_expenses(expenses)
 
+    def aggregate_summary_by_category(self, filters: TransactionFilter) -> pd.DataFrame:
+        return self.get_summary_by_category(filter_transactions(self.load_data(), filters))
+
     def add_synced_transactions(
         self,
         df: pd.DataFrame,
@@ -127,57 +262,28 @@ class TransactionsRepository:
         """
         Merge Pluggy transactions into the DataFrame.
         - Skips transactions whose pluggy_id already exists.
-        - If a manual entry (no pluggy_id) with same date and exact value exists,
-          links it to the Pluggy transaction instead of creating a duplicate.
+        - If a manual entry (no pluggy_id) with the same value exists within two
+          days, links it to the Pluggy transaction instead of creating a duplicate.
         Returns (updated_df, count_of_new_rows_added).
         """
         if not transactions:
             return df, 0
 
-        if "pluggy_id" not in df.columns:
-            df["pluggy_id"] = None
-
-        existing_ids = set(df["pluggy_id"].dropna().astype(str))
-        new_rows: list[dict] = []
-
-        linked_manual_indices: set[int] = set()
-
-        for tx in transactions:
-            if tx["pluggy_id"] in existing_ids:
-                continue
-
-            tx_date = pd.to_datetime(tx["Data"])
-            tx_valor = round(float(tx["Valor"]), 2)
-            date_lo = tx_date - timedelta(days=2)
-            date_hi = tx_date + timedelta(days=2)
-
-            manual_mask = (
-                df["pluggy_id"].isna()
-                & (df["Data"] >= date_lo)
-                & (df["Data"] <= date_hi)
-                & (df["Valor"].round(2) == tx_valor)
-                & ~df.index.isin(linked_manual_indices)
-            )
-            if manual_mask.any():
-                match_idx = df[manual_mask].index[0]
-                df.at[match_idx, "pluggy_id"] = tx["pluggy_id"]
-                existing_ids.add(tx["pluggy_id"])
-                linked_manual_indices.add(match_idx)
-            else:
-                new_rows.append(tx)
-                existing_ids.add(tx["pluggy_id"])
+        df, new_rows = link_synced_transactions(df, transactions)
 
         if new_rows:
             new_df = pd.DataFrame(new_rows)
             new_df["Data"] = pd.to_datetime(new_df["Data"])
-            df = pd.concat([df, new_df], ignore_index=True)
+            fill_transaction_ids(new_df)
+            df = merge_with_scoped_deduplication(df, new_df, self._deduplicate_synced)
 
-        df = self._deduplicate_same_transaction(df)
-        df = self.deduplicate_cross_bank(df)
-        df = df.sort_values("Data").reset_index(drop=True)
         self.save_data(df)
         return df, len(new_rows)
 
+    def _deduplicate_synced(self, df: pd.DataFrame) -> pd.DataFrame:
+        df = self._deduplicate_same_transaction(df)
+        return self.deduplicate_cross_bank(df)
+
     @staticmethod
     def _deduplicate_same_transaction(df: pd.DataFrame) -> pd.DataFrame:
         """Remove duplicates: same date, same value, same type (Entrada/Saída).
@@ -189,12 +295,12 @@ class TransactionsRepository:
 
         df = df.copy()
         df["_date_str"] = df["Data"].dt.strftime("%Y-%m-%d")
-        df["_val_round"] = df["Valor"].round(2)
+        df["_val_cents"] = amount_cents(df)
         # Sort so rows WITH pluggy_id come first (kept by drop_duplicates)
         df["_has_pid"] = df["pluggy_id"].notna()
-        df = df.sort_values("_has_pid", ascending=False)
-        df = df.drop_duplicates(subset=["_date_str", "_val_round", "Tipo"], keep="first")
-        df = df.drop(columns=["_date_str", "_val_round", "_has_pid"])
+        df = df.sort_values("_has_pid", ascending=False, kind="stable")
+        df = df.drop_duplicates(subset=["_date_str", "_val_cents", "Tipo"], keep="first")
+        df = df.drop(columns=["_date_str", "_val_cents", "_has_pid"])
         return df.reset_index(drop=True)
 
     def deduplicate_cross_bank(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -1,12 +1,14 @@
+import threading
 from datetime import date
 from io import BytesIO
 from typing import Sequence
 
 import pandas as pd
 
-from core.constants import CATEGORY_INVESTMENTS, CATEGORY_SALARY, CATEGORY_SUBSCRIPTIONS
-from core.models import FinanceKpis
-from ports import BankingPort, RulesDataPort, TransactionsDataPort
+from core.constants import CATEGORY_INVESTMENTS, CATEGORY_SALARY, CATEGORY_SUBSCRIPTIONS, INTERNAL_COLUMNS
+from core.models import ClassificationCacheStats, FinanceKpis, TransactionFilter
+from domain.analytics import filter_transactions
+from ports import BankingPort, ClassificationCachePort, RulesDataPort, TransactionsDataPort
 
 
 class FinanceService:
@@ -15,10 +17,20 @@ class FinanceService:
         transactions: TransactionsDataPort,
         rules: RulesDataPort,
         banking: BankingPort,
+        classification_cache: ClassificationCachePort | None = None,
     ):
         self._transactions = transactions
         self._rules = rules
         self._banking = banking
+        self._classification_cache = classification_cache
+        # The service is shared by every Streamlit session, and each session runs
+        # its script on its own thread: keep per-sync results thread-local.
+        self._local = threading.local()
+
+    @property
+    def last_classification_stats(self) -> ClassificationCacheStats:
+        """Classification cache hits/misses of the most recent sync on this thread."""
+        return getattr(self._local, "classification_stats", ClassificationCacheStats(hits=0, misses=0))
 
     def load_dataframe(self) -> pd.DataFrame:
         return self._transactions.load_dataframe()
@@ -39,17 +51,25 @@ class FinanceService:
         categories: list[str],
         fontes: list[str],
     ) -> pd.DataFrame:
-        filtered = df.copy()
-        if len(date_range) == 2:
-            filtered = filtered[
-                (filtered["Data"].dt.date >= date_range[0])
-                & (filtered["Data"].dt.date <= date_range[1])
-            ]
-        if categories:
-            filtered = filtered[filtered["Categoria"].isin(categories)]
-        if fontes:
-            filtered = filtered[filtered["Fonte"].isin(fontes)]
-        return filtered
+        return filter_transactions(df, self.build_filter(date_range, categories, fontes))
+
+    def apply_selection(self, df: pd.DataFrame, filters: TransactionFilter) -> pd.DataFrame:
+        """Dashboard view of the selection, filtered from the session frame in memory."""
+        return filter_transactions(df, filters)
+
+    @staticmethod
+    def build_filter(
+        date_range: Sequence[date],
+        categories: list[str],
+        fontes: list[str],
+    ) -> TransactionFilter:
+        date_from, date_to = date_range if len(date_range) == 2 else (None, None)
+        return TransactionFilter(
+            date_from=date_from,
+            date_to=date_to,
+            categories=tuple(categories or ()),
+            sources=tuple(fontes or ()),
+        )
 
     def calculate_kpis(self, filtered_df: pd.DataFrame) -> FinanceKpis:
         real_expenses = self._transactions.get_real_expenses(filtered_df)
@@ -71,11 +91,31 @@ class FinanceService:
         sync_to: date,
     ) -> tuple[pd.DataFrame, int]:
         rules = self._rules.load_rules()
+        rules_version = ""
+        categories: dict[str, str | None] = {}
+        if self._classification_cache is not None:
+            rules_version = self._rules.get_rules_version()
+            categories = self._classification_cache.load_classifications(rules_version)
+        hits = misses = 0
+
+        def categorize(description: str) -> str | None:
+            # Bank feeds repeat merchant strings; classify each distinct one once.
+            nonlocal hits, misses
+            if description in categories:
+                hits += 1
+            else:
+                misses += 1
+                categories[description] = self._rules.classify(description, rules)
+            return categories[description]
+
         transactions = self._banking.sync_all(
             date_from=sync_from.strftime("%Y-%m-%d"),
             date_to=sync_to.strftime("%Y-%m-%d"),
-            categorize=lambda description: self._rules.classify(description, rules),
+            categorize=categorize,
         )
+        self._local.classification_stats = ClassificationCacheStats(hits=hits, misses=misses)
+        if self._classification_cache is not None and misses:
+            self._classification_cache.save_classifications(rules_version, categories)
         return self._transactions.add_synced_transactions(df, transactions)
 
     def fetch_account_balances(self) -> list[dict]:
@@ -126,7 +166,18 @@ class FinanceService:
         grouped["Saldo Estimado"] = grouped["Aportes"] - grouped["Resgates"]
         return grouped.sort_values("Saldo Estimado", ascending=False)
 
-    def get_summary_by_category(self, df: pd.DataFrame) -> pd.DataFrame:
+    def get_summary_by_category(
+        self,
+        df: pd.DataFrame | None,
+        filters: TransactionFilter | None = None,
+    ) -> pd.DataFrame:
+        """Expenses by category of ``df``.
+
+        Without a loaded frame, the backend aggregates the selection itself
+        (MongoDB through a $group pipeline).
+        """
+        if df is None:
+            return self._transactions.aggregate_summary_by_category(filters or TransactionFilter())
         return self._transactions.get_summary_by_category(df)
 
     def get_summary_by_fonte(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -136,7 +187,7 @@ class FinanceService:
         return self._transactions.get_daily_expenses(df)
 
     def get_export_columns(self, df: pd.DataFrame) -> list[str]:
-        return [column for column in df.columns if column != "pluggy_id"]
+        return [column for column in df.columns if column not in INTERNAL_COLUMNS]
 
     def build_csv_export(self, df: pd.DataFrame) -> bytes:
         export_columns = self.get_export_columns(df)
@@ -172,8 +223,11 @@ class FinanceService:
             source=source,
         )
 
-    def delete_manual_transaction(self, df: pd.DataFrame, index: int) -> pd.DataFrame:
-        return self._transactions.delete_manual_transaction(df, index)
+    def update_transaction(self, df: pd.DataFrame, tx_id: str, fields: dict) -> pd.DataFrame:
+        return self._transactions.update_transaction(df, tx_id, fields)
+
+    def delete_transactions(self, df: pd.DataFrame, tx_ids: list[str]) -> pd.DataFrame:
+        return self._transactions.delete_transactions(df, tx_ids)
 
     def load_rules(self) -> dict:
         return self._rules.load_rules()
@@ -184,7 +238,32 @@ class FinanceService:
     def remove_rule(self, keyword: str) -> dict:
         return self._rules.remove_rule(keyword)
 
-    def reclassify_all(self, df: pd.DataFrame) -> pd.DataFrame:
+    def add_rule_and_reclassify(
+        self,
+        df: pd.DataFrame,
+        keyword: str,
+        category: str,
+    ) -> tuple[pd.DataFrame, int]:
+        return self._rules.add_rule_and_reclassify(df, keyword, category)
+
+    def remove_rule_and_reclassify(self, df: pd.DataFrame, keyword: str) -> tuple[pd.DataFrame, int]:
+        return self._rules.remove_rule_and_reclassify(df, keyword)
+
+    def apply_category_to_description(
+        self,
+        df: pd.DataFrame,
+        description: str,
+        category: str,
+    ) -> pd.DataFrame:
+        """Create an exact rule for ``description`` and recategorize every row that has it."""
+        df, _ = self._rules.add_rule_and_reclassify(df, description, category)
+        pending = (df["Descrição"] == description) & (df["Categoria"] != category)
+        if pending.any():
+            df.loc[pending, "Categoria"] = category
+            self._transactions.save_categories(df, pending)
+        return df
+
+    def reclassify_all(self, df: pd.DataFrame) -> tuple[pd.DataFrame, int]:
         return self._rules.reclassify_all(df)
 
     def classify(self, description: str) -> str | None:
@@ -0,0 +1,32 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from application import bootstrap
+
+
+class SeedMongoTransactionsTestCase(unittest.TestCase):
+    def test_seeding_leaves_a_legacy_csv_untouched(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = os.path.join(tmp, "transacoes.csv")
+            with open(csv_path, "w", encoding="utf-8") as f:
+                f.write("Data,Descrição,Valor,Tipo,Categoria,Fonte\n2026-01-05,Padaria,-12.5,Saída,Outros,Nubank\n")
+            with open(csv_path, "rb") as f:
+                original = f.read()
+            mongo_repository = mock.MagicMock()
+            mongo_repository._col.count_documents.return_value = 0
+
+            with mock.patch.object(bootstrap, "RULES_FILE", os.path.join(tmp, "regras.json")):
+                bootstrap._seed_mongo_transactions_from_csv(mongo_repository, csv_path)
+
+            with open(csv_path, "rb") as f:
+                self.assertEqual(f.read(), original)
+            self.assertFalse(os.path.exists(f"{csv_path}.journal"))
+
+        seeded = mongo_repository.save_data.call_args.args[0]
+        self.assertEqual(seeded["Descrição"].tolist(), ["Padaria"])
+
+
+if __name__ == "__main__":
+    unittest.main()
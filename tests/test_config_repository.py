@@ -0,0 +1,42 @@
+import json
+import os
+import tempfile
+import unittest
+
+from repositories.config_repository import ConfigRepository
+
+
+class ConfigRepositoryRulesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpfile = tempfile.NamedTemporaryFile(
+            mode="w", suffix=".json", delete=False, encoding="utf-8"
+        )
+        self.tmpfile.write(json.dumps({"categorias": {}, "regras": {"uber": "Transporte"}}))
+        self.tmpfile.close()
+        self.repository = ConfigRepository(self.tmpfile.name)
+
+    def tearDown(self):
+        os.unlink(self.tmpfile.name)
+
+    def test_set_rule_reports_added_and_changed_keywords(self):
+        added = self.repository.set_rule("  IFood ", "Delivery")
+        changed = self.repository.set_rule("uber", "Viagem")
+
+        self.assertEqual(added.added, {"ifood": "Delivery"})
+        self.assertEqual(changed.changed, {"uber": "Viagem"})
+        self.assertEqual(changed.rules, {"uber": "Viagem", "ifood": "Delivery"})
+
+    def test_delete_rule_reports_removed_keyword(self):
+        diff = self.repository.delete_rule("uber")
+
+        self.assertEqual(diff.removed, {"uber": "Transporte"})
+        self.assertEqual(self.repository.load_rules(), {})
+
+    def test_saving_identical_rules_yields_empty_diff(self):
+        diff = self.repository.set_rule("uber", "Transporte")
+
+        self.assertTrue(diff.is_empty)
+
+
+if __name__ == "__main__":
+    unittest.main()
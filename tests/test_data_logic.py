@@ -2,8 +2,17 @@ import unittest
 
 import pandas as pd
 
-from domain.classification import classify_description
-from domain.deduplication import deduplicate_cross_bank_transactions
+from domain.classification import (
+    classify_description,
+    compile_rules,
+    diff_rules,
+    fill_normalized_descriptions,
+    reclassify_affected,
+    reclassify_dataframe,
+    reclassify_outdated,
+)
+from domain.deduplication import deduplicate_cross_bank_transactions, merge_with_scoped_deduplication
+from domain.linking import link_synced_transactions
 from core.constants import CROSS_BANK_CATEGORIES
 
 
@@ -18,6 +27,110 @@ class DataLogicTestCase(unittest.TestCase):
 
         self.assertEqual(category, "Investimentos")
 
+    def test_compiled_matcher_ignores_accents_and_overlapping_keywords(self):
+        rules = {
+            "pao": "Padaria",
+            "pão de açúcar": "Supermercado",
+            "uber": "Transporte",
+            "uber eats": "Delivery",
+        }
+
+        matcher = compile_rules(rules)
+
+        self.assertEqual(matcher.classify("PAO DE ACUCAR  Loja 12"), "Supermercado")
+        self.assertEqual(matcher.classify("Padaria do pão"), "Padaria")
+        self.assertEqual(matcher.classify("Uber *Eats pending"), "Transporte")
+        self.assertEqual(matcher.classify("UBER EATS"), "Delivery")
+        self.assertIsNone(matcher.classify("Farmácia"))
+        self.assertEqual(matcher.classify_exact("Pão de Açúcar"), "Supermercado")
+
+    def test_compile_rules_reuses_matcher_until_rules_change(self):
+        rules = {"uber": "Transporte"}
+
+        first = compile_rules(rules)
+        self.assertIs(compile_rules(dict(rules)), first)
+
+        rules["ifood"] = "Delivery"
+        self.assertIsNot(compile_rules(rules), first)
+
+    def test_fill_normalized_descriptions_keeps_stored_values(self):
+        df = pd.DataFrame(
+            {
+                "Descrição": ["Pão  de Açúcar", "UBER", "Uber"],
+                "descricao_norm": ["stored", None, None],
+            }
+        )
+
+        result = fill_normalized_descriptions(df)
+
+        self.assertEqual(result["descricao_norm"].tolist(), ["stored", "uber", "uber"])
+
+    def test_reclassify_dataframe_respects_manual_and_internal_categories(self):
+        df = pd.DataFrame(
+            [
+                {"Descrição": "Uber Trip", "Categoria": "Outros", "categoria_manual": False},
+                {"Descrição": "Uber Trip", "Categoria": "Lazer", "categoria_manual": True},
+                {"Descrição": "Uber Trip", "Categoria": "Fatura", "categoria_manual": None},
+                {"Descrição": "Pagamento fatura", "Categoria": "Fatura", "categoria_manual": False},
+                {"Descrição": "Mercado", "Categoria": "Outros", "categoria_manual": None},
+            ]
+        )
+        rules = {"uber": "Transporte", "pagamento fatura": "Pagamento Cartão"}
+
+        result = reclassify_dataframe(df, rules)
+
+        self.assertEqual(
+            result["Categoria"].tolist(),
+            ["Transporte", "Lazer", "Fatura", "Pagamento Cartão", "Outros"],
+        )
+
+    def test_reclassify_affected_touches_only_rows_matching_changed_keywords(self):
+        df = pd.DataFrame(
+            [
+                {"Descrição": "Uber Trip", "Categoria": "Outros"},
+                {"Descrição": "Ifood *Pizza", "Categoria": "Outros"},
+                {"Descrição": "Padaria Pão Quente", "Categoria": "Outros"},
+            ]
+        )
+        diff = diff_rules({"ifood": "Delivery"}, {"ifood": "Restaurante", "uber": "Transporte"})
+
+        result, changed = reclassify_affected(df, diff)
+
+        self.assertEqual(result["Categoria"].tolist(), ["Transporte", "Restaurante", "Outros"])
+        self.assertEqual(changed.tolist(), [True, True, False])
+        self.assertEqual(diff.added, {"uber": "Transporte"})
+        self.assertEqual(diff.changed, {"ifood": "Restaurante"})
+        self.assertEqual(diff.removed, {})
+
+    def test_reclassify_dataframe_parallel_matches_serial_result(self):
+        descriptions = ["Uber Trip", "Ifood *Pizza", "Padaria", "Uber Eats", "Mercado"] * 40
+        df = pd.DataFrame({"Descrição": descriptions, "Categoria": "Outros"})
+        rules = {"uber": "Transporte", "uber eats": "Delivery", "ifood": "Delivery"}
+
+        serial = reclassify_dataframe(df.copy(), rules)
+        parallel = reclassify_dataframe(df.copy(), rules, workers=2, parallel_min_rows=0)
+
+        self.assertEqual(parallel["Categoria"].tolist(), serial["Categoria"].tolist())
+
+    def test_reclassify_outdated_skips_rows_stamped_with_current_rules(self):
+        df = pd.DataFrame(
+            [
+                {"Descrição": "Uber Trip", "Categoria": "Outros", "categoria_manual": False},
+                {"Descrição": "Ifood", "Categoria": "Outros", "categoria_manual": False},
+            ]
+        )
+
+        df, changed, evaluated = reclassify_outdated(df, {"uber": "Transporte"})
+        self.assertEqual(changed.tolist(), [True, False])
+        self.assertEqual(evaluated.tolist(), [True, True])
+
+        df, changed, evaluated = reclassify_outdated(df, {"uber": "Transporte"})
+        self.assertFalse(evaluated.any())
+
+        df, changed, evaluated = reclassify_outdated(df, {"uber": "Transporte", "ifood": "Delivery"})
+        self.assertEqual(changed.tolist(), [False, True])
+        self.assertEqual(df["Categoria"].tolist(), ["Transporte", "Delivery"])
+
     def test_deduplicate_cross_bank_removes_only_internal_duplicates(self):
         df = pd.DataFrame(
             [
@@ -58,6 +171,74 @@ class DataLogicTestCase(unittest.TestCase):
         self.assertNotIn("_date_str", deduped.columns)
         self.assertNotIn("_abs_val", deduped.columns)
 
+    def test_deduplicate_cross_bank_keeps_first_by_day_and_cents(self):
+        df = pd.DataFrame(
+            {
+                "Data": pd.to_datetime(
+                    ["2026-02-10 09:00", "2026-02-10 18:30", "2026-02-11 00:00", "2026-02-10 00:00", "2026-02-10 00:00"]
+                ),
+                "Valor": [-0.3, 0.1 + 0.2, -0.3, None, None],
+                "Categoria": ["Transferência Entre Contas"] * 5,
+                "Fonte": ["Nubank", "Santander", "Nubank", "Nubank", "Santander"],
+            },
+            index=[10, 11, 12, 13, 14],
+        )
+
+        deduped = deduplicate_cross_bank_transactions(df, CROSS_BANK_CATEGORIES)
+
+        self.assertEqual(deduped["Fonte"].tolist(), ["Nubank", "Nubank", "Nubank", "Santander"])
+        self.assertEqual(deduped.index.tolist(), [0, 1, 2, 3])
+
+    def test_link_synced_transactions_claims_first_manual_row_once(self):
+        df = pd.DataFrame(
+            {
+                "Data": pd.to_datetime(["2026-03-01", "2026-03-04", "2026-03-02", "2026-03-02"]),
+                "Valor": [-45.9, -45.9, -45.9, -12.0],
+                "pluggy_id": [None, None, "old", None],
+            },
+            index=[7, 3, 5, 9],
+        )
+        transactions = [
+            {"pluggy_id": "old", "Data": "2026-03-02", "Valor": -45.9},
+            {"pluggy_id": "a", "Data": "2026-03-03", "Valor": -45.9},
+            {"pluggy_id": "b", "Data": "2026-03-03", "Valor": -45.9},
+            {"pluggy_id": "c", "Data": "2026-03-03", "Valor": -45.9},
+            {"pluggy_id": "d", "Data": "2026-03-06", "Valor": -12.0},
+        ]
+
+        df, new_rows = link_synced_transactions(df, transactions)
+
+        self.assertEqual(df["pluggy_id"].iloc[:3].tolist(), ["a", "b", "old"])
+        self.assertTrue(pd.isna(df.at[9, "pluggy_id"]))
+        self.assertEqual([tx["pluggy_id"] for tx in new_rows], ["c", "d"])
+
+    def test_scoped_deduplication_only_touches_days_of_new_rows(self):
+        history = pd.DataFrame(
+            {
+                "Data": pd.to_datetime(["2026-01-05", "2026-01-05", "2026-03-01", "2026-03-09"]),
+                "Valor": [-100.0, 100.0, -20.0, -7.0],
+                "Categoria": ["Transferência Entre Contas"] * 2 + ["Alimentação"] * 2,
+            }
+        )
+        new_rows = pd.DataFrame(
+            {
+                "Data": pd.to_datetime(["2026-03-01 12:00", "2026-03-03 00:00"]),
+                "Valor": [20.0, -20.0],
+                "Categoria": ["Transferência Entre Contas"] * 2,
+            }
+        )
+        calls: list[int] = []
+
+        def deduplicate(frame: pd.DataFrame) -> pd.DataFrame:
+            calls.append(len(frame))
+            return deduplicate_cross_bank_transactions(frame, CROSS_BANK_CATEGORIES)
+
+        merged = merge_with_scoped_deduplication(history, new_rows, deduplicate)
+
+        self.assertEqual(calls, [3])
+        self.assertEqual(merged["Valor"].tolist(), [-100.0, 100.0, -20.0, 20.0, -20.0, -7.0])
+        self.assertTrue(merged["Data"].is_monotonic_increasing)
+
 
 if __name__ == "__main__":
     unittest.main()
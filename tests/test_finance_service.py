@@ -1,8 +1,11 @@
+import threading
 from datetime import date
 import unittest
 
 import pandas as pd
 
+from core.models import ClassificationCacheStats
+
 from services.finance_service import FinanceService
 
 
@@ -10,6 +13,7 @@ class FakeFinanceRepository:
     def __init__(self):
         self.rules = {"uber": "Transporte"}
         self.last_synced_payload: list[dict] | None = None
+        self.last_filters = None
 
     def load_dataframe(self) -> pd.DataFrame:
         return pd.DataFrame()
@@ -26,6 +30,10 @@ class FakeFinanceRepository:
     def get_summary_by_category(self, df: pd.DataFrame) -> pd.DataFrame:
         return pd.DataFrame()
 
+    def aggregate_summary_by_category(self, filters) -> pd.DataFrame:
+        self.last_filters = filters
+        return pd.DataFrame()
+
     def get_summary_by_fonte(self, df: pd.DataFrame) -> pd.DataFrame:
         return pd.DataFrame()
 
@@ -52,12 +60,18 @@ class FakeFinanceRepository:
     ) -> pd.DataFrame:
         return df
 
-    def delete_manual_transaction(self, df: pd.DataFrame, index: int) -> pd.DataFrame:
+    def update_transaction(self, df: pd.DataFrame, tx_id: str, fields: dict) -> pd.DataFrame:
+        return df
+
+    def delete_transactions(self, df: pd.DataFrame, tx_ids: list[str]) -> pd.DataFrame:
         return df
 
     def load_rules(self) -> dict:
         return self.rules
 
+    def get_rules_version(self) -> str:
+        return "v-" + "|".join(f"{k}={v}" for k, v in self.rules.items())
+
     def add_rule(self, keyword: str, category: str) -> dict:
         self.rules[keyword] = category
         return self.rules
@@ -66,8 +80,8 @@ class FakeFinanceRepository:
         self.rules.pop(keyword, None)
         return self.rules
 
-    def reclassify_all(self, df: pd.DataFrame) -> pd.DataFrame:
-        return df
+    def reclassify_all(self, df: pd.DataFrame) -> tuple[pd.DataFrame, int]:
+        return df, 0
 
     def classify(self, description: str, rules: dict | None = None) -> str | None:
         active_rules = rules or self.rules
@@ -81,6 +95,23 @@ class FakeFinanceRepository:
         return None
 
 
+class FakeClassificationCache:
+    def __init__(self):
+        self.version: str | None = None
+        self.classifications: dict[str, str | None] = {}
+        self.save_calls = 0
+
+    def load_classifications(self, rules_version: str) -> dict[str, str | None]:
+        if rules_version != self.version:
+            return {}
+        return dict(self.classifications)
+
+    def save_classifications(self, rules_version: str, classifications: dict[str, str | None]) -> None:
+        self.version = rules_version
+        self.classifications = dict(classifications)
+        self.save_calls += 1
+
+
 class FakeBankingAdapter:
     def __init__(self):
         self.last_date_from: str | None = None
@@ -170,6 +201,51 @@ class FinanceServiceTestCase(unittest.TestCase):
         self.assertEqual(repository.last_synced_payload[0]["Categoria"], "Transporte")
         self.assertEqual(repository.last_synced_payload[1]["Categoria"], "Outros")
 
+    def test_sync_transactions_reuses_classification_cache(self):
+        repository = FakeFinanceRepository()
+        cache = FakeClassificationCache()
+        service = FinanceService(
+            transactions=repository,
+            rules=repository,
+            banking=FakeBankingAdapter(),
+            classification_cache=cache,
+        )
+
+        service.sync_transactions(pd.DataFrame(), date(2026, 1, 1), date(2026, 1, 31))
+        self.assertEqual((service.last_classification_stats.hits, service.last_classification_stats.misses), (0, 2))
+        self.assertEqual(cache.classifications, {"Uber Trip": "Transporte", "Compra qualquer": None})
+
+        service.sync_transactions(pd.DataFrame(), date(2026, 1, 1), date(2026, 1, 31))
+        self.assertEqual((service.last_classification_stats.hits, service.last_classification_stats.misses), (2, 0))
+        self.assertEqual(cache.save_calls, 1)
+
+        repository.rules["compra"] = "Compras"
+        service.sync_transactions(pd.DataFrame(), date(2026, 1, 1), date(2026, 1, 31))
+        self.assertEqual(service.last_classification_stats.misses, 2)
+        assert repository.last_synced_payload is not None
+        self.assertEqual(repository.last_synced_payload[1]["Categoria"], "Compras")
+
+    def test_classification_stats_are_not_shared_between_sessions(self):
+        repository = FakeFinanceRepository()
+        service = FinanceService(
+            transactions=repository,
+            rules=repository,
+            banking=FakeBankingAdapter(),
+            classification_cache=FakeClassificationCache(),
+        )
+
+        # Streamlit runs each browser session's script on its own thread.
+        other_session = threading.Thread(
+            target=service.sync_transactions,
+            args=(pd.DataFrame(), date(2026, 1, 1), date(2026, 1, 31)),
+        )
+        other_session.start()
+        other_session.join()
+
+        self.assertEqual(service.last_classification_stats, ClassificationCacheStats(hits=0, misses=0))
+        service.sync_transactions(pd.DataFrame(), date(2026, 1, 1), date(2026, 1, 31))
+        self.assertEqual(service.last_classification_stats, ClassificationCacheStats(hits=2, misses=0))
+
     def test_calculate_kpis_uses_real_expenses_from_repository(self):
         repository = FakeFinanceRepository()
         service = FinanceService(
@@ -193,6 +269,39 @@ class FinanceServiceTestCase(unittest.TestCase):
         self.assertEqual(kpis.total_invested, -200.0)
         self.assertAlmostEqual(kpis.pct_salary, 2.0)
 
+    def test_apply_selection_filters_the_session_frame(self):
+        repository = FakeFinanceRepository()
+        service = FinanceService(
+            transactions=repository,
+            rules=repository,
+            banking=FakeBankingAdapter(),
+        )
+        df = pd.DataFrame(
+            [
+                {"Data": pd.Timestamp("2026-01-05"), "Categoria": "Transporte", "Fonte": "Nubank", "Valor": -10.0},
+                {"Data": pd.Timestamp("2026-02-05"), "Categoria": "Transporte", "Fonte": "Nubank", "Valor": -20.0},
+                {"Data": pd.Timestamp("2026-01-20"), "Categoria": "Outros", "Fonte": "Nubank", "Valor": -30.0},
+            ]
+        )
+        selection = service.build_filter((date(2026, 1, 1), date(2026, 1, 31)), ["Transporte"], [])
+
+        self.assertEqual(service.apply_selection(df, selection)["Valor"].tolist(), [-10.0])
+
+    def test_category_summary_aggregates_only_without_a_loaded_frame(self):
+        repository = FakeFinanceRepository()
+        service = FinanceService(
+            transactions=repository,
+            rules=repository,
+            banking=FakeBankingAdapter(),
+        )
+        selection = service.build_filter((date(2026, 1, 1), date(2026, 1, 31)), [], [])
+
+        service.get_summary_by_category(pd.DataFrame(), selection)
+        self.assertIsNone(repository.last_filters)
+
+        service.get_summary_by_category(None, selection)
+        self.assertEqual(repository.last_filters, selection)
+
     def test_build_exports_excludes_pluggy_id(self):
         repository = FakeFinanceRepository()
         service = FinanceService(
@@ -0,0 +1,78 @@
+import unittest
+from datetime import date
+from unittest import mock
+
+import pandas as pd
+
+from core.models import SidebarState
+from presentation import main_screen
+
+TAB_RENDERERS = (
+    "render_dashboard_tab",
+    "render_transactions_tab",
+    "render_add_transaction_tab",
+    "render_rules_tab",
+    "render_analysis_tab",
+    "render_investments_tab",
+    "render_balances_tab",
+    "render_bills_tab",
+)
+
+
+SIDEBAR_STATE = SidebarState(
+    date_range=(date(2026, 2, 1), date(2026, 2, 28)),
+    filter_cats=[],
+    filter_fontes=[],
+    sync_from=date(2026, 2, 1),
+    sync_to=date(2026, 2, 28),
+    sync_requested=False,
+)
+
+
+def _fake_streamlit() -> mock.MagicMock:
+    fake_st = mock.MagicMock()
+    fake_st.tabs.side_effect = lambda labels: [mock.MagicMock() for _ in labels]
+    fake_st.session_state.df = pd.DataFrame()
+    return fake_st
+
+
+class RenderTabsSmokeTestCase(unittest.TestCase):
+    def test_render_tabs_shares_the_category_summary(self):
+        category_summary = pd.DataFrame({"Categoria": ["Mercado"], "Total": [10.0], "Percentual": [1.0]})
+
+        with mock.patch.object(main_screen, "st", _fake_streamlit()), mock.patch.multiple(
+            main_screen, **{name: mock.DEFAULT for name in TAB_RENDERERS}
+        ) as renderers:
+            main_screen._render_tabs(
+                mock.MagicMock(),
+                mock.MagicMock(),
+                pd.DataFrame(),
+                category_summary,
+                SIDEBAR_STATE,
+                str,
+            )
+
+        for name in TAB_RENDERERS:
+            renderers[name].assert_called_once()
+        self.assertIs(renderers["render_dashboard_tab"].call_args.kwargs["category_summary"], category_summary)
+        self.assertIs(renderers["render_analysis_tab"].call_args.kwargs["category_summary"], category_summary)
+
+    def test_main_screen_summarizes_the_filtered_frame_once(self):
+        finance_service = mock.MagicMock()
+        filtered = pd.DataFrame({"Valor": [-10.0]})
+        finance_service.apply_selection.return_value = filtered
+
+        with mock.patch.object(main_screen, "st", _fake_streamlit()), mock.patch.multiple(
+            main_screen,
+            render_sidebar=mock.Mock(return_value=SIDEBAR_STATE),
+            render_app_header=mock.DEFAULT,
+            render_kpi_cards=mock.DEFAULT,
+            _render_tabs=mock.DEFAULT,
+        ):
+            main_screen.render_main_screen(finance_service, mock.MagicMock(), pd.DataFrame(), str)
+
+        finance_service.get_summary_by_category.assert_called_once_with(filtered)
+
+
+if __name__ == "__main__":
+    unittest.main()
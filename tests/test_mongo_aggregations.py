@@ -0,0 +1,111 @@
+import os
+import unittest
+import uuid
+from datetime import date
+
+import pandas as pd
+from pymongo import MongoClient
+from pymongo.errors import PyMongoError
+
+from core.models import TransactionFilter
+from domain.analytics import (
+    filter_real_expenses,
+    filter_transactions,
+    summarize_expenses_by_category,
+)
+from repositories.mongo_transactions_repository import MongoTransactionsRepository
+
+MONGO_TEST_URI = os.getenv("MONGO_TEST_URI", "mongodb://localhost:27017")
+REAL_CATEGORIES = {"Mercado", "Transporte", "Lazer"}
+
+
+class FakeConfigRepository:
+    def get_real_expense_categories(self) -> set[str]:
+        return REAL_CATEGORIES
+
+
+class MongoAggregationParityTestCase(unittest.TestCase):
+    """Runs the aggregation pipelines against a local mongod (skipped when none is reachable)."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = MongoClient(MONGO_TEST_URI, serverSelectionTimeoutMS=500)
+        try:
+            cls.client.admin.command("ping")
+        except PyMongoError:
+            cls.client.close()
+            raise unittest.SkipTest(f"no mongod reachable at {MONGO_TEST_URI}")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.close()
+
+    def setUp(self):
+        self.db_name = f"finances_observer_test_{uuid.uuid4().hex[:8]}"
+        self.repository = MongoTransactionsRepository(self.client[self.db_name], FakeConfigRepository())
+        rows = []
+        categories = ["Mercado", "Transporte", "Lazer", "Salário", "Investimentos"]
+        sources = ["Nubank", "Itaú", "Inter"]
+        for i in range(60):
+            value = round(((i * 37) % 500 - 300) + (i % 7) / 10, 2)
+            rows.append(
+                {
+                    "Data": pd.Timestamp("2026-01-01") + pd.Timedelta(hours=13 * i),
+                    "Descrição": f"Lançamento {i}",
+                    "Valor": 0.0 if i % 17 == 0 else value,
+                    "Tipo": "Entrada" if value > 0 else "Saída",
+                    "Categoria": categories[i % len(categories)],
+                    "Fonte": sources[i % len(sources)],
+                    "categoria_manual": False,
+                }
+            )
+        self.repository.save_data(pd.DataFrame(rows))
+        # A document written before amounts were stored in cents and dates as BSON dates;
+        # reopening the repository migrates its date.
+        self.client[self.db_name]["transactions"].insert_one(
+            {
+                "tx_id": "legacy",
+                "Data": "2026-01-10 08:00:00",
+                "Descrição": "Legado",
+                "Valor": -12.34,
+                "Tipo": "Saída",
+                "Categoria": "Mercado",
+                "Fonte": "Nubank",
+            }
+        )
+        # A document without any amount must not show up as an expense.
+        self.client[self.db_name]["transactions"].insert_one(
+            {
+                "tx_id": "no-amount",
+                "Data": "2026-01-11 09:00:00",
+                "Descrição": "Sem valor",
+                "Tipo": "Saída",
+                "Categoria": "Mercado",
+                "Fonte": "Carteira",
+            }
+        )
+        self.repository = MongoTransactionsRepository(self.client[self.db_name], FakeConfigRepository())
+        self.df = self.repository.load_data()
+
+    def tearDown(self):
+        self.client.drop_database(self.db_name)
+
+    def _selections(self) -> list[TransactionFilter]:
+        return [
+            TransactionFilter(),
+            TransactionFilter(date_from=date(2026, 1, 5), date_to=date(2026, 1, 20)),
+            TransactionFilter(categories=("Mercado", "Lazer"), sources=("Nubank",)),
+            TransactionFilter(date_from=date(2030, 1, 1), date_to=date(2030, 1, 31)),
+        ]
+
+    def test_summary_by_category_matches_domain(self):
+        for filters in self._selections():
+            with self.subTest(filters=filters):
+                expenses = filter_real_expenses(filter_transactions(self.df, filters), REAL_CATEGORIES)
+                expected = summarize_expenses_by_category(expenses).reset_index(drop=True)
+                actual = self.repository.aggregate_summary_by_category(filters)
+                pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+
+if __name__ == "__main__":
+    unittest.main()
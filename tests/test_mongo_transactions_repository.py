@@ -0,0 +1,177 @@
+from datetime import date, datetime
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+from pymongo import ReplaceOne, UpdateOne
+from pymongo.errors import BulkWriteError
+
+from core.models import TransactionFilter
+from repositories.mongo_transactions_repository import MongoTransactionsRepository
+
+
+class FakeCursor(list):
+    def sort(self, key: str, direction: int = 1) -> "FakeCursor":
+        return FakeCursor(sorted(self, key=lambda doc: doc[key], reverse=direction < 0))
+
+
+class FakeCollection:
+    def __init__(self, docs: list[dict]):
+        self.docs = docs
+        self.bulk_calls: list[tuple[list, bool]] = []
+        self.queries: list[dict] = []
+        self.deletes: list[list[str]] = []
+        self.write_errors: list[dict] = []
+        self.indexes: dict[str, dict] = {"_id_": {}, "Data_1": {}, "pluggy_id_1": {"sparse": True}}
+
+    def index_information(self) -> dict[str, dict]:
+        return dict(self.indexes)
+
+    def drop_index(self, name: str) -> None:
+        del self.indexes[name]
+
+    def create_index(self, keys, **kwargs) -> None:
+        if isinstance(keys, str):
+            keys = [(keys, 1)]
+        name = kwargs.get("name") or "_".join(f"{field}_{direction}" for field, direction in keys)
+        self.indexes[name] = kwargs
+
+    def find(self, query: dict | None = None, *args, **kwargs) -> FakeCursor:
+        query = query or {}
+        self.queries.append(query)
+        docs = self.docs
+        bounds = query.get("Data", {})
+        if "$type" in bounds:
+            docs = [doc for doc in docs if isinstance(doc["Data"], str)]
+        if "$gte" in bounds:
+            docs = [doc for doc in docs if bounds["$gte"] <= doc["Data"] < bounds["$lt"]]
+        return FakeCursor(dict(doc) for doc in docs)
+
+    def bulk_write(self, operations: list, ordered: bool = True) -> None:
+        self.bulk_calls.append((operations, ordered))
+        if self.write_errors:
+            raise BulkWriteError({"writeErrors": self.write_errors, "nInserted": 0})
+
+    def delete_many(self, query: dict) -> None:
+        if not query.get("tx_id", {}).get("$in"):
+            raise AssertionError("save_data must only delete explicit ids")
+        self.deletes.append(query["tx_id"]["$in"])
+
+    def insert_many(self, *args, **kwargs) -> None:
+        raise AssertionError("save_data must not re-insert the collection")
+
+
+class MongoTransactionsRepositoryTestCase(unittest.TestCase):
+    def setUp(self):
+        docs = [
+            {
+                "_id": i,
+                "tx_id": f"tx-{i}",
+                "Data": datetime(2026, 2, i),
+                "Descrição": f"Compra {i}",
+                "Valor": -10.0 * i,
+                "valor_centavos": -1000 * i,
+                "Tipo": "Saída",
+                "Categoria": "Outros",
+                "Fonte": "Nubank",
+                "categoria_manual": False,
+            }
+            for i in range(1, 4)
+        ]
+        self.collection = FakeCollection(docs)
+        self.repository = MongoTransactionsRepository({"transactions": self.collection}, config_repository=None)
+
+    def test_save_data_upserts_changed_rows_unordered_after_a_chunked_delete(self):
+        df = self.repository.load_data()
+        self.assertEqual(self.collection.bulk_calls, [])
+
+        df.loc[df["tx_id"] == "tx-2", "Categoria"] = "Mercado"
+        df = df[df["tx_id"] != "tx-3"].reset_index(drop=True)
+        new_row = pd.DataFrame([{"Data": pd.Timestamp("2026-02-05"), "Descrição": "Nova", "Valor": -5.0,
+                                 "Tipo": "Saída", "Categoria": "Outros", "Fonte": "Nubank"}])
+        df = pd.concat([df, new_row], ignore_index=True)
+        self.repository.save_data(df)
+
+        operations, ordered = self.collection.bulk_calls[0]
+        self.assertFalse(ordered)
+        self.assertEqual(self.collection.deletes, [["tx-3"]])
+        self.assertEqual([type(op) for op in operations], [ReplaceOne, ReplaceOne])
+
+        self.repository.save_data(df)
+        self.assertEqual(len(self.collection.bulk_calls), 1)
+        self.assertEqual(len(self.collection.deletes), 1)
+
+    def test_save_without_snapshot_deletes_stale_ids_in_chunks(self):
+        self.collection.docs.extend({"_id": i, "tx_id": f"old-{i}"} for i in range(10, 15))
+        df = pd.DataFrame([{"tx_id": "tx-1", "Data": pd.Timestamp("2026-02-01"), "Descrição": "Compra 1",
+                            "Valor": -10.0, "Tipo": "Saída", "Categoria": "Outros", "Fonte": "Nubank"}])
+
+        with patch("repositories.mongo_transactions_repository.DELETE_CHUNK_SIZE", 2):
+            self.repository.save_data(df)
+
+        self.assertEqual(
+            self.collection.deletes,
+            [["tx-2", "tx-3"], ["old-10", "old-11"], ["old-12", "old-13"], ["old-14"]],
+        )
+
+    def test_rejected_upserts_are_reported_and_retried(self):
+        df = self.repository.load_data()
+        df["Categoria"] = "Mercado"
+        self.collection.write_errors = [{"index": 1, "code": 11000, "errmsg": "E11000 duplicate key pluggy_id"}]
+
+        with self.assertRaisesRegex(ValueError, "1 transações não foram gravadas"):
+            self.repository.save_data(df)
+
+        self.collection.write_errors = []
+        self.repository.save_data(df)
+        operations, _ = self.collection.bulk_calls[-1]
+        self.assertEqual([op._filter["tx_id"] for op in operations], ["tx-2"])
+
+    def test_load_data_returns_rows_in_date_order(self):
+        self.collection.docs.reverse()
+
+        df = self.repository.load_data()
+
+        self.assertTrue(df["Data"].is_monotonic_increasing)
+        self.assertEqual(df["tx_id"].tolist(), ["tx-1", "tx-2", "tx-3"])
+
+    def test_selection_becomes_an_indexed_match(self):
+        filters = TransactionFilter(
+            date_from=date(2026, 2, 2),
+            date_to=date(2026, 2, 3),
+            categories=("Outros",),
+            sources=("Nubank", "Itaú"),
+        )
+
+        self.assertEqual(
+            MongoTransactionsRepository._filter_query(filters),
+            {
+                "Data": {"$gte": datetime(2026, 2, 2), "$lt": datetime(2026, 2, 4)},
+                "Categoria": {"$in": ["Outros"]},
+                "Fonte": {"$in": ["Nubank", "Itaú"]},
+            },
+        )
+
+    def test_indexes_replace_legacy_single_field_ones(self):
+        indexes = self.collection.indexes
+        self.assertNotIn("Data_1", indexes)
+        self.assertNotIn("pluggy_id_1", indexes)
+        self.assertIn("Data_1_Categoria_1", indexes)
+        self.assertIn("Data_1_Fonte_1", indexes)
+        self.assertTrue(indexes["pluggy_id_unique"]["unique"])
+
+    def test_string_dates_are_migrated_to_native_dates(self):
+        collection = FakeCollection([{"_id": 1, "Data": "2026-02-01 10:30:00"}, {"_id": 2, "Data": datetime(2026, 2, 2)}])
+        MongoTransactionsRepository({"transactions": collection}, config_repository=None)
+
+        operations, _ = collection.bulk_calls[0]
+        self.assertEqual(operations, [UpdateOne({"_id": 1}, {"$set": {"Data": datetime(2026, 2, 1, 10, 30)}})])
+
+    def test_documents_store_native_dates(self):
+        df = self.repository.load_data()
+        docs = self.repository._dataframe_to_docs(df)
+        self.assertIsInstance(docs[0]["Data"], datetime)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,585 @@
+import asyncio
+import importlib.util
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+from dataclasses import replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from adapters.accounts_file_adapter import AccountsFileAdapter
+from adapters.async_pluggy_banking_adapter import AsyncPluggyBankingAdapter
+from adapters.pluggy_banking_adapter import PluggyBankingAdapter
+from core.settings import PluggySettings
+from pluggy_integration import (
+    ApiKeyCache,
+    PluggyHttpClient,
+    fetch_account_balances,
+    fetch_accounts,
+    fetch_credit_card_info,
+    fetch_investments,
+    fetch_transactions,
+    sync_all,
+)
+
+
+class FakePluggyServer:
+    """Minimal in-process Pluggy API: two items, one checking and one credit account each."""
+
+    def __init__(
+        self,
+        transactions_per_account: int = 3,
+        page_size: int = 500,
+        delay: float = 0.0,
+        report_totals: bool = True,
+        repeat_last_page: bool = False,
+    ):
+        self.transactions_per_account = transactions_per_account
+        self.page_size = page_size
+        self.report_totals = report_totals
+        self.repeat_last_page = repeat_last_page
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests: list[tuple[str, str, dict]] = []
+        self.connections: set[int] = set()
+        self.fail_next: dict[str, list[int]] = {}
+        self.issued_keys = 0
+        self.rejected_keys: set[str] = set()
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Buffered writes: one packet per response avoids delayed-ACK stalls on keep-alive.
+            wbufsize = -1
+
+            def log_message(self, *args) -> None:
+                return None
+
+            def _handle(self, method: str) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                url = urlparse(self.path)
+                query = {key: values[0] for key, values in parse_qs(url.query).items()}
+                with server._lock:
+                    server.requests.append((method, url.path, query))
+                    server.connections.add(self.client_address[1])
+                    failures = server.fail_next.get(url.path)
+                    status = failures.pop(0) if failures else None
+                    if url.path != "/auth" and self.headers.get("X-API-KEY") in server.rejected_keys:
+                        status = 401
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                time.sleep(server.delay)
+                if status is None:
+                    status, body = server.route(method, url.path, query)
+                else:
+                    body = {"message": "try again"}
+                with server._lock:
+                    server.in_flight -= 1
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self) -> None:
+                self._handle("GET")
+
+            def do_POST(self) -> None:
+                self._handle("POST")
+
+            def do_PATCH(self) -> None:
+                self._handle("PATCH")
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._httpd.serve_forever, args=(0.05,), daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "FakePluggyServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def count(self, method: str, path: str) -> int:
+        return sum(1 for m, p, _ in self.requests if m == method and p == path)
+
+    def route(self, method: str, path: str, query: dict) -> tuple[int, dict]:
+        if method == "POST" and path == "/auth":
+            with self._lock:
+                self.issued_keys += 1
+                return 200, {"apiKey": f"key-{self.issued_keys}"}
+        if method == "PATCH" and path.startswith("/items/"):
+            return 400, {"codeDescription": "SANDBOX_CLIENT_ITEM_UPDATE_NOT_ALLOWED"}
+        if path == "/accounts":
+            item = query["itemId"]
+            return 200, {
+                "results": [
+                    {"id": f"{item}-checking", "type": "BANK", "name": "Conta", "balance": 10.0},
+                    {"id": f"{item}-credit", "type": "CREDIT", "name": "Cartão", "creditData": {}},
+                ]
+            }
+        if path == "/transactions":
+            account = query["accountId"]
+            page = int(query.get("page", 1))
+            size = min(int(query.get("pageSize", self.page_size)), self.page_size)
+            total = self.transactions_per_account
+            pages = -(-total // size)
+            if self.repeat_last_page:
+                page = min(page, pages)
+            start = (page - 1) * size
+            results = [
+                {"id": f"{account}-tx{i}", "amount": -(i + 1.0), "description": f"Compra {i}", "date": "2026-02-01"}
+                for i in range(start, min(start + size, total))
+            ]
+            if not self.report_totals:
+                return 200, {"results": results, "page": page}
+            return 200, {"results": results, "total": total, "page": page, "totalPages": pages}
+        if path == "/bills":
+            return 200, {"results": [{"id": f"{query['accountId']}-bill"}]}
+        if path == "/investments":
+            return 200, {"results": [{"id": f"{query['itemId']}-inv", "name": "CDB", "balance": 100.0}], "total": 1}
+        return 404, {"message": "not found"}
+
+
+def _settings(base_url: str, cache_dir: str = "", **overrides) -> PluggySettings:
+    settings = PluggySettings(
+        base_url=base_url,
+        client_id="client",
+        client_secret="secret",
+        item_map={"item-a": "Nubank", "item-b": "Inter"},
+        bills_cache_file=os.path.join(cache_dir, "faturas.json"),
+        balances_cache_file=os.path.join(cache_dir, "saldos.json"),
+        investments_cache_file=os.path.join(cache_dir, "investimentos.json"),
+    )
+    return replace(settings, **overrides)
+
+
+class PluggyHttpClientTest(unittest.TestCase):
+    def test_retries_transient_statuses(self):
+        with FakePluggyServer() as server:
+            server.fail_next["/accounts"] = [503, 429]
+            client = PluggyHttpClient(max_retries=3, backoff_factor=0)
+
+            accounts = fetch_accounts({}, "item-a", server.base_url, client)
+
+        self.assertEqual(len(accounts), 2)
+        self.assertEqual(server.count("GET", "/accounts"), 3)
+
+    def test_gives_up_after_max_retries(self):
+        with FakePluggyServer() as server:
+            server.fail_next["/accounts"] = [503, 503, 503]
+            client = PluggyHttpClient(max_retries=1, backoff_factor=0)
+
+            response = client.get(f"{server.base_url}/accounts", params={"itemId": "item-a"})
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(server.count("GET", "/accounts"), 2)
+
+    def test_item_update_is_retried_only_when_refused(self):
+        with FakePluggyServer() as server:
+            server.fail_next["/items/item-a"] = [503, 502]
+            client = PluggyHttpClient(max_retries=3, backoff_factor=0)
+
+            response = client.patch(f"{server.base_url}/items/item-a", json={})
+
+        self.assertEqual(response.status_code, 502)
+        self.assertEqual(server.count("PATCH", "/items/item-a"), 2)
+
+    def test_sync_all_reuses_one_connection(self):
+        with FakePluggyServer() as server:
+            client = PluggyHttpClient(backoff_factor=0)
+
+            settings = _settings(server.base_url, max_workers=1)
+
+            transactions = sync_all("2026-02-01", "2026-02-28", settings=settings, client=client)
+
+        self.assertEqual(len(transactions), 12)
+        self.assertEqual(len(server.connections), 1)
+
+
+class DictKeyStore:
+    def __init__(self):
+        self.entries: dict[str, tuple[str, float]] = {}
+
+    def load_api_key(self, client_id: str) -> tuple[str, float] | None:
+        return self.entries.get(client_id)
+
+    def save_api_key(self, client_id: str, api_key: str, expires_at: float) -> None:
+        self.entries[client_id] = (api_key, expires_at)
+
+
+class ApiKeyCacheTest(unittest.TestCase):
+    def test_reuses_api_key_across_syncs(self):
+        with FakePluggyServer() as server:
+            client = PluggyHttpClient(backoff_factor=0)
+            settings = _settings(server.base_url)
+
+            sync_all("2026-02-01", "2026-02-28", settings=settings, client=client)
+            sync_all("2026-02-01", "2026-02-28", settings=settings, client=client)
+
+        self.assertEqual(server.count("POST", "/auth"), 1)
+
+    def test_refreshes_key_once_after_401(self):
+        with FakePluggyServer() as server:
+            client = PluggyHttpClient(backoff_factor=0)
+            settings = _settings(server.base_url)
+            sync_all("2026-02-01", "2026-02-28", settings=settings, client=client)
+            server.rejected_keys.add("key-1")
+
+            transactions = sync_all("2026-02-01", "2026-02-28", settings=settings, client=client)
+
+        self.assertEqual(len(transactions), 12)
+        self.assertEqual(server.count("POST", "/auth"), 2)
+
+    def test_expired_key_is_fetched_again(self):
+        with FakePluggyServer() as server:
+            client = PluggyHttpClient(backoff_factor=0, api_keys=ApiKeyCache(ttl_seconds=0))
+            settings = _settings(server.base_url)
+
+            first = client.api_keys.get(settings, client)
+            second = client.api_keys.get(settings, client)
+
+        self.assertEqual((first, second), ("key-1", "key-2"))
+
+    def test_persisted_key_survives_a_new_cache(self):
+        store = DictKeyStore()
+        with FakePluggyServer() as server:
+            settings = _settings(server.base_url)
+            client = PluggyHttpClient(backoff_factor=0, api_keys=ApiKeyCache(store=store))
+            client.api_keys.get(settings, client)
+
+            restarted = PluggyHttpClient(backoff_factor=0, api_keys=ApiKeyCache(store=store))
+            api_key = restarted.api_keys.get(settings, restarted)
+
+        self.assertEqual(api_key, "key-1")
+        self.assertEqual(server.count("POST", "/auth"), 1)
+
+
+    def test_slow_authentication_does_not_block_other_callers(self):
+        auth_started, release_auth = threading.Event(), threading.Event()
+
+        class SlowStore(DictKeyStore):
+            def load_api_key(self, client_id):
+                if client_id == "slow":
+                    auth_started.set()
+                    release_auth.wait(5)
+                return super().load_api_key(client_id)
+
+        with FakePluggyServer() as server:
+            client = PluggyHttpClient(backoff_factor=0, api_keys=ApiKeyCache(store=SlowStore()))
+            cached_settings = _settings(server.base_url)
+            client.api_keys.get(cached_settings, client)
+            slow = threading.Thread(
+                target=client.api_keys.get, args=(_settings(server.base_url, client_id="slow"), client)
+            )
+            slow.start()
+            auth_started.wait(5)
+
+            results: list[str] = []
+            other = threading.Thread(target=lambda: results.append(client.api_keys.get(cached_settings, client)))
+            other.start()
+            other.join(2)
+            served_while_blocked = list(results)
+            release_auth.set()
+            slow.join(5)
+
+        self.assertEqual(served_while_blocked, ["key-1"])
+        self.assertEqual(server.count("POST", "/auth"), 2)
+
+
+class ConcurrentFetchTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+    def _run(self, fetch, max_workers: int) -> tuple[list, int]:
+        with FakePluggyServer(delay=0.02) as server:
+            settings = _settings(
+                server.base_url,
+                self._tmp.name,
+                item_map={f"item-{i}": f"Banco {i}" for i in range(5)},
+                max_workers=max_workers,
+            )
+            result = fetch(settings, PluggyHttpClient(backoff_factor=0))
+        return result, server.max_in_flight
+
+    def test_fan_out_matches_sequential_order(self):
+        fetches = {
+            "sync_all": lambda settings, client: sync_all("2026-02-01", "2026-02-28", settings=settings, client=client),
+            "cards": lambda settings, client: fetch_credit_card_info(settings, client),
+            "balances": lambda settings, client: fetch_account_balances(settings, client),
+            "investments": lambda settings, client: fetch_investments(settings, client),
+        }
+        for name, fetch in fetches.items():
+            with self.subTest(name):
+                sequential, sequential_in_flight = self._run(fetch, max_workers=1)
+                concurrent, concurrent_in_flight = self._run(fetch, max_workers=3)
+
+                self.assertEqual(concurrent, sequential)
+                self.assertEqual(sequential_in_flight, 1)
+                self.assertGreater(concurrent_in_flight, 1)
+                self.assertLessEqual(concurrent_in_flight, 3)
+
+
+class PaginationTest(unittest.TestCase):
+    def test_remaining_pages_are_fetched_concurrently_in_order(self):
+        with FakePluggyServer(transactions_per_account=1200, delay=0.02) as server:
+            transactions = fetch_transactions(
+                {}, "acc", "2026-02-01", "2026-02-28", server.base_url, PluggyHttpClient(), max_workers=3
+            )
+
+        self.assertEqual([tx["id"] for tx in transactions], [f"acc-tx{i}" for i in range(1200)])
+        self.assertEqual(server.count("GET", "/transactions"), 3)
+        self.assertEqual(server.max_in_flight, 2)
+
+    def test_page_count_follows_server_page_size(self):
+        with FakePluggyServer(transactions_per_account=250, page_size=100) as server:
+            transactions = fetch_transactions({}, "acc", "2026-02-01", "2026-02-28", server.base_url, PluggyHttpClient())
+
+        self.assertEqual([tx["id"] for tx in transactions], [f"acc-tx{i}" for i in range(250)])
+        self.assertEqual(server.count("GET", "/transactions"), 3)
+
+    def test_pages_without_total_stop_at_a_short_page(self):
+        with FakePluggyServer(transactions_per_account=1200, report_totals=False) as server:
+            transactions = fetch_transactions({}, "acc", "2026-02-01", "2026-02-28", server.base_url, PluggyHttpClient())
+
+        self.assertEqual(len(transactions), 1200)
+        self.assertEqual(server.count("GET", "/transactions"), 3)
+
+    def test_pages_without_total_stop_when_a_page_repeats(self):
+        with FakePluggyServer(
+            transactions_per_account=200, page_size=100, report_totals=False, repeat_last_page=True
+        ) as server:
+            transactions = fetch_transactions({}, "acc", "2026-02-01", "2026-02-28", server.base_url, PluggyHttpClient())
+
+        self.assertEqual([tx["id"] for tx in transactions], [f"acc-tx{i}" for i in range(200)])
+        self.assertEqual(server.count("GET", "/transactions"), 3)
+
+    def test_pages_without_total_stop_at_max_pages(self):
+        with FakePluggyServer(transactions_per_account=10_000, page_size=10, report_totals=False) as server:
+            with patch("pluggy_integration.MAX_PAGES", 4):
+                transactions = fetch_transactions(
+                    {}, "acc", "2026-02-01", "2026-02-28", server.base_url, PluggyHttpClient()
+                )
+
+        self.assertEqual(len(transactions), 40)
+        self.assertEqual(server.count("GET", "/transactions"), 4)
+
+    def test_sync_all_pages_share_the_worker_bound(self):
+        results = {}
+        for max_workers in (1, 2):
+            with FakePluggyServer(transactions_per_account=501, delay=0.01) as server:
+                settings = _settings(server.base_url, max_workers=max_workers)
+                results[max_workers] = sync_all("2026-02-01", "2026-02-28", settings=settings, client=PluggyHttpClient())
+            self.assertLessEqual(server.max_in_flight, max_workers)
+
+        self.assertEqual(len(results[2]), 4 * 501)
+        self.assertEqual(results[2], results[1])
+
+
+class BankingAdapterAccountsTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.accounts = AccountsFileAdapter(os.path.join(self._tmp.name, "contas.json"))
+
+    def test_accounts_changed_after_startup_are_synced(self):
+        with FakePluggyServer() as server:
+            adapter = PluggyBankingAdapter(
+                _settings(server.base_url, self._tmp.name),
+                client=PluggyHttpClient(backoff_factor=0),
+                accounts=self.accounts,
+            )
+            self.accounts.add_account("item-c", "Itaú")
+            added = adapter.sync_all("2026-02-01", "2026-02-28", lambda _description: None)
+            fontes = adapter.get_fontes()
+            self.accounts.add_account("item-d", "C6")
+            self.accounts.remove_account("item-c")
+            replaced = adapter.sync_all("2026-02-01", "2026-02-28", lambda _description: None)
+
+        self.assertEqual({tx["Fonte"] for tx in added}, {"Itaú", "Cartão Crédito Itaú"})
+        self.assertIn("Itaú", fontes)
+        self.assertNotIn("Nubank", fontes)
+        self.assertEqual({tx["Fonte"] for tx in replaced}, {"C6", "Cartão Crédito C6"})
+
+    def test_empty_store_falls_back_to_configured_items(self):
+        with FakePluggyServer() as server:
+            adapter = PluggyBankingAdapter(
+                _settings(server.base_url, self._tmp.name),
+                client=PluggyHttpClient(backoff_factor=0),
+                accounts=self.accounts,
+            )
+            fontes = adapter.get_fontes()
+
+        self.assertEqual(fontes[:2], ["Nubank", "Inter"])
+
+
+def _on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+@unittest.skipUnless(importlib.util.find_spec("httpx"), "httpx not installed")
+class AsyncPluggyTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+    def _settings(self, server: FakePluggyServer, **overrides) -> PluggySettings:
+        return _settings(
+            server.base_url,
+            self._tmp.name,
+            item_map={f"item-{i}": f"Banco {i}" for i in range(5)},
+            **overrides,
+        )
+
+    def test_async_fetches_match_sync(self):
+        from pluggy_async import (
+            fetch_account_balances_async,
+            fetch_credit_card_info_async,
+            fetch_investments_async,
+            sync_all_async,
+        )
+
+        fetches = {
+            "sync_all": (
+                lambda settings, client: sync_all("2026-02-01", "2026-02-28", settings=settings, client=client),
+                lambda settings: sync_all_async(settings, "2026-02-01", "2026-02-28", lambda _description: "Outros"),
+            ),
+            "cards": (fetch_credit_card_info, fetch_credit_card_info_async),
+            "balances": (fetch_account_balances, fetch_account_balances_async),
+            "investments": (fetch_investments, fetch_investments_async),
+        }
+        for name, (fetch, fetch_async) in fetches.items():
+            with self.subTest(name):
+                with FakePluggyServer(delay=0.02) as server:
+                    settings = self._settings(server, max_workers=3)
+                    expected = fetch(settings, PluggyHttpClient(backoff_factor=0))
+                    server.max_in_flight = 0
+
+                    actual = asyncio.run(fetch_async(settings))
+
+                self.assertEqual(actual, expected)
+                self.assertGreater(server.max_in_flight, 1)
+                self.assertLessEqual(server.max_in_flight, 3)
+
+    def test_paginated_transactions_are_reassembled_in_order(self):
+        from pluggy_async import sync_all_async
+
+        with FakePluggyServer(transactions_per_account=1001) as server:
+            settings = _settings(server.base_url, self._tmp.name)
+            expected = sync_all("2026-02-01", "2026-02-28", settings=settings, client=PluggyHttpClient())
+
+            actual = asyncio.run(sync_all_async(settings, "2026-02-01", "2026-02-28", lambda _description: "Outros"))
+
+        self.assertEqual(len(actual), 2 * 2 * 1001)
+        self.assertEqual(server.count("GET", "/transactions"), 2 * 2 * 3 * 2)
+        self.assertEqual(actual, expected)
+
+    def test_paginate_without_total_stops_when_a_page_repeats(self):
+        from pluggy_async import AsyncPluggyClient, _paginate
+
+        async def paginate(settings):
+            async with AsyncPluggyClient(settings) as client:
+                return await _paginate(client, "/transactions", {"accountId": "acc"})
+
+        with FakePluggyServer(
+            transactions_per_account=200, page_size=100, report_totals=False, repeat_last_page=True
+        ) as server:
+            transactions = asyncio.run(paginate(self._settings(server)))
+
+        self.assertEqual(len(transactions), 200)
+        self.assertEqual(server.count("GET", "/transactions"), 3)
+
+    def test_item_update_is_retried_only_when_refused(self):
+        from pluggy_async import AsyncPluggyClient
+
+        async def trigger(settings):
+            async with AsyncPluggyClient(settings, backoff_factor=0) as client:
+                return await client.request("PATCH", "/items/item-a", json={})
+
+        with FakePluggyServer() as server:
+            server.fail_next["/items/item-a"] = [503, 502]
+            response = asyncio.run(trigger(self._settings(server, http_max_retries=3)))
+
+        self.assertEqual(response.status_code, 502)
+        self.assertEqual(server.count("PATCH", "/items/item-a"), 2)
+
+    def test_refreshes_shared_key_once_after_401(self):
+        from pluggy_async import fetch_account_balances_async
+
+        api_keys = ApiKeyCache()
+        with FakePluggyServer() as server:
+            settings = self._settings(server)
+            asyncio.run(fetch_account_balances_async(settings, api_keys))
+            server.rejected_keys.add("key-1")
+
+            balances = asyncio.run(fetch_account_balances_async(settings, api_keys))
+
+        self.assertEqual(len(balances), 5)
+        self.assertEqual(server.count("POST", "/auth"), 2)
+
+    def test_blocking_stores_run_off_the_event_loop(self):
+        calls: list[tuple[str, bool]] = []
+
+        class RecordingStore(DictKeyStore):
+            def load_api_key(self, client_id):
+                calls.append(("load_api_key", _on_event_loop()))
+                return super().load_api_key(client_id)
+
+            def save_api_key(self, client_id, api_key, expires_at):
+                calls.append(("save_api_key", _on_event_loop()))
+                super().save_api_key(client_id, api_key, expires_at)
+
+        class RecordingCache:
+            def save_investments(self, investments):
+                calls.append(("save_investments", _on_event_loop()))
+
+        with FakePluggyServer() as server:
+            client = PluggyHttpClient(backoff_factor=0, api_keys=ApiKeyCache(store=RecordingStore()))
+            adapter = AsyncPluggyBankingAdapter(self._settings(server), RecordingCache(), client=client)
+
+            adapter.fetch_investments()
+
+        self.assertEqual(
+            {name for name, _ in calls},
+            {"load_api_key", "save_api_key", "save_investments"},
+        )
+        self.assertFalse(any(on_loop for _, on_loop in calls))
+
+    def test_adapter_sync_facade_runs_inside_an_event_loop(self):
+        with FakePluggyServer() as server:
+            settings = self._settings(server)
+            adapter = AsyncPluggyBankingAdapter(settings, client=PluggyHttpClient(backoff_factor=0))
+
+            async def from_running_loop():
+                return adapter.fetch_investments()
+
+            from_loop = asyncio.run(from_running_loop())
+            plain = adapter.fetch_investments()
+
+        self.assertEqual(from_loop, plain)
+        self.assertEqual(len(plain), 5)
+        self.assertEqual(server.count("POST", "/auth"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
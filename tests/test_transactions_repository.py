@@ -0,0 +1,261 @@
+import importlib.util
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+from repositories.config_repository import ConfigRepository
+from repositories.transaction_journal import TransactionJournal
+from repositories.transactions_repository import TransactionsRepository
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+class TransactionsRepositoryTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        rules_file = os.path.join(self.tmpdir.name, "regras.json")
+        with open(rules_file, "w", encoding="utf-8") as f:
+            json.dump({"categorias": {}, "regras": {"uber": "Transporte"}}, f)
+        self.config = ConfigRepository(rules_file)
+        self.data_file = os.path.join(self.tmpdir.name, "dados.csv")
+        self.repository = TransactionsRepository(self.data_file, self.config)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _seed(self):
+        df = self.repository.load_data()
+        df = self.repository.add_transaction(df, "2026-02-01", "Uber Trip", 25.0, "Saída", "Outros", "Nubank")
+        df = self.repository.add_transaction(df, "2026-02-02", "Ifood", 40.0, "Saída", "Outros", "Nubank")
+        return df
+
+    def test_reclassify_all_skips_write_when_rules_did_not_change(self):
+        df = self._seed()
+        self.config.set_rule("ifood", "Delivery")
+
+        df, changed = self.repository.reclassify_all(df)
+        self.assertEqual(changed, 1)
+
+        reloaded = self.repository.load_data()
+        with patch.object(self.repository, "update_categories") as update_categories, patch.object(
+            self.repository, "save_data"
+        ) as save_data:
+            reloaded, changed = self.repository.reclassify_all(reloaded)
+
+        self.assertEqual(changed, 0)
+        update_categories.assert_not_called()
+        save_data.assert_not_called()
+        self.assertEqual(reloaded["Categoria"].tolist(), ["Transporte", "Delivery"])
+
+    def test_amounts_round_trip_through_integer_cents(self):
+        df = self.repository.load_data()
+        df = self.repository.add_transaction(df, "2026-02-03", "Padaria", 0.1 + 0.2, "Saída", "Outros", "Nubank")
+
+        reloaded = self.repository.load_data()
+
+        self.assertEqual(reloaded["valor_centavos"].tolist(), [-30])
+        self.assertEqual(reloaded["Valor"].tolist(), [-0.3])
+
+    def test_valor_edited_in_frame_survives_save_and_reload(self):
+        df = self._seed()
+        df.loc[df["Descrição"] == "Ifood", "Valor"] = -42.35
+
+        self.repository.save_data(df)
+        reloaded = TransactionsRepository(self.data_file, self.config).load_data()
+
+        self.assertEqual(reloaded["Valor"].tolist(), [-25.0, -42.35])
+        self.assertEqual(reloaded["valor_centavos"].tolist(), [-2500, -4235])
+
+    def test_summary_by_fonte_ignores_missing_amounts(self):
+        df = self._seed()
+        df.loc[len(df)] = {"Data": pd.Timestamp("2026-02-03"), "Descrição": "Sem valor", "Fonte": "Inter"}
+        self.repository.compact(df)
+
+        summary = self.repository.get_summary_by_fonte(self.repository.load_data())
+
+        self.assertEqual(summary["Fonte"].tolist(), ["Nubank"])
+        self.assertEqual(summary["Saídas"].tolist(), [65.0])
+
+    def test_sync_links_manual_entry_by_cents(self):
+        df = self.repository.load_data()
+        df = self.repository.add_transaction(df, "2026-02-03", "Mercado", 19.9, "Saída", "Outros", "Nubank")
+
+        df, added = self.repository.add_synced_transactions(
+            df,
+            [{"pluggy_id": "p1", "Data": "2026-02-04", "Descrição": "MERCADO", "Valor": -19.899999999,
+              "Tipo": "Saída", "Categoria": "Outros", "Fonte": "Nubank"}],
+        )
+
+        self.assertEqual(added, 0)
+        self.assertEqual(df["pluggy_id"].tolist(), ["p1"])
+
+    def test_edits_are_journaled_without_rewriting_the_base_file(self):
+        df = self._seed()
+        self.repository.compact(df)
+        with open(self.data_file, encoding="utf-8") as f:
+            base_before = f.read()
+
+        df.loc[df["Descrição"] == "Ifood", "Categoria"] = "Delivery"
+        self.repository.save_data(df)
+        df = self.repository.delete_transaction(df, 0)
+
+        with open(self.data_file, encoding="utf-8") as f:
+            self.assertEqual(f.read(), base_before)
+        with open(f"{self.data_file}.journal", encoding="utf-8") as f:
+            ops = [json.loads(line)["op"] for line in f]
+        self.assertEqual(ops, ["update", "delete"])
+
+        reloaded = TransactionsRepository(self.data_file, self.config).load_data()
+        self.assertEqual(reloaded["Descrição"].tolist(), ["Ifood"])
+        self.assertEqual(reloaded["Categoria"].tolist(), ["Delivery"])
+        self.assertEqual(reloaded["tx_id"].tolist(), df["tx_id"].tolist())
+
+    def test_update_and_delete_are_addressed_by_tx_id(self):
+        df = self._seed()
+        uber_id, ifood_id = df["tx_id"].tolist()
+        self.repository.compact(df)
+
+        df = df.sort_values("Descrição").reset_index(drop=True)
+        df = self.repository.update_transaction(df, uber_id, {"Descrição": "Uber Eats", "Valor": -31.9})
+        df = self.repository.delete_transactions(df, [ifood_id])
+
+        with open(f"{self.data_file}.journal", encoding="utf-8") as f:
+            entries = [json.loads(line) for line in f]
+        self.assertEqual([(e["op"], e["tx_id"]) for e in entries], [("update", uber_id), ("delete", ifood_id)])
+
+        reloaded = TransactionsRepository(self.data_file, self.config).load_data()
+        self.assertEqual(reloaded["tx_id"].tolist(), [uber_id])
+        self.assertEqual(reloaded["descricao_norm"].tolist(), ["uber eats"])
+        self.assertEqual(reloaded["valor_centavos"].tolist(), [-3190])
+
+    def test_description_edited_in_frame_is_renormalized_on_save(self):
+        df = self._seed()
+        df.loc[df["Descrição"] == "Ifood", "Descrição"] = "Padaria Pão Quente"
+
+        self.repository.save_data(df)
+        reloaded = TransactionsRepository(self.data_file, self.config).load_data()
+
+        self.assertEqual(reloaded["descricao_norm"].tolist(), ["uber trip", "padaria pao quente"])
+
+    def test_edited_rows_are_reclassified_by_reclassify_all(self):
+        df = self._seed()
+        df, _ = self.repository.reclassify_all(df)
+        ifood_id = df.loc[df["Descrição"] == "Ifood", "tx_id"].iloc[0]
+        df = self.repository.update_transaction(df, ifood_id, {"Categoria": "Alimentação"})
+        df, _ = self.repository.reclassify_all(df)
+
+        df = self.repository.update_transaction(df, ifood_id, {"Descrição": "Uber trip"})
+        df, changed = self.repository.reclassify_all(df)
+
+        self.assertEqual(changed, 1)
+        reloaded = TransactionsRepository(self.data_file, self.config).load_data()
+        self.assertEqual(reloaded["Categoria"].tolist(), ["Transporte", "Transporte"])
+
+    def test_frame_edits_saved_in_bulk_are_reclassified(self):
+        df = self._seed()
+        df, _ = self.repository.reclassify_all(df)
+        df.loc[df["Descrição"] == "Ifood", "Descrição"] = "Uber trip"
+        self.repository.save_data(df)
+
+        reloaded = TransactionsRepository(self.data_file, self.config).load_data()
+        reloaded, changed = self.repository.reclassify_all(reloaded)
+
+        self.assertEqual(changed, 1)
+        self.assertEqual(reloaded["Categoria"].tolist(), ["Transporte", "Transporte"])
+
+    def test_unlocked_row_is_reclassified(self):
+        df = self._seed()
+        df, _ = self.repository.reclassify_all(df)
+        uber_id = df.loc[df["Descrição"] == "Uber Trip", "tx_id"].iloc[0]
+        df.loc[df["tx_id"] == uber_id, ["Categoria", "categoria_manual"]] = ["Lazer", True]
+        self.repository.save_data(df)
+        df, _ = self.repository.reclassify_all(df)
+
+        df.loc[df["tx_id"] == uber_id, "categoria_manual"] = False
+        self.repository.save_data(df)
+        df, changed = self.repository.reclassify_all(df)
+
+        self.assertEqual(changed, 1)
+        self.assertEqual(df.loc[df["tx_id"] == uber_id, "Categoria"].tolist(), ["Transporte"])
+
+    def test_journal_is_compacted_after_threshold(self):
+        repository = TransactionsRepository(self.data_file, self.config, journal_compact_after=3)
+        df = repository.load_data()
+        for day in range(1, 4):
+            df = repository.add_transaction(df, f"2026-02-0{day}", f"Compra {day}", 10.0, "Saída", "Outros", "Nubank")
+
+        self.assertFalse(os.path.exists(f"{self.data_file}.journal"))
+        with patch.object(TransactionsRepository, "_write_file") as write_file:
+            reloaded = TransactionsRepository(self.data_file, self.config).load_data()
+        write_file.assert_not_called()
+        self.assertEqual(len(reloaded), 3)
+
+    def test_journal_counts_each_appended_entry_once(self):
+        path = f"{self.data_file}.journal"
+        TransactionJournal(path).append([{"op": "delete", "tx_id": "a"}])
+        self.assertEqual(len(TransactionJournal(path)), 1)
+
+        reopened = TransactionJournal(path)
+        reopened.append([{"op": "delete", "tx_id": "b"}])
+        self.assertEqual(len(reopened), 2)
+
+    def test_legacy_csv_gets_persistent_ids_on_first_load(self):
+        with open(self.data_file, "w", encoding="utf-8") as f:
+            f.write("Data,Descrição,Valor,Tipo,Categoria,Fonte\n2026-01-05,Padaria,-12.5,Saída,Outros,Nubank\n")
+
+        first = self.repository.load_data()
+        second = TransactionsRepository(self.data_file, self.config).load_data()
+
+        self.assertEqual(first["tx_id"].tolist(), second["tx_id"].tolist())
+        self.assertTrue(first["tx_id"].notna().all())
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow not installed")
+    def test_parquet_repository_migrates_existing_csv_once(self):
+        from repositories.parquet_transactions_repository import ParquetTransactionsRepository
+
+        self._seed()
+        parquet = ParquetTransactionsRepository(
+            os.path.join(self.tmpdir.name, "dados.parquet"),
+            self.config,
+            legacy_csv_file=os.path.join(self.tmpdir.name, "dados.csv"),
+        )
+
+        df = parquet.load_data()
+        self.assertEqual(df["Descrição"].tolist(), ["Uber Trip", "Ifood"])
+        self.assertEqual(df["valor_centavos"].tolist(), [-2500, -4000])
+
+        df = parquet.add_transaction(df, "2026-02-03", "Livraria", 80.0, "Saída", "Educação", "Santander")
+        with patch.object(TransactionsRepository, "_read_file", side_effect=AssertionError("CSV re-read")):
+            reloaded = parquet.load_data()
+
+        self.assertEqual(reloaded["Categoria"].tolist(), ["Transporte", "Outros", "Educação"])
+        self.assertEqual(str(reloaded["Data"].dtype), "datetime64[us]")
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow not installed")
+    def test_parquet_migration_leaves_legacy_csv_untouched(self):
+        from repositories.parquet_transactions_repository import ParquetTransactionsRepository
+
+        with open(self.data_file, "w", encoding="utf-8") as f:
+            f.write("Data,Descrição,Valor,Tipo,Categoria,Fonte\n2026-01-05,Padaria,-12.5,Saída,Outros,Nubank\n")
+        with open(self.data_file, "rb") as f:
+            backup = f.read()
+        parquet = ParquetTransactionsRepository(
+            os.path.join(self.tmpdir.name, "dados.parquet"),
+            self.config,
+            legacy_csv_file=self.data_file,
+        )
+
+        df = parquet.load_data()
+
+        self.assertEqual(df["Descrição"].tolist(), ["Padaria"])
+        self.assertTrue(df["tx_id"].notna().all())
+        with open(self.data_file, "rb") as f:
+            self.assertEqual(f.read(), backup)
+
+
+if __name__ == "__main__":
+    unittest.main()
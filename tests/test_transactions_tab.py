@@ -76,6 +76,24 @@ class TransactionsTabHelpersTestCase(unittest.TestCase):
         self.assertEqual(filtered.index.tolist(), [12])
         self.assertEqual(filtered.iloc[0]["Descrição"], "Compra aleatória")
 
+    def test_apply_local_filters_searches_normalized_descriptions(self):
+        with_norm = _normalize_tipo_column(self.base_df)
+        with_norm["descricao_norm"] = ["mercado do mes", None, "compra aleatoria", "pix ajuste"]
+
+        filtered = _apply_local_filters(
+            with_norm,
+            query="ALEATÓRIA",
+            types=["Entrada", "Saída"],
+            categories=["Supermercado", "Salário", "Outros", "Sem categoria"],
+            sources=["Nubank", "Santander", "Inter"],
+            min_abs_value=0.0,
+            max_abs_value=6000.0,
+            uncategorized_only=False,
+            sort_option="Data (mais antiga)",
+        )
+
+        self.assertEqual(filtered.index.tolist(), [12])
+
     def test_apply_local_filters_uncategorized_only_matches_outros_and_none(self):
         normalized = _normalize_tipo_column(self.base_df)
 